@@ -3,8 +3,11 @@
 
 import os
 import sys
+import time
 from pathlib import Path
 
+_T0 = time.perf_counter()
+
 def _ensure_pipeline_root():
     root = os.getenv("PIPELINE_ROOT")
     if not root:
@@ -16,3 +19,21 @@ def _ensure_pipeline_root():
         sys.path.insert(0, root)
 
 _ensure_pipeline_root()
+
+# $SKYFALL_PROFILE_STARTUP=1 → bootstrap 시간 측정 (core/utils/startup_profile.py)
+# 꺼져 있으면 아무것도 import 하지 않음
+if os.getenv("SKYFALL_PROFILE_STARTUP", "0").lower() not in ("", "0", "false", "no"):
+    _t1 = time.perf_counter()
+    from core.utils import startup_profile
+
+    startup_profile.begin(_T0)
+    startup_profile.add_section("path_setup", (_t1 - _T0) * 1000)
+
+    # nuke -t (farm) 는 menu.py 를 실행하지 않음 → 여기서 기록 + import hook 해제
+    try:
+        import nuke
+        _gui = bool(getattr(nuke, "GUI", True))
+    except ImportError:
+        _gui = False
+    if not _gui:
+        startup_profile.finish(gui=False)
@@ -1,80 +1,115 @@
 import nuke
+import importlib.util
 import os
-import sys
-
-
-# 안전 import ─ 실패해도 메뉴는 표시되게
-def _safe_imports():
+import time
+
+# ------------------------------------------------------------
+# SKYFALL 메뉴 (lazy)
+# - 이 파일은 pipeline 모듈을 하나도 import 하지 않음
+#   (예전 _safe_imports() 는 render node 의 nuke -t 시작에서도 plate_loader /
+#    kitsu 경로까지 전부 import 했음)
+# - 각 명령은 실행할 때 처음 import
+# - 메뉴 표시 여부는 find_spec 으로 모듈 파일 존재만 확인 (실행 X)
+# - GUI 없는 Nuke (nuke -t / farm) 에서는 메뉴를 만들지 않음
+# - $SKYFALL_NO_MENU=1 이면 GUI 에서도 생략
+# - $SKYFALL_PROFILE_STARTUP=1 이면 core/utils/startup_profile.py 로 시간 기록
+# ------------------------------------------------------------
+
+_T0 = time.perf_counter()
+_PROFILE = os.getenv("SKYFALL_PROFILE_STARTUP", "0").lower() not in ("", "0", "false", "no")
+if _PROFILE:
+    from core.utils import startup_profile
+
+    startup_profile.begin(_T0)   # __init__.py 에서 이미 시작했으면 무시
+
+# (메뉴 이름, apps/nuke/scripts 모듈, 실행 함수)
+COMMANDS = (
+    ("Create Comp Template", "create_comp_template", "run"),
+    ("Load Plate", "plate_loader", "run"),
+    ("Load Sequence Plates", "plate_loader", "run_sequence"),
+    ("Relink Missing Media", "relink_missing", "run"),
+    ("Save New Version", "auto_version", "save_new_version"),
+    ("Open Shot Folder", "open_folder", "open_shot_folder"),
+    ("Open in Kitsu", "open_kitsu", "open_shot_in_kitsu"),
+)
+
+_PACKAGE = "apps.nuke.scripts"
+
+# 시작 시간 기록 (ms) — startup_report() 로 확인
+STARTUP_TIMINGS = {}
+
+
+def _module_available(name):
+    """모듈을 실행하지 않고 존재만 확인 (없으면 메뉴 항목 생략)"""
     try:
-        from apps.nuke.scripts import (
-            create_comp_template,
-            plate_loader,
-            auto_version,
-            open_folder,
-            open_kitsu,
-            auto_create_global,
-        )
-        return {
-            "create_comp_template": create_comp_template,
-            "plate_loader": plate_loader,
-            "auto_version": auto_version,
-            "open_folder": open_folder,
-            "open_kitsu": open_kitsu,
-            "auto_create_global": auto_create_global,
-        }
+        return importlib.util.find_spec(f"{_PACKAGE}.{name}") is not None
     except Exception as e:
-        nuke.tprint("[SKYFALL] Import error:", e)
-        return {}
+        nuke.tprint(f"[SKYFALL] {name} lookup error:", e)
+        return False
+
 
+def _command(module, func):
+    # 메뉴를 누를 때 처음 import (이후엔 sys.modules 캐시)
+    return f"import {_PACKAGE}.{module} as s; s.{func}()"
 
-modules = _safe_imports()
+
+def _ui_enabled():
+    if os.getenv("SKYFALL_NO_MENU", "0") not in ("", "0"):
+        return False
+    return bool(getattr(nuke, "GUI", True))
 
 
 def build_menu():
-    nuke.tprint("[SKYFALL] build_menu() START")
+    t0 = time.perf_counter()
+
+    if not _ui_enabled():
+        STARTUP_TIMINGS["build_menu_ms"] = 0.0
+        nuke.tprint("[SKYFALL] no GUI — menu skipped")
+        _finish_profile(gui=False)
+        return None
 
     main_menu = nuke.menu("Nuke")
     sky_menu = main_menu.addMenu("SKYFALL")
-    nuke.tprint("[SKYFALL] SKYFALL menu created =", sky_menu)
-
-    # Create Comp Template
-    if modules.get("create_comp_template"):
-        sky_menu.addCommand(
-            "Create Comp Template",
-            "import apps.nuke.scripts.create_comp_template as s; s.run()",
-        )
-
-    # Load Plate
-    if modules.get("plate_loader"):
-        sky_menu.addCommand(
-            "Load Plate",
-            "import apps.nuke.scripts.plate_loader as s; s.run()",
-        )
-
-    # Save New Version
-    if modules.get("auto_version"):
-        sky_menu.addCommand(
-            "Save New Version",
-            "import apps.nuke.scripts.auto_version as s; s.save_new_version()",
-        )
-
-    # Open Shot Folder
-    if modules.get("open_folder"):
-        sky_menu.addCommand(
-            "Open Shot Folder",
-            "import apps.nuke.scripts.open_folder as s; s.open_shot_folder()",
-        )
-
-    # Open in Kitsu
-    if modules.get("open_kitsu"):
-        sky_menu.addCommand(
-            "Open in Kitsu",
-            "import apps.nuke.scripts.open_kitsu as s; s.open_shot_in_kitsu()",
-        )
-
-    nuke.tprint("[SKYFALL] Menu loaded via menu.py")
 
+    available = {}
+    added = 0
+    for label, module, func in COMMANDS:
+        if module not in available:
+            available[module] = _module_available(module)
+        if available[module]:
+            sky_menu.addCommand(label, _command(module, func))
+            added += 1
+
+    STARTUP_TIMINGS["build_menu_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+    STARTUP_TIMINGS["commands"] = added
+    nuke.tprint(startup_report())
+    if _PROFILE:
+        startup_profile.add_section("build_menu", STARTUP_TIMINGS["build_menu_ms"])
+    _finish_profile(gui=True)
+    return sky_menu
+
+
+def _finish_profile(gui):
+    if _PROFILE:
+        data = startup_profile.finish(gui=gui)
+        if data:
+            nuke.tprint(startup_profile.summary(data))
+
+
+def startup_report():
+    return (
+        f"[SKYFALL] menu.py import {STARTUP_TIMINGS.get('import_ms', 0):.1f} ms, "
+        f"build_menu {STARTUP_TIMINGS.get('build_menu_ms', 0):.1f} ms "
+        f"({STARTUP_TIMINGS.get('commands', 0)} commands, lazy)"
+    )
+
+
+STARTUP_TIMINGS["import_ms"] = round((time.perf_counter() - _T0) * 1000, 2)
+if _PROFILE:
+    startup_profile.add_section("menu_import", STARTUP_TIMINGS["import_ms"])
+    if not _ui_enabled():
+        # nuke -t / farm: build_menu 가 불리지 않을 수 있으므로 여기서 기록
+        _finish_profile(gui=False)
 
 # 메뉴는 init.py에서 로드
 nuke.tprint("[SKYFALL] menu.py imported (build_menu not auto-called)")
-
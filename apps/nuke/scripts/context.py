@@ -28,6 +28,23 @@ def parse_from_script_path():
     return show, ep, seq, shot, shot_root
 
 
+# ----------------------------------------------------
+# Shot Code 파싱 (setup_shot_v7 과 같은 UNDER-BAR 규칙)
+#   A_B_C → (EP, SEQ, SHOT) / A_B → (None, SEQ, SHOT) / A → (None, None, SHOT)
+# ----------------------------------------------------
+def parse_shot_code(shot_code):
+    parts = shot_code.split("_")
+
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2]
+    if len(parts) == 2:
+        return None, parts[0], parts[1]
+    if len(parts) == 1:
+        return None, None, parts[0]
+
+    raise ValueError(f"Invalid SHOT CODE: {shot_code}")
+
+
 # ----------------------------------------------------
 # Shot Root
 # ----------------------------------------------------
@@ -7,75 +7,36 @@
 
 import os
 import re
-import json
-import subprocess
-import platform
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import nuke
-from apps.nuke.scripts.context import parse_from_script_path
+from apps.nuke.scripts.context import parse_from_script_path, parse_shot_code
+from core.io.image_headers import colorspace_hint
+from core.io.media_probe import get_ffprobe_path
+from core.io.probe_cache import get_cache, probe_media
+from core.io.sequence_scan import scan_files
 
 
 # ------------------------------------------------------------
-# ffprobe 경로 자동 선택 (SKYFALL 전용)
+# MOV FPS + 총프레임 (probe 캐시 → 헤더 우선, 필요할 때만 -count_frames)
 # ------------------------------------------------------------
-def get_ffprobe_path():
+def probe_mov_frames(filepath):
     """
-    SKYFALL ffprobe 번들 자동 선택
-    plate_loader.py → apps/nuke/scripts
-    => ../../../tools/ffprobe
+    returns (fps, total_frames, method)
+    method: stts | nb_frames | duration | count_frames | default
     """
-
-    root = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "..", "..")
+    info = probe_media(filepath)
+
+    if info["error"]:
+        nuke.tprint(f"[SKYFALL][ffprobe error] {info['error']}")
+    nuke.tprint(
+        f"[SKYFALL] probe {os.path.basename(filepath)}: "
+        f"{info['frames']}f @ {info['fps']} ({info['method']}"
+        f"{', cached' if info.get('cached') else ''})"
     )
 
-    base = os.path.join(root, "tools", "ffprobe")
-    sysname = platform.system().lower()
-
-    if "darwin" in sysname:     # macOS
-        return os.path.join(base, "mac", "ffprobe")
-    elif "linux" in sysname:
-        return os.path.join(base, "linux", "ffprobe")
-    elif "windows" in sysname:
-        return os.path.join(base, "win", "ffprobe.exe")
-    else:
-        return "ffprobe"
-
-
-# ------------------------------------------------------------
-# ffprobe 기반 MOV FPS + 총프레임 계산
-# ------------------------------------------------------------
-def probe_mov_frames(filepath):
-    ffprobe = get_ffprobe_path()
-
-    cmd = [
-        ffprobe, "-v", "error",
-        "-select_streams", "v:0",
-        "-count_frames",
-        "-show_entries", "stream=nb_read_frames,r_frame_rate",
-        "-of", "json",
-        filepath
-    ]
-
-    try:
-        out = subprocess.check_output(cmd).decode("utf-8")
-        data = json.loads(out)
-
-        stream = data["streams"][0]
-
-        total_frames = int(stream["nb_read_frames"])
-        fps_str = stream["r_frame_rate"]
-
-        if "/" in fps_str:
-            num, den = fps_str.split("/")
-            fps = float(num) / float(den)
-        else:
-            fps = float(fps_str)
-
-        return fps, total_frames
-
-    except Exception as e:
-        nuke.tprint(f"[SKYFALL][ffprobe error] {e}")
-        return 24.0, 1
+    return info["fps"], info["frames"], info["method"]
 
 
 # ------------------------------------------------------------
@@ -85,49 +46,65 @@ def find_sequence(folder_path, shot_pattern):
     if not os.path.exists(folder_path):
         return None
 
-    files = os.listdir(folder_path)
+    return sequence_from_files(folder_path, os.listdir(folder_path), shot_pattern)
 
-    seq_files = [
-        f for f in files
-        if f.startswith(shot_pattern) and re.search(r"\.\d+\.", f)
-    ]
-
-    if not seq_files:
-        return None
 
-    sample = seq_files[0]
-    m = re.match(r"(.+?)\.(\d+)(\.[^.]+)$", sample)
-    if not m:
+def sequence_from_files(folder_path, files, shot_pattern):
+    """이미 읽은 디렉토리 목록에서 시퀀스 정보 생성 (listdir 재호출 없음)"""
+    # <prefix>.<frame>.<ext> 형태만, 여러 개면 프레임이 가장 많은 시퀀스
+    seqs = [
+        s for s in scan_files(folder_path, files, shot_pattern)
+        if s["prefix"].endswith(".")
+    ]
+    if not seqs:
         return None
 
-    prefix, frame, ext = m.groups()
+    best = max(seqs, key=lambda s: len(s["frames"]))
+    frames = best["frames"]
 
-    frames = []
-    for f in seq_files:
-        mm = re.match(rf"{re.escape(prefix)}\.(\d+){re.escape(ext)}", f)
-        if mm:
-            frames.append(int(mm.group(1)))
+    if frames.gaps():
+        nuke.tprint(f"[SKYFALL] {best['prefix']}####{best['ext']} gaps: {frames.gaps()}")
 
-    frames.sort()
     return {
         "folder": folder_path,
-        "prefix": prefix,
-        "ext": ext,
-        "first": frames[0],
-        "last": frames[-1],
+        "prefix": best["prefix"][:-1],
+        "ext": best["ext"],
+        "padding": best["padding"],
+        "first": frames.first,
+        "last": frames.last,
+        "frames": frames,
     }
 
 
 # ------------------------------------------------------------
 # Colorspace 자동 감지
 # ------------------------------------------------------------
-def detect_colorspace(fname):
+def detect_colorspace(fname, header=None):
+    """헤더(chromaticities / DPX transfer)가 있으면 우선, 없으면 확장자 기준"""
     lname = fname.lower()
     if lname.endswith(".exr"):
-        return "ACES - ACEScg"
-    if lname.endswith(".dpx"):
-        return "Cineon"
-    return "default"
+        fallback = "ACES - ACEScg"
+    elif lname.endswith(".dpx"):
+        fallback = "Cineon"
+    else:
+        fallback = "default"
+
+    if header and not header.get("error"):
+        return colorspace_hint(header, fallback)
+    return fallback
+
+
+def header_label(header):
+    """Read 노드 label: 해상도 / 압축 / 타임코드"""
+    if not header or header.get("error") or not header.get("width"):
+        return ""
+
+    label = f"{header['width']}x{header['height']}"
+    if header.get("codec"):
+        label += f" {header['codec']}"
+    if header.get("timecode"):
+        label += f"\nTC {header['timecode']}"
+    return label
 
 
 # ------------------------------------------------------------
@@ -146,10 +123,117 @@ def popup_select(title, options):
         return None
 
 
+# ------------------------------------------------------------
+# Plate 탐색 (worker thread 에서 실행 — nuke UI 호출 금지)
+# ------------------------------------------------------------
+def discover_plates(plate_dir, shot_pattern, is_cancelled=None, progress=None):
+    """
+    plate/ 트리를 한 번만 walk 해서 후보 수집.
+      - 시퀀스: plate/ top-level + 바로 아래 subfolder
+      - MOV: plate/ 전체 (재귀)
+    returns {"seq": [...], "mov": [...]}  /  취소되면 None
+    """
+    seq_candidates = []
+    mov_candidates = []
+
+    def scan_dir(dirpath, files, depth):
+        if depth <= 1:
+            info = sequence_from_files(dirpath, files, shot_pattern)
+            if info:
+                seq_candidates.append(info)
+        for f in files:
+            if f.startswith(shot_pattern) and f.lower().endswith(".mov"):
+                mov_candidates.append(os.path.join(dirpath, f))
+
+    entries = sorted(os.scandir(plate_dir), key=lambda e: e.name)
+    scan_dir(plate_dir, [e.name for e in entries if e.is_file()], 0)
+
+    subdirs = [e.path for e in entries if e.is_dir()]
+    for i, sub in enumerate(subdirs):
+        if is_cancelled and is_cancelled():
+            return None
+        if progress:
+            progress(i * 100 // len(subdirs), os.path.basename(sub))
+
+        for dirpath, dirs, files in os.walk(sub):
+            if is_cancelled and is_cancelled():
+                return None
+            depth = 1 if dirpath == sub else 2
+            scan_dir(dirpath, files, depth)
+
+    return {"seq": seq_candidates, "mov": sorted(mov_candidates)}
+
+
+def first_frame_path(c):
+    return f"{c['folder']}/{c['prefix']}.{c['first']:0{c['padding']}d}{c['ext']}"
+
+
+def read_candidate_headers(candidates, workers=8):
+    """시퀀스 후보들의 첫 프레임 헤더를 probe 캐시로 병렬 읽기"""
+    headers = get_cache().probe_many([first_frame_path(c) for c in candidates], workers)
+    for c, header in zip(candidates, headers):
+        c["header"] = header
+
+
+def ver_priority(c):
+    folder = os.path.basename(c["folder"])
+    if "_plate_v" in folder: return 0
+    if "_org_v" in folder: return 1
+    return 2
+
+
+def read_name_for(prefix, shot=None):
+    tag = f"_{shot}" if shot else ""
+    if "_plate_v" in prefix:
+        ver = re.search(r"plate_v(\d+)", prefix).group(1)
+        return f"Read{tag}_Plate_v{ver}"
+    if "_org_v" in prefix:
+        ver = re.search(r"org_v(\d+)", prefix).group(1)
+        return f"Read{tag}_Org_v{ver}"
+    return f"Read{tag}_Plate"
+
+
+def _discover_worker(plate_dir, shot_pattern):
+    task = nuke.ProgressTask("SKYFALL Load Plate")
+    task.setMessage(f"Scanning {plate_dir}")
+
+    def progress(pct, msg):
+        task.setProgress(pct)
+        task.setMessage(f"Scanning {msg}")
+
+    try:
+        result = discover_plates(plate_dir, shot_pattern, task.isCancelled, progress)
+
+        # 시퀀스 첫 프레임 헤더 (해상도 / colorspace / 타임코드)
+        if result:
+            task.setMessage("Reading plate headers")
+            read_candidate_headers(result["seq"])
+
+        # 시퀀스가 없으면 MOV 를 worker 에서 미리 probe
+        if result and not result["seq"] and result["mov"]:
+            task.setMessage(f"Probing {os.path.basename(result['mov'][0])}")
+            result["mov_info"] = probe_mov_frames(result["mov"][0])
+
+    except Exception as e:
+        nuke.executeInMainThread(nuke.message, args=(f"Plate Loader Error:\n{e}",))
+        return
+
+    finally:
+        task.setProgress(100)
+        del task
+
+    if result is None:
+        nuke.tprint("[SKYFALL] Load Plate cancelled")
+        return
+
+    nuke.executeInMainThread(_load_selected, args=(result,))
+
+
 # ------------------------------------------------------------
 # MAIN
 # ------------------------------------------------------------
 def run():
+    """탐색은 background thread, 노드 생성은 main thread 에서"""
     try:
         show, ep, seq, shot, rootdir = parse_from_script_path()
         plate_dir = rootdir + "/plate"
@@ -160,40 +244,28 @@ def run():
 
         shot_pattern = f"{ep}_{seq}_{shot}" if ep.startswith("EP") else f"{seq}_{shot}"
 
-        seq_candidates = []
-        mov_candidates = []
+    except Exception as e:
+        nuke.message(f"Plate Loader Error:\n{e}")
+        return
 
-        # 시퀀스 top-level
-        top_seq = find_sequence(plate_dir, shot_pattern)
-        if top_seq:
-            seq_candidates.append(top_seq)
+    threading.Thread(
+        target=_discover_worker,
+        args=(plate_dir, shot_pattern),
+        name="skyfall-plate-discovery",
+        daemon=True,
+    ).start()
 
-        # 시퀀스 subfolders
-        for entry in os.listdir(plate_dir):
-            sub = os.path.join(plate_dir, entry)
-            if os.path.isdir(sub):
-                info = find_sequence(sub, shot_pattern)
-                if info:
-                    seq_candidates.append(info)
 
-        # MOV 탐색
-        for rootdir, dirs, files in os.walk(plate_dir):
-            for f in files:
-                if f.startswith(shot_pattern) and f.lower().endswith(".mov"):
-                    mov_candidates.append(os.path.join(rootdir, f))
+def _load_selected(result):
+    try:
+        seq_candidates = result["seq"]
+        mov_candidates = result["mov"]
 
         selected = None
         selected_type = None
 
         # 시퀀스 우선
         if seq_candidates:
-
-            def ver_priority(c):
-                folder = os.path.basename(c["folder"])
-                if "_plate_v" in folder: return 0
-                if "_org_v" in folder: return 1
-                return 2
-
             seq_candidates.sort(key=ver_priority)
 
             if len(seq_candidates) > 1:
@@ -211,7 +283,6 @@ def run():
                 selected_type = "seq"
 
         elif mov_candidates:
-            mov_candidates.sort()
             selected = mov_candidates[0]
             selected_type = "mov"
 
@@ -228,25 +299,23 @@ def run():
             last  = selected["last"]
 
             read = nuke.createNode("Read")
-            read["file"].setValue(f"{folder}/{prefix}.%04d{ext}")
+            read["file"].setValue(f"{folder}/{prefix}.%0{selected['padding']}d{ext}")
             read["first"].setValue(first)
             read["last"].setValue(last)
-            read["colorspace"].setValue(detect_colorspace(prefix + ext))
-
-            if "_plate_v" in prefix:
-                ver = re.search(r"plate_v(\d+)", prefix).group(1)
-                read.setName(f"Read_Plate_v{ver}")
-            elif "_org_v" in prefix:
-                ver = re.search(r"org_v(\d+)", prefix).group(1)
-                read.setName(f"Read_Org_v{ver}")
-            else:
-                read.setName("Read_Plate")
+            read["colorspace"].setValue(detect_colorspace(prefix + ext, selected.get("header")))
+            read["label"].setValue(header_label(selected.get("header")))
+
+            read.setName(read_name_for(prefix))
 
             read.autoplace()
-            nuke.message(f"Plate Loaded:\n{folder}/{prefix}.xxxx{ext}")
+
+            msg = f"Plate Loaded:\n{folder}/{prefix}.xxxx{ext}\nFrames: {selected['frames']}"
+            if selected["frames"].gaps():
+                msg += f"\nMissing: {selected['frames'].gaps()}"
+            nuke.message(msg)
             return
 
-        # MOV 로딩 (ffprobe)
+        # MOV 로딩 (worker 에서 probe 완료)
         movfile = selected
 
         read = nuke.createNode("Read")
@@ -255,7 +324,7 @@ def run():
         read["colorspace"].setValue("default")
         read.autoplace()
 
-        fps, frames = probe_mov_frames(movfile)
+        fps, frames, method = result.get("mov_info") or probe_mov_frames(movfile)
 
         read["first"].setValue(1)
         read["last"].setValue(frames)
@@ -266,8 +335,239 @@ def run():
         root["last_frame"].setValue(frames)
 
         nuke.message(
-            f"Plate Loaded (MOV):\n{movfile}\nFPS: {fps}\nFrames: {frames}"
+            f"Plate Loaded (MOV):\n{movfile}\nFPS: {fps}\nFrames: {frames} ({method})"
+        )
+
+    except Exception as e:
+        nuke.message(f"Plate Loader Error:\n{e}")
+
+
+# ------------------------------------------------------------
+# 멀티 샷 로딩 (시퀀스 룩뎁 / 컨티뉴이티 / 컨택트시트)
+# ------------------------------------------------------------
+def shot_pattern_for(ep, seq, shot):
+    if ep and ep.startswith("EP"):
+        return f"{ep}_{seq}_{shot}"
+    return f"{seq}_{shot}"
+
+
+def resolve_shots(shot_codes=None):
+    """
+    현재 스크립트 기준으로 샷 루트 목록 생성.
+      shot_codes 가 비어있으면 → 현재 시퀀스 폴더의 모든 샷 (plate/ 가 있는 것)
+      "0020"            → 같은 EP/SEQ
+      "S002_0010"       → 같은 EP
+      "EP02_S001_0010"  → 같은 SHOW
+    returns [(ep, seq, shot, shot_root), ...]
+    """
+    shot_root = parse_from_script_path()[4]
+
+    # EP / SEQ 는 샷 루트 폴더 구조에서 직접 (…/SHOW/EP/SEQ/SHOT)
+    seq_dir = os.path.dirname(shot_root)
+    ep_dir = os.path.dirname(seq_dir)
+    show_dir = os.path.dirname(ep_dir)
+    seq = os.path.basename(seq_dir)
+    ep = os.path.basename(ep_dir)
+
+    if not shot_codes:
+        shots = sorted(
+            e.name for e in os.scandir(seq_dir)
+            if e.is_dir() and os.path.isdir(os.path.join(e.path, "plate"))
+        )
+        return [(ep, seq, s, f"{seq_dir}/{s}") for s in shots]
+
+    resolved = []
+    for code in shot_codes:
+        c_ep, c_seq, c_shot = parse_shot_code(code.strip())
+        c_ep = c_ep or ep
+        c_seq = c_seq or seq
+        resolved.append((c_ep, c_seq, c_shot, f"{show_dir}/{c_ep}/{c_seq}/{c_shot}"))
+    return resolved
+
+
+def pick_plate(result):
+    """배치 모드: 팝업 없이 최신 plate 버전 / 없으면 첫 MOV"""
+    if result["seq"]:
+        top = min(ver_priority(c) for c in result["seq"])
+        best = max(
+            (c for c in result["seq"] if ver_priority(c) == top),
+            key=lambda c: os.path.basename(c["folder"]),
         )
+        return "seq", best
+    if result["mov"]:
+        return "mov", result["mov"][0]
+    return None, None
+
+
+def discover_shots(shots, is_cancelled=None, progress=None, workers=8):
+    """
+    샷 여러 개의 plate/ 를 병렬 탐색 (discover_plates + probe 캐시).
+    returns [{"shot", "ep", "seq", "type", "plate", "header"/"mov_info", "error"}]
+    """
+    def one(item):
+        ep, seq, shot, shot_root = item
+        entry = {"ep": ep, "seq": seq, "shot": shot, "type": None, "plate": None, "error": None}
+
+        plate_dir = f"{shot_root}/plate"
+        if not os.path.isdir(plate_dir):
+            entry["error"] = "no plate folder"
+            return entry
+
+        # 샷 1개 실패 (권한 / 깨진 파일 등) 가 시퀀스 전체 로드를 멈추지 않게 샷 단위로 처리
+        try:
+            result = discover_plates(plate_dir, shot_pattern_for(ep, seq, shot), is_cancelled)
+            if result is None:
+                entry["error"] = "cancelled"
+                return entry
+
+            entry["type"], entry["plate"] = pick_plate(result)
+            if entry["type"] == "seq":
+                entry["header"] = probe_media(first_frame_path(entry["plate"]))
+            elif entry["type"] == "mov":
+                entry["mov_info"] = probe_media(entry["plate"])
+            else:
+                entry["error"] = "no plate sequence or mov"
+        except Exception as e:
+            entry.update(type=None, plate=None, error=f"discover failed: {e}")
+        return entry
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i, entry in enumerate(pool.map(one, shots)):
+            results.append(entry)
+            if progress:
+                progress((i + 1) * 100 // max(len(shots), 1), entry["shot"])
+    return results
+
+
+def create_reads_bulk(entries, contact_sheet=True, spacing_x=120, origin=(0, 0)):
+    """
+    Read 노드 일괄 생성 — autoplace / 노드별 message 없음.
+    contact_sheet=True 면 ContactSheet 에 순서대로 연결.
+    """
+    x0, y0 = origin
+    reads = []
+
+    for entry in entries:
+        kind, plate = entry["type"], entry["plate"]
+        if not kind:
+            continue
+
+        if kind == "seq":
+            frames = plate["frames"]
+            read = nuke.nodes.Read(
+                file=f"{plate['folder']}/{plate['prefix']}.%0{plate['padding']}d{plate['ext']}",
+                first=frames.first,
+                last=frames.last,
+                origfirst=frames.first,
+                origlast=frames.last,
+            )
+            read["colorspace"].setValue(
+                detect_colorspace(plate["prefix"] + plate["ext"], entry.get("header"))
+            )
+            read["label"].setValue(header_label(entry.get("header")))
+            name = read_name_for(plate["prefix"], entry["shot"])
+        else:
+            info = entry["mov_info"]
+            read = nuke.nodes.Read(file=plate, first=1, last=info["frames"])
+            read["colorspace"].setValue("default")
+            name = f"Read_{entry['shot']}_Plate_mov"
+
+        read.setName(name, uncollide=True)
+        read.setXYpos(x0 + len(reads) * spacing_x, y0)
+        reads.append(read)
+
+    sheet = None
+    if contact_sheet and reads:
+        cols = math.ceil(math.sqrt(len(reads)))
+        rows = math.ceil(len(reads) / cols)
+        fmt = nuke.root().format()
+
+        sheet = nuke.nodes.ContactSheet(
+            inputs=reads,
+            width=fmt.width(),
+            height=fmt.height(),
+            rows=rows,
+            columns=cols,
+            roworder="TopBottom",
+            center=True,
+        )
+        sheet.setName("ContactSheet_Plates", uncollide=True)
+        sheet.setXYpos(x0 + (len(reads) - 1) * spacing_x // 2, y0 + 200)
+
+    return reads, sheet
+
+
+def _load_shots_worker(shots, contact_sheet):
+    task = nuke.ProgressTask("SKYFALL Load Sequence Plates")
+
+    def progress(pct, shot):
+        task.setProgress(pct)
+        task.setMessage(f"Scanned {shot}")
+
+    try:
+        entries = discover_shots(shots, task.isCancelled, progress)
+        cancelled = task.isCancelled()
+    except Exception as e:
+        nuke.executeInMainThread(nuke.message, args=(f"Plate Loader Error:\n{e}",))
+        return
+    finally:
+        del task
+
+    if cancelled:
+        nuke.tprint("[SKYFALL] Load Sequence Plates cancelled")
+        return
+
+    nuke.executeInMainThread(_finish_load_shots, args=(entries, contact_sheet))
+
+
+def _finish_load_shots(entries, contact_sheet):
+    try:
+        reads, _sheet = create_reads_bulk(entries, contact_sheet)
+    except Exception as e:
+        nuke.message(f"Plate Loader Error:\n{e}")
+        return
+
+    failed = [f"{e['shot']}: {e['error']}" for e in entries if e["error"]]
+    msg = f"Loaded {len(reads)} / {len(entries)} shot plates."
+    if failed:
+        msg += "\n\nSkipped:\n" + "\n".join(failed)
+    nuke.message(msg)
+
+
+def load_shots(shot_codes=None, contact_sheet=True):
+    """
+    스크립트 / 터미널에서 직접 호출:
+        plate_loader.load_shots(["0010", "0020", "0030"])
+        plate_loader.load_shots()          # 현재 시퀀스 전체
+    """
+    shots = resolve_shots(shot_codes)
+    if not shots:
+        nuke.message("No shots found.")
+        return
+
+    threading.Thread(
+        target=_load_shots_worker,
+        args=(shots, contact_sheet),
+        name="skyfall-sequence-plates",
+        daemon=True,
+    ).start()
+
+
+def run_sequence():
+    """메뉴: Load Sequence Plates"""
+    try:
+        codes = nuke.getInput(
+            "Shot codes (comma separated, blank = whole sequence)\n"
+            "e.g. 0010, 0020  /  S002_0010  /  EP02_S001_0010",
+            "",
+        )
+        if codes is None:
+            return
+
+        shot_codes = [c for c in codes.replace(" ", "").split(",") if c]
+        contact_sheet = nuke.ask("Wire plates into a ContactSheet?")
+        load_shots(shot_codes, contact_sheet)
 
     except Exception as e:
         nuke.message(f"Plate Loader Error:\n{e}")
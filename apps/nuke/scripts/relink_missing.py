@@ -0,0 +1,152 @@
+# ============================================================
+# SKYFALL Relink Missing Media
+# - 스크립트 안의 누락된 Read 경로를 파일명 인덱스로 한 번에 검색
+#   (core/io/relink_index.py — 쇼 트리 + $SKYFALL_RELINK_ROOTS)
+# - 후보는 원래 경로와 비슷한 순서로 정렬해서 노드별로 선택
+# - 인덱스 스캔 / 조회는 background thread, 선택 UI 는 main thread
+# ============================================================
+
+import os
+import threading
+
+import nuke
+import nukescripts
+
+from apps.nuke.scripts.context import parse_from_script_path
+from core.io.frame_pattern import FramePattern
+from core.io.relink_index import get_index, search_roots
+from core.io.sequence_scan import list_pattern
+
+SKIP = "(skip)"
+
+
+# ------------------------------------------------------------
+# 누락 media 수집 (main thread)
+# ------------------------------------------------------------
+def media_exists(path):
+    """시퀀스는 프레임이 하나라도 있으면 존재로 봄 (폴더 1회 listing)"""
+    pattern = FramePattern(path)
+    if pattern.is_sequence:
+        return bool(list_pattern(pattern))
+    return os.path.isfile(path)
+
+
+def missing_reads():
+    """[(node, path), ...] — file knob 이 비어있지 않고 디스크에 없는 노드"""
+    missing = []
+    for node in nuke.allNodes(recurseGroups=True):
+        if node.Class().startswith("Write"):
+            continue
+        knob = node.knob("file")
+        if knob is None:
+            continue
+        path = knob.value()
+        if path and not path.startswith("[") and not media_exists(path):
+            missing.append((node, path))
+    return missing
+
+
+def show_root():
+    try:
+        shot_root = parse_from_script_path()[4]
+    except Exception:
+        return None
+    # .../SHOW/EP/SEQ/SHOT → .../SHOW
+    return os.path.dirname(os.path.dirname(os.path.dirname(shot_root)))
+
+
+# ------------------------------------------------------------
+# 인덱스 + batch 조회 (worker thread — nuke UI 호출 금지)
+# ------------------------------------------------------------
+def _lookup_worker(missing, roots, refresh):
+    task = nuke.ProgressTask("SKYFALL Relink")
+
+    def progress(i, total, root):
+        task.setProgress(i * 100 // max(total, 1))
+        task.setMessage(f"Indexing {root}")
+
+    try:
+        index = get_index()
+        index.ensure(roots, refresh=refresh, is_cancelled=task.isCancelled, progress=progress)
+        if task.isCancelled():
+            nuke.tprint("[SKYFALL] Relink cancelled")
+            return
+        task.setMessage(f"Looking up {len(missing)} file(s)")
+        found = index.lookup([path for _node, path in missing], roots=roots)
+
+    except Exception as e:
+        nuke.executeInMainThread(nuke.message, args=(f"Relink Error:\n{e}",))
+        return
+
+    finally:
+        task.setProgress(100)
+        del task
+
+    nuke.executeInMainThread(_choose_candidates, args=(missing, found))
+
+
+# ------------------------------------------------------------
+# 후보 선택 (main thread)
+# ------------------------------------------------------------
+def _label(candidate):
+    frames = f"   [{candidate['frames']}]" if candidate.get("frames") else ""
+    return f"{candidate['score']:.2f}   {candidate['path']}{frames}"
+
+
+def _choose_candidates(missing, found):
+    rows = [(node, path, found.get(path) or []) for node, path in missing]
+    not_found = [(node, path) for node, path, cands in rows if not cands]
+    rows = [r for r in rows if r[2]]
+
+    for node, path in not_found:
+        nuke.tprint(f"[SKYFALL] Relink: no candidate for {node.fullName()}  {path}")
+
+    if not rows:
+        nuke.message(f"No candidates found for {len(not_found)} missing file(s).")
+        return
+
+    panel = nukescripts.PythonPanel("SKYFALL Relink Missing Media")
+    knobs = []
+    for i, (node, path, cands) in enumerate(rows):
+        panel.addKnob(nuke.Text_Knob(f"src{i}", node.fullName(), path))
+        choice = nuke.Enumeration_Knob(f"pick{i}", "", [SKIP] + [_label(c) for c in cands])
+        choice.setValue(1)  # 가장 비슷한 후보
+        panel.addKnob(choice)
+        knobs.append(choice)
+
+    if not panel.showModalDialog():
+        return
+
+    relinked = 0
+    for (node, path, cands), choice in zip(rows, knobs):
+        idx = int(choice.getValue())
+        if idx <= 0:
+            continue
+        new_path = cands[idx - 1]["path"]
+        node["file"].setValue(new_path)
+        nuke.tprint(f"[SKYFALL] Relinked {node.fullName()}: {path} → {new_path}")
+        relinked += 1
+
+    nuke.message(f"Relinked {relinked} node(s), {len(not_found)} without candidates.")
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def run(refresh=False):
+    missing = missing_reads()
+    if not missing:
+        nuke.message("No missing media.")
+        return
+
+    roots = search_roots(show_root())
+    if not roots:
+        nuke.message("No search roots.\nSave the script in a show folder or set SKYFALL_RELINK_ROOTS.")
+        return
+
+    threading.Thread(
+        target=_lookup_worker,
+        args=(missing, roots, refresh),
+        name="skyfall-relink",
+        daemon=True,
+    ).start()
@@ -0,0 +1,311 @@
+"""
+core/io/archive_writer.py
+
+- collect 결과를 폴더 대신 아카이브 1개로 바로 스트리밍 (외주 outbound 패키지용)
+  → 폴더로 collect 한 뒤 다시 tar 하는 이중 read/write 제거
+- 포맷 (확장자로 결정):
+    .tar                plain tar
+    .tar.gz / .tgz      gzip
+    .tar.zst            zstd (zstandard 모듈 있을 때만)
+    .zip                zip64, 무압축 (EXR/DPX 는 이미 압축돼 있음)
+- <archive>.index.json : member 목록 + offset → 부분 추출용
+- .part 에 쓰고 끝나면 rename (중간에 취소 / 실패하면 삭제)
+- 스트리밍하는 버퍼로 md5 (+ 선택 xxh64) 계산 → index / hashlist.md5 member
+
+    writer = ArchiveWriter("/out/BBF_EP01_S001_0010.tar")
+    stats = writer.add_files(jobs, progress=cb, is_cancelled=task.isCancelled)
+    writer.add_file(tmp_nk, "BBF_EP01_S001_0010_comp_v003.nk")
+    writer.close()
+"""
+
+import gzip
+import io
+import json
+import os
+import tarfile
+import time
+import zipfile
+
+from core.io.copy_engine import DEFAULT_BUFFER, CopyCancelled, CopyStats, total_size
+from core.io.hashlist import (
+    DEFAULT_HASHES,
+    format_hashlist,
+    hashlist_name,
+    hexdigests,
+    new_hashers,
+    update_all,
+)
+
+try:
+    import zstandard
+except ImportError:  # Nuke 번들 Python 에는 없음
+    zstandard = None
+
+INDEX_SUFFIX = ".index.json"
+
+FORMATS = {
+    ".tar": "tar",
+    ".tar.gz": "tar.gz",
+    ".tgz": "tar.gz",
+    ".tar.zst": "tar.zst",
+    ".zip": "zip",
+}
+
+
+def archive_format(path: str) -> str | None:
+    lower = path.lower()
+    for ext in sorted(FORMATS, key=len, reverse=True):
+        if lower.endswith(ext):
+            return FORMATS[ext]
+    return None
+
+
+class _CountingReader:
+    """tarfile 이 읽는 동안 진행률 갱신 + 취소 확인"""
+
+    def __init__(self, f, stats: CopyStats, is_cancelled, hashers: dict):
+        self._f = f
+        self._stats = stats
+        self._is_cancelled = is_cancelled
+        self._hashers = hashers
+
+    def read(self, n=-1):
+        if self._is_cancelled and self._is_cancelled():
+            raise CopyCancelled()
+        buf = self._f.read(n)
+        update_all(self._hashers, buf)
+        self._stats.add_bytes(len(buf))
+        return buf
+
+
+class ArchiveWriter:
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER, hashes=DEFAULT_HASHES):
+        self.path = path
+        self.format = archive_format(path)
+        if self.format is None:
+            raise ValueError(f"Unsupported archive type: {path}")
+        if self.format == "tar.zst" and zstandard is None:
+            raise RuntimeError("zstandard module not available — use .tar.gz or .tar")
+
+        self.buffer_size = buffer_size
+        self.hashes = tuple(hashes)
+        self.part_path = path + ".part"
+        self.members: list[dict] = []
+        self._raw = None
+        self._stream = None
+        self._tar = None
+        self._zip = None
+        self._open()
+
+    # --------------------------------------------------------
+    # open / close
+    # --------------------------------------------------------
+    def _open(self):
+        if self.format == "zip":
+            self._zip = zipfile.ZipFile(self.part_path, "w", zipfile.ZIP_STORED, allowZip64=True)
+            return
+
+        self._raw = open(self.part_path, "wb")
+        if self.format == "tar.gz":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+        elif self.format == "tar.zst":
+            self._stream = zstandard.ZstdCompressor(threads=-1).stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self._tar = tarfile.open(fileobj=self._stream, mode="w|", format=tarfile.PAX_FORMAT)
+
+    def close(self):
+        """아카이브 마무리 → rename + member index 기록"""
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.close()
+
+        os.replace(self.part_path, self.path)
+        self._write_index()
+
+    def abort(self):
+        """취소 / 실패 → 쓰던 .part 삭제"""
+        try:
+            if self._zip is not None:
+                self._zip.close()
+            else:
+                self._raw.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+
+    def _write_index(self):
+        data = {
+            "archive": os.path.basename(self.path),
+            "format": self.format,
+            # tar 계열 offset 은 압축 해제된 tar 스트림 기준
+            "offset_base": "zip" if self.format == "zip" else "tar_stream",
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "members": self.members,
+        }
+        index_path = self.path + INDEX_SUFFIX
+        tmp = index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, index_path)
+
+    # --------------------------------------------------------
+    # member 추가
+    # --------------------------------------------------------
+    def add_file(self, src: str, arcname: str, stats: CopyStats | None = None, is_cancelled=None):
+        st = os.stat(src)
+        stats = stats or CopyStats(1, st.st_size)
+        hashers = new_hashers(self.hashes)
+
+        with open(src, "rb") as f:
+            reader = _CountingReader(f, stats, is_cancelled, hashers)
+            if self._zip is not None:
+                info = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+                info.external_attr = (st.st_mode & 0xFFFF) << 16
+                with self._zip.open(info, "w", force_zip64=True) as out:
+                    while True:
+                        buf = reader.read(self.buffer_size)
+                        if not buf:
+                            break
+                        out.write(buf)
+                header_offset = info.header_offset
+                data_offset = None
+            else:
+                info = self._tar.gettarinfo(src, arcname)
+                header_offset = self._tar.offset
+                self._tar.addfile(info, reader)
+                blocks = -(-st.st_size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                data_offset = self._tar.offset - blocks
+
+        digests = hexdigests(hashers)
+        self.members.append({
+            "name": arcname,
+            "src": src,
+            "size": st.st_size,
+            "mtime": int(st.st_mtime),
+            "header_offset": header_offset,
+            "data_offset": data_offset,
+            **digests,
+        })
+        stats.file_done(arcname, digests)
+
+    def add_bytes(self, data: bytes, arcname: str):
+        """메모리 데이터 → member (hashlist 등 작은 파일용, index 에는 안 넣음)"""
+        if self._zip is not None:
+            info = zipfile.ZipInfo(arcname, time.localtime()[:6])
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, data)
+            return
+        info = tarfile.TarInfo(arcname)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def add_hashlists(self):
+        """지금까지 넣은 member 의 hashlist.md5 (/ .xxh64) 를 아카이브 루트에 추가"""
+        for name in self.hashes:
+            digests = {m["name"]: m[name] for m in self.members if name in m}
+            if digests:
+                self.add_bytes(format_hashlist(digests).encode("utf-8"), hashlist_name(name))
+
+    def add_files(self, jobs, progress=None, is_cancelled=None) -> CopyStats:
+        """
+        jobs: [(src, arcname), ...] 또는 [(src, arcname, size), ...] 를 순서대로 스트리밍.
+        size 를 주면 진행률 합계용으로 다시 stat 하지 않음.
+        copy_scheduler 의 CopyJob.wait 와 같은 CopyStats / progress / 취소 규칙.
+        아카이브는 단일 스트림이라 병렬 쓰기는 없음.
+        """
+        jobs = list({job[1]: job for job in jobs}.values())
+        stats = CopyStats(len(jobs), total_size(jobs))
+        last_report = 0.0
+        for src, arcname, *_size in jobs:
+            try:
+                self.add_file(src, arcname, stats, is_cancelled)
+            except CopyCancelled:
+                stats.cancelled = True
+                break
+            except OSError as e:
+                stats.add_error(src, str(e))
+                # tar 스트림 중간에 읽기 실패하면 아카이브가 깨짐 → 중단
+                if self._tar is not None:
+                    break
+
+            if progress and time.time() - last_report >= 0.25:
+                last_report = time.time()
+                progress(stats)
+
+        stats.finished = time.time()
+        if progress:
+            progress(stats)
+        return stats
+
+
+# ------------------------------------------------------------
+# 부분 추출
+# ------------------------------------------------------------
+def _extract(tar, info, dest_dir: str):
+    if hasattr(tarfile, "data_filter"):
+        tar.extract(info, dest_dir, filter="data")
+    else:
+        tar.extract(info, dest_dir)
+
+
+def read_index(archive_path: str) -> dict:
+    with open(archive_path + INDEX_SUFFIX, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def extract_members(archive_path: str, names, dest_dir: str) -> list[str]:
+    """
+    index 에 있는 member 만 추출.
+    plain tar / zip 은 offset 으로 바로 seek, 압축 tar 는 스트림을 훑으면서 골라냄.
+    """
+    index = read_index(archive_path)
+    wanted = set(names)
+    members = [m for m in index["members"] if m["name"] in wanted]
+    out = []
+
+    if index["format"] == "zip":
+        with zipfile.ZipFile(archive_path) as zf:
+            for m in members:
+                out.append(zf.extract(m["name"], dest_dir))
+        return out
+
+    if index["format"] == "tar":
+        with open(archive_path, "rb") as f:
+            for m in members:
+                f.seek(m["header_offset"])
+                with tarfile.open(fileobj=f, mode="r|") as tar:
+                    _extract(tar, tar.next(), dest_dir)
+                out.append(os.path.join(dest_dir, m["name"]))
+        return out
+
+    if index["format"] == "tar.zst":
+        if zstandard is None:
+            raise RuntimeError("zstandard module not available")
+        raw = open(archive_path, "rb")
+        stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        mode = "r|"
+    else:
+        raw = stream = None
+        mode = "r|gz"
+
+    with tarfile.open(archive_path if stream is None else None, mode, fileobj=stream) as tar:
+        for info in tar:
+            if info.name in wanted:
+                _extract(tar, info, dest_dir)
+                out.append(os.path.join(dest_dir, info.name))
+                wanted.discard(info.name)
+                if not wanted:
+                    break
+    if raw is not None:
+        raw.close()
+    return out
@@ -0,0 +1,320 @@
+"""
+core/io/collect.py
+
+- collect 공용 로직 (Nuke 세션 / headless .nk 모두 사용)
+    apps/nuke/scripts/collectFiles.py   : nuke.allNodes() → Collector
+    tools/collect/headless_collect.py   : .nk 파싱 (core/io/nk_script.py) → Collector
+- file knob 값 → footage/ 아래 복사 목록 + relink 값
+- 복사는 공용 copy_scheduler (폴더) 또는 ArchiveWriter (tar/zip), manifest / hashlist 포함
+- media graph: 같은 시퀀스 / 파일을 쓰는 노드 (Read + ReadGeo 등) 를 묶어서
+  프레임 범위는 합치고, 각 프레임은 한 번만 검사 / 복사
+
+대상 레이아웃:
+    <target>/<script>.nk
+    <target>/footage/<file>                 (MOV / 단일 파일)
+    <target>/footage/<seq dir>/<frames>     (시퀀스)
+    <target>/hashlist.md5
+    <target>/.skyfall_collect.json
+
+    collector = Collector(target_dir)
+    relink = collector.add_media(path, first, last, node="Read1")
+    stats = collector.copy(progress=cb, is_cancelled=cancel)    # plan() 포함
+    collector.finish(saved_script, script_name)
+"""
+
+import os
+
+from core.io import archive_writer, collect_manifest
+from core.io.archive_writer import ArchiveWriter
+from core.io.collect_manifest import CollectManifest
+from core.io.copy_engine import DEFAULT_WORKERS
+from core.io.copy_scheduler import PRIORITY_NORMAL, get_scheduler
+from core.io.frame_pattern import FramePattern
+from core.io.frame_set import FrameSet
+from core.io.hashlist import DEFAULT_HASHES, available, file_digest, hashlist_name, write_hashlist
+from core.io.sequence_scan import list_pattern
+
+VIDEO_EXTENSIONS = (".mov", ".avi", ".mpeg", ".mpg", ".mp4", ".r3d")
+FOOTAGE_DIR = "footage"
+# 저장된 .nk 위치 기준 상대 경로 (collect 폴더째 옮겨도 유지)
+RELINK_ROOT = "[file dirname [value root.name]]/footage/"
+
+# tar.zst 는 zstandard 모듈이 있을 때만 (Nuke 번들 Python 에는 없음)
+ARCHIVE_FORMATS = ("tar", "tar.gz") + (("tar.zst",) if archive_writer.zstandard is not None else ()) + ("zip",)
+
+
+# ------------------------------------------------------------
+# 경로 규칙
+# ------------------------------------------------------------
+def _stat(path: str):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def is_video(path: str) -> bool:
+    return path.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def is_sequence(path: str) -> bool:
+    return not is_video(path) and FramePattern(path).is_sequence
+
+
+def footage_relpath(path: str) -> str:
+    """
+    footage/ 아래 상대 경로.
+    시퀀스는 원본 폴더 이름까지 (프레임이 섞이지 않게), 나머지는 파일명만.
+    """
+    parts = path.replace("\\", "/").split("/")
+    if is_sequence(path) and len(parts) > 1:
+        return f"{parts[-2]}/{parts[-1]}"
+    return parts[-1]
+
+
+def relink_value(path: str) -> str:
+    return RELINK_ROOT + footage_relpath(path)
+
+
+# ------------------------------------------------------------
+# Collector
+# ------------------------------------------------------------
+class Collector:
+    def __init__(
+        self,
+        target_dir: str,
+        archive: str | None = None,
+        archive_name: str = "collect",
+        workers: int = DEFAULT_WORKERS,
+        priority: int = PRIORITY_NORMAL,
+        log=print,
+    ):
+        """
+        archive: None / 'folder' = 폴더 collect, 'tar' / 'tar.gz' / 'tar.zst' / 'zip' = 아카이브
+        archive_name: 아카이브 파일 이름 (확장자 제외, 보통 스크립트 이름)
+        workers: 이 collect 의 최대 동시 복사 수 (scheduler 전체 worker 안에서)
+        priority: copy_scheduler 우선순위 (PRIORITY_INTERACTIVE / NORMAL / BACKGROUND)
+        """
+        self.target_dir = os.path.abspath(target_dir)
+        self.footage_dir = os.path.join(self.target_dir, FOOTAGE_DIR)
+        self.archive = None if archive in (None, "", "folder") else archive
+        if self.archive and self.archive not in ARCHIVE_FORMATS:
+            # plan / 복사 전에 알림 (ArchiveWriter 는 copy() 에서야 열림)
+            raise ValueError(f"Unsupported archive format here: {self.archive} (use {', '.join(ARCHIVE_FORMATS)})")
+        self.archive_path = (
+            os.path.join(self.target_dir, f"{archive_name}.{self.archive}") if self.archive else None
+        )
+        self.workers = workers
+        self.priority = priority
+        self.name = archive_name
+        self.log = log
+
+        # 이전 collect 기록 — 새 파일 / 바뀐 파일만 복사, 끊긴 collect 는 이어서
+        self.manifest = CollectManifest(self.target_dir)
+        # footage 상대 경로 → {"src", "sequence", "frames", "all_frames", "nodes"}
+        self.media: dict[str, dict] = {}
+        self.node_count = 0
+        # (src, dst, size) — size 는 plan 에서 읽은 stat (복사 전에 다시 stat 하지 않음)
+        self.jobs: list[tuple[str, str, int | None]] = []
+        self._planned = False
+        self.stats = None
+        self._writer = None
+
+    # --------------------------------------------------------
+    # 1) media graph
+    # --------------------------------------------------------
+    def add_media(self, path: str, first=None, last=None, node=None) -> str:
+        """
+        file knob 값 1개 → media graph 에 등록, relink 값 반환.
+        같은 시퀀스 (%04d / #### 표기 달라도) 는 한 항목으로 묶고 프레임 범위는 합침.
+        first/last 가 없으면 (knob 없음) 시퀀스는 폴더에 있는 프레임 전부.
+        """
+        self.node_count += 1
+        sequence = is_sequence(path)
+        src = FramePattern(path).printf() if sequence else path
+        rel = footage_relpath(src)
+
+        entry = self.media.get(rel)
+        if entry is None:
+            entry = self.media[rel] = {
+                "src": src,
+                "sequence": sequence,
+                "frames": FrameSet(),
+                "all_frames": False,
+                "nodes": [],
+            }
+        elif entry["src"] != src:
+            # 다른 원본이 같은 footage 경로로 모임 → 먼저 등록된 쪽 유지
+            self.log(f"{rel}     CONFLICT  {src}  (keeping {entry['src']})")
+
+        if node is not None:
+            entry["nodes"].append(node)
+        if sequence:
+            if first is None or last is None:
+                entry["all_frames"] = True
+            else:
+                entry["frames"] = entry["frames"] | FrameSet.from_range(first, last)
+        return relink_value(path)
+
+    def graph_summary(self) -> str:
+        frames = sum(len(m["frames"]) for m in self.media.values() if m["sequence"])
+        return f"{self.node_count} file knobs → {len(self.media)} unique media ({frames} frames)"
+
+    # --------------------------------------------------------
+    # 1-b) 복사 목록 (unique media 단위)
+    # --------------------------------------------------------
+    def plan(self):
+        if self._planned:
+            return
+        self._planned = True
+        self.log("MEDIA: " + self.graph_summary())
+
+        for rel, entry in self.media.items():
+            dst = os.path.join(self.footage_dir, rel)
+            self._mkdir(os.path.dirname(dst))
+            if entry["sequence"]:
+                wanted = None if entry["all_frames"] else entry["frames"]
+                self._add_sequence(FramePattern(entry["src"]), FramePattern(dst), wanted)
+            else:
+                self._add_file(entry["src"], dst)
+
+    def _mkdir(self, folder: str):
+        if not self.archive:
+            os.makedirs(folder, exist_ok=True)
+
+    def _add_file(self, src: str, dst: str):
+        src_stat = _stat(src)
+        if self.archive:
+            # 아카이브는 매번 새로 만들므로 대상 폴더 상태와 무관
+            action = collect_manifest.NEW if src_stat else collect_manifest.MISSING
+        else:
+            action = self.manifest.plan(src, dst, src_stat=src_stat, dst_stat=_stat(dst), stat_known=True)
+
+        if action == collect_manifest.MISSING:
+            self.log(dst + "     MISSING")
+        elif action == collect_manifest.UNCHANGED:
+            self.log(dst + "     UP-TO-DATE")
+        else:
+            if action == collect_manifest.CHANGED:
+                self.log(dst + "     CHANGED")
+            self.jobs.append((src, dst, src_stat.st_size))
+
+    def _add_sequence(self, src_pattern: FramePattern, dst_pattern: FramePattern, wanted: FrameSet | None):
+        # 원본 / 대상 폴더를 1번씩만 listing 하고 프레임 집합으로 비교
+        src_entries = list_pattern(src_pattern)
+        dst_entries = {} if self.archive else list_pattern(dst_pattern)
+
+        if wanted is None:
+            wanted = FrameSet(src_entries)
+
+        present = FrameSet(src_entries) & wanted
+        missing = wanted - present
+        if missing:
+            self.manifest.add_missing(len(missing))
+            self.log(dst_pattern.hashes() + "     MISSING  " + str(missing))
+
+        actions = {}
+        for frame in present:
+            src = src_entries[frame].path
+            dst = dst_pattern.path(frame)
+            src_stat = src_entries[frame].stat()   # DirEntry 캐시 — 복사 / 진행률에서 재사용
+            if self.archive:
+                action = collect_manifest.NEW
+            else:
+                dst_entry = dst_entries.get(frame)
+                action = self.manifest.plan(
+                    src, dst,
+                    src_stat=src_stat,
+                    dst_stat=dst_entry.stat() if dst_entry else None,
+                    stat_known=True,
+                )
+            actions.setdefault(action, []).append(frame)
+            if action != collect_manifest.UNCHANGED:
+                self.jobs.append((src, dst, src_stat.st_size))
+
+        for action, label in ((collect_manifest.UNCHANGED, "UP-TO-DATE"), (collect_manifest.CHANGED, "CHANGED")):
+            if actions.get(action):
+                self.log(dst_pattern.hashes() + "     " + label + "  " + str(FrameSet(actions[action])))
+
+    # --------------------------------------------------------
+    # 2) 복사
+    # --------------------------------------------------------
+    def copy(self, progress=None, is_cancelled=None):
+        """
+        폴더: copy_scheduler 에 job 으로 제출 (대역폭 / volume 제한 공유) / 아카이브: tar·zip 스트림에 바로 기록.
+        반환: CopyStats (stats.cancelled / stats.errors 확인)
+        """
+        self.plan()
+        if self.archive:
+            self._writer = ArchiveWriter(self.archive_path)
+            jobs = [
+                (src, os.path.relpath(dst, self.target_dir).replace(os.sep, "/"), size)
+                for src, dst, size in self.jobs
+            ]
+            stats = self._writer.add_files(jobs, progress=progress, is_cancelled=is_cancelled)
+            for src, err in stats.errors:
+                self.log(src + "     FAILED  " + err)
+            self.log("ARCHIVED: " + stats.summary())
+            if stats.cancelled or stats.errors:
+                self.abort()
+        else:
+            job = get_scheduler().submit(
+                self.jobs,
+                priority=self.priority,
+                name=f"collect {self.name}",
+                max_workers=self.workers,
+            )
+            stats = job.wait(progress=progress, is_cancelled=is_cancelled)
+            # 취소 / 실패해도 끝난 파일은 기록 → 다음 collect 에서 이어서
+            for dst in stats.copied:
+                self.manifest.record(dst, stats.hashes.get(dst))
+            self.manifest.save()
+
+            for src, err in stats.errors:
+                self.log(src + "     FAILED  " + err)
+            self.log("COPIED: " + stats.summary())
+            self.log("MANIFEST: " + self.manifest.summary())
+
+        self.stats = stats
+        return stats
+
+    @property
+    def ok(self) -> bool:
+        """취소 / 복사 실패가 하나라도 있으면 False (폴더 / 아카이브 공통) → finish() 하지 않음"""
+        return self.stats is not None and not self.stats.cancelled and not self.stats.errors
+
+    # --------------------------------------------------------
+    # 3) 마무리 — relink 된 스크립트 + hashlist
+    # --------------------------------------------------------
+    def finish(self, script_path: str, script_name: str) -> str:
+        """
+        script_path: relink 해서 저장한 .nk
+          폴더 모드  → <target>/<script_name> 에 이미 저장돼 있어야 함
+          아카이브   → 아무 임시 경로, 아카이브 루트에 script_name 으로 들어감
+        반환: 결과 경로 (폴더 또는 아카이브)
+        복사가 취소 / 실패한 collect 는 relink 스크립트 / hashlist 를 남기지 않음 (RuntimeError)
+        """
+        if not self.ok:
+            raise RuntimeError("collect incomplete (cancelled or copy errors) — not finishing")
+        if self.archive:
+            self._writer.add_file(script_path, script_name)
+            self._writer.add_hashlists()
+            self._writer.close()
+            self._writer = None
+            self.log("ARCHIVE: " + self.archive_path)
+            return self.archive_path
+
+        # hashlist.md5 — footage 는 복사하면서 계산한 값, 다시 읽는 건 .nk 뿐
+        self.manifest.save()
+        for name in DEFAULT_HASHES:
+            if available(name):
+                digests = self.manifest.digests(name)
+                digests[script_name] = file_digest(script_path, name)
+                path = write_hashlist(os.path.join(self.target_dir, hashlist_name(name)), digests)
+                self.log("HASHLIST: " + path)
+        return self.target_dir
+
+    def abort(self):
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
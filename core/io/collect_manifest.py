@@ -0,0 +1,190 @@
+"""
+core/io/collect_manifest.py
+
+- collect 대상 폴더에 남기는 manifest (.skyfall_collect.json)
+- 파일별 원본 경로 / size / mtime (+ 선택적으로 hash) 기록
+- 다시 collect 하면 새 파일 / 바뀐 파일만 복사, 기존 파일은 검증 후 skip
+  → 중간에 끊긴 collect 도 안전하게 이어서 진행
+
+plan() 결과:
+    "new"        대상에 없음 → 복사
+    "changed"    원본이 바뀌었거나 대상 파일이 manifest 와 다름 → 복사
+    "unchanged"  검증 통과 → skip
+    "missing"    원본 없음
+"""
+
+import json
+import os
+import time
+
+from core.io.hashlist import file_digest
+
+MANIFEST_NAME = ".skyfall_collect.json"
+MANIFEST_VERSION = 1
+
+NEW = "new"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+MISSING = "missing"
+
+# SMB / NFS 는 mtime 정밀도가 낮을 수 있음
+_MTIME_TOLERANCE_NS = 2 * 1000 * 1000 * 1000
+
+
+def _stat(path: str):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _same_mtime(a: int, b: int) -> bool:
+    return abs(a - b) <= _MTIME_TOLERANCE_NS
+
+
+class CollectManifest:
+    def __init__(self, target_dir: str, verify_hash: bool = False):
+        """verify_hash=True 면 manifest 에 md5 가 있는 기존 파일을 다시 읽어서 검증"""
+        self.target_dir = os.path.abspath(target_dir)
+        self.verify_hash = verify_hash
+        self.path = os.path.join(self.target_dir, MANIFEST_NAME)
+        self.files: dict[str, dict] = {}
+        self._pending: dict[str, dict] = {}
+        # 이번 collect 에서 plan() 한 대상 (relpath) — hashlist 는 이것만
+        self.planned: set[str] = set()
+        # plan() 결과 (복사 예정) / record() 로 실제 반영된 복사
+        self.counts = {NEW: 0, CHANGED: 0, UNCHANGED: 0, MISSING: 0}
+        self.recorded = {NEW: 0, CHANGED: 0}
+        self._actions: dict[str, str] = {}
+        self.load()
+
+    # --------------------------------------------------------
+    # load / save
+    # --------------------------------------------------------
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.files = data.get("files", {})
+
+    def save(self):
+        """tmp 파일에 쓰고 rename (중간에 죽어도 manifest 가 깨지지 않음)"""
+        tmp = self.path + ".tmp"
+        data = {
+            "version": MANIFEST_VERSION,
+            "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": self.files,
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def rel(self, dst: str) -> str:
+        return os.path.relpath(os.path.abspath(dst), self.target_dir).replace(os.sep, "/")
+
+    # --------------------------------------------------------
+    # plan / record
+    # --------------------------------------------------------
+    def plan(self, src: str, dst: str, src_stat=None, dst_stat=None, stat_known=False) -> str:
+        """
+        src/dst 를 비교해서 복사 여부 결정.
+        stat_known=True 면 넘겨준 stat(None = 없음)을 그대로 믿음 (디렉토리 listing 재사용).
+        """
+        if not stat_known:
+            src_stat = _stat(src)
+            dst_stat = _stat(dst)
+
+        if src_stat is None:
+            return self._count(MISSING)
+
+        key = self.rel(dst)
+        self.planned.add(key)
+        self._pending[key] = {
+            "src": src,
+            "size": src_stat.st_size,
+            "mtime_ns": src_stat.st_mtime_ns,
+        }
+
+        if dst_stat is None:
+            return self._count(NEW, key)
+
+        entry = self.files.get(key)
+        if entry:
+            same_src = (
+                entry.get("src") == src
+                and entry.get("size") == src_stat.st_size
+                and entry.get("mtime_ns") == src_stat.st_mtime_ns
+            )
+            intact = (
+                dst_stat.st_size == entry["size"]
+                and _same_mtime(dst_stat.st_mtime_ns, entry["mtime_ns"])
+            )
+            if intact and self.verify_hash and entry.get("md5"):
+                intact = file_digest(dst, "md5") == entry["md5"]
+            if same_src and intact:
+                self._pending.pop(key)
+                return self._count(UNCHANGED)
+            return self._count(CHANGED, key)
+
+        # manifest 없던 예전 collect → copystat 으로 맞춰진 size/mtime 이면 채택
+        if dst_stat.st_size == src_stat.st_size and _same_mtime(dst_stat.st_mtime_ns, src_stat.st_mtime_ns):
+            self.files[key] = self._pending.pop(key)
+            return self._count(UNCHANGED)
+
+        return self._count(CHANGED, key)
+
+    def record(self, dst: str, hashes: dict | None = None):
+        """복사 성공한 파일을 manifest 에 반영"""
+        key = self.rel(dst)
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return
+        action = self._actions.pop(key, None)
+        if action:
+            self.recorded[action] += 1
+        if hashes:
+            entry.update(hashes)
+        self.files[key] = entry
+
+    def add_missing(self, count: int):
+        """listing 비교로 찾은 누락 프레임 (plan() 을 거치지 않음)"""
+        self.counts[MISSING] += count
+
+    def digests(self, name: str = "md5") -> dict:
+        """
+        {relpath: digest} (hashlist 용) — 이번 plan() 대상 중 manifest 에 있는 것만
+        (예전 collect 에만 있던 footage 는 제외, 복사 실패한 파일도 제외).
+        복사 중 계산된 값을 그대로 쓰고, manifest 이전 collect 에서 채택한 파일만 새로 읽음.
+        """
+        out = {}
+        for key in sorted(self.planned):
+            entry = self.files.get(key)
+            if entry is None:
+                continue
+            if name not in entry:
+                path = os.path.join(self.target_dir, key)
+                if not os.path.isfile(path):
+                    continue
+                entry[name] = file_digest(path, name)
+            out[key] = entry[name]
+        return out
+
+    def _count(self, action: str, key: str | None = None) -> str:
+        self.counts[action] += 1
+        if key is not None:
+            self._actions[key] = action
+        return action
+
+    def summary(self) -> str:
+        """new / changed 는 실제로 record() 된 수, 복사 못 한 것은 "not copied" 로 따로"""
+        counts = {
+            NEW: self.recorded[NEW],
+            CHANGED: self.recorded[CHANGED],
+            UNCHANGED: self.counts[UNCHANGED],
+            MISSING: self.counts[MISSING],
+            "not copied": len(self._actions),
+        }
+        return ", ".join(f"{v} {k}" for k, v in counts.items() if v)
@@ -0,0 +1,169 @@
+"""
+core/io/copy_engine.py
+
+- NAS 용 파일 복사 공용 부품 (thread pool / 우선순위는 core/io/copy_scheduler.py)
+- 서로 다른 시퀀스(디렉토리)의 파일을 번갈아 배치해서 read 가 겹치도록 함
+- 진행률 / 처리량 (MB/s, files/s) 집계 (CopyStats), 취소 지원
+- <dst>.part 에 쓰고 끝나면 rename → 취소 / 에러 나도 기존 dst (이전 collect) 는 그대로
+- 복사하는 버퍼로 md5 (+ 선택 xxh64) 계산 → stats.hashes (다시 읽지 않음)
+
+    copy_file(src, dst, stats, cancel_event, throttle=limiter)
+"""
+
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+
+from core.io.hashlist import DEFAULT_HASHES, hexdigests, new_hashers, update_all
+
+DEFAULT_WORKERS = int(os.getenv("SKYFALL_COPY_WORKERS", "8"))
+DEFAULT_BUFFER = 8 * 1024 * 1024
+
+
+class CopyCancelled(Exception):
+    pass
+
+
+class CopyStats:
+    """복사 집계 (worker thread 에서 갱신되므로 lock 사용)"""
+
+    def __init__(self, total_files=0, total_bytes=0):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.files_done = 0
+        self.bytes_done = 0
+        self.copied: list[str] = []
+        self.hashes: dict[str, dict] = {}
+        self.errors: list[tuple[str, str]] = []
+        self.cancelled = False
+        self.started = time.time()
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def add_bytes(self, n):
+        with self._lock:
+            self.bytes_done += n
+
+    def file_done(self, dst, digests=None):
+        with self._lock:
+            self.files_done += 1
+            self.copied.append(dst)
+            if digests:
+                self.hashes[dst] = digests
+
+    def add_error(self, src, message):
+        with self._lock:
+            self.errors.append((src, message))
+
+    @property
+    def elapsed(self) -> float:
+        return max((self.finished or time.time()) - self.started, 1e-6)
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.bytes_done / (1024 * 1024) / self.elapsed
+
+    @property
+    def files_per_sec(self) -> float:
+        return self.files_done / self.elapsed
+
+    @property
+    def percent(self) -> int:
+        if self.total_bytes:
+            return min(100, self.bytes_done * 100 // self.total_bytes)
+        if self.total_files:
+            return min(100, self.files_done * 100 // self.total_files)
+        return 100
+
+    def summary(self) -> str:
+        return (
+            f"{self.files_done}/{self.total_files} files, "
+            f"{self.bytes_done / (1024 * 1024):.1f} MB in {self.elapsed:.1f}s "
+            f"({self.mb_per_sec:.1f} MB/s, {self.files_per_sec:.1f} files/s)"
+        )
+
+
+def total_size(jobs) -> int:
+    """
+    [(src, dst[, size]), ...] 의 bytes 합계 (진행률용).
+    size 가 있으면 그대로 (collect plan 의 DirEntry stat 재사용), 없는 것만 getsize
+    """
+    total = 0
+    for job in jobs:
+        size = job[2] if len(job) > 2 else None
+        if size is None:
+            try:
+                size = os.path.getsize(job[0])
+            except OSError:
+                continue
+        total += size
+    return total
+
+
+def interleave(jobs):
+    """
+    디렉토리(시퀀스)별로 묶은 뒤 round-robin 으로 섞음.
+    → worker 들이 같은 시퀀스 한 곳만 읽지 않고 여러 시퀀스를 동시에 읽음
+    """
+    groups: "OrderedDict[str, list]" = OrderedDict()
+    for job in jobs:
+        groups.setdefault(os.path.dirname(job[0]), []).append(job)
+
+    queues = [iter(g) for g in groups.values()]
+    out = []
+    while queues:
+        alive = []
+        for q in queues:
+            job = next(q, None)
+            if job is not None:
+                out.append(job)
+                alive.append(q)
+        queues = alive
+    return out
+
+
+def copy_file(
+    src: str,
+    dst: str,
+    stats: CopyStats,
+    cancel: threading.Event,
+    buffer_size: int = DEFAULT_BUFFER,
+    hashes=DEFAULT_HASHES,
+    throttle=None,
+):
+    """
+    파일 1개 복사 (copy_scheduler worker thread).
+    throttle(nbytes): 대역폭 제한용 — 버퍼마다 호출, 필요하면 block
+    dst 는 다 쓴 뒤에만 교체 (CHANGED 재복사가 실패해도 이전 파일 유지)
+    """
+    if cancel.is_set():
+        raise CopyCancelled()
+
+    hashers = new_hashers(hashes)
+    part = dst + ".part"
+    try:
+        with open(src, "rb") as fsrc, open(part, "wb") as fdst:
+            while True:
+                if cancel.is_set():
+                    raise CopyCancelled()
+                buf = fsrc.read(buffer_size)
+                if not buf:
+                    break
+                if throttle:
+                    throttle(len(buf))
+                fdst.write(buf)
+                update_all(hashers, buf)
+                stats.add_bytes(len(buf))
+        shutil.copystat(src, part)
+        os.replace(part, dst)
+    except BaseException:
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+        raise
+
+    stats.file_done(dst, hexdigests(hashers))
+
@@ -0,0 +1,403 @@
+"""
+core/io/copy_scheduler.py
+
+- 프로세스 공용 복사 스케줄러 (collect / ingest / delivery 가 같은 NAS 를 나눠 씀)
+    - job 별 priority (높은 job 의 파일부터 worker 배정)
+    - 전체 bytes/s 상한 (token bucket) → 아티스트 재생 대역폭 보호
+    - volume(mount point) 별 동시 복사 수 제한
+    - job 별 동시 복사 수 제한
+    - 실시간 통계 (job 진행률, 전체 처리량, volume 별 활성 복사 수)
+- 파일 복사 자체는 copy_engine.copy_file (hash / 취소 / 반쪽 파일 삭제 동일)
+
+설정 (환경변수):
+    SKYFALL_COPY_WORKERS      전체 worker thread 수 (기본 8)
+    SKYFALL_COPY_BPS          전체 상한, 예: 200M / 1.5G / 0(무제한, 기본)
+    SKYFALL_COPY_PER_VOLUME   volume 별 동시 복사 수 (기본 4)
+    SKYFALL_COPY_PROCESSES    같은 상한을 나눠 쓰는 프로세스 수 (기본 1)
+
+    job = get_scheduler().submit(jobs, priority=PRIORITY_BACKGROUND, name="collect BBF_0010")
+    stats = job.wait(progress=cb, is_cancelled=task.isCancelled)
+
+scheduler 는 프로세스마다 1개 (Nuke 세션 / headless worker process 각각).
+여러 프로세스가 동시에 복사하면 (headless collect 의 ProcessPoolExecutor 등)
+set_process_share(n) 으로 상한 / volume 제한을 n 등분 → 합계가 설정값을 넘지 않음.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from core.io.copy_engine import (
+    DEFAULT_BUFFER,
+    DEFAULT_WORKERS,
+    CopyCancelled,
+    CopyStats,
+    copy_file,
+    interleave,
+    total_size,
+)
+from core.io.hashlist import DEFAULT_HASHES
+
+PRIORITY_INTERACTIVE = 100   # 아티스트가 기다리는 작업 (Nuke collect 등)
+PRIORITY_NORMAL = 50
+PRIORITY_BACKGROUND = 10     # headless 아카이브 / 야간 delivery
+
+_PROGRESS_INTERVAL = 0.25
+_RATE_WINDOW = 5.0
+
+_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_bytes_rate(text: str | None) -> float:
+    """'200M' / '1.5G' / '500000' → bytes/s (0 = 무제한)"""
+    if not text:
+        return 0.0
+    text = text.strip().upper().rstrip("/S").rstrip("B")
+    unit = text[-1] if text and text[-1] in _UNITS else ""
+    try:
+        return float(text[: len(text) - len(unit)] if unit else text) * _UNITS[unit]
+    except ValueError:
+        return 0.0
+
+
+DEFAULT_BPS = parse_bytes_rate(os.getenv("SKYFALL_COPY_BPS"))
+DEFAULT_PER_VOLUME = int(os.getenv("SKYFALL_COPY_PER_VOLUME", "4"))
+DEFAULT_PROCESSES = int(os.getenv("SKYFALL_COPY_PROCESSES", "1"))
+
+
+# ------------------------------------------------------------
+# volume (mount point)
+# ------------------------------------------------------------
+_volume_cache: dict[str, str] = {}
+_volume_lock = threading.Lock()
+
+
+def volume_of(path: str) -> str:
+    """경로가 속한 mount point (/Volumes/skyfall 등). 아직 없는 경로는 존재하는 상위 기준"""
+    folder = os.path.dirname(os.path.abspath(path))
+    with _volume_lock:
+        cached = _volume_cache.get(folder)
+    if cached:
+        return cached
+
+    probe = folder
+    while not os.path.exists(probe) and os.path.dirname(probe) != probe:
+        probe = os.path.dirname(probe)
+    while not os.path.ismount(probe) and os.path.dirname(probe) != probe:
+        probe = os.path.dirname(probe)
+
+    with _volume_lock:
+        _volume_cache[folder] = probe
+    return probe
+
+
+# ------------------------------------------------------------
+# 대역폭 상한 (token bucket)
+# ------------------------------------------------------------
+class RateLimiter:
+    def __init__(self, bytes_per_sec: float = 0.0, burst_seconds: float = 0.5):
+        self._lock = threading.Lock()
+        self.burst_seconds = burst_seconds
+        self.set_rate(bytes_per_sec)
+
+    def set_rate(self, bytes_per_sec: float):
+        """실행 중에도 변경 가능 (낮에는 낮게, 밤에는 무제한 등)"""
+        with self._lock:
+            self.rate = max(0.0, float(bytes_per_sec))
+            self._tokens = self.rate * self.burst_seconds
+            self._stamp = time.monotonic()
+
+    def acquire(self, n: int, cancel: threading.Event | None = None):
+        """
+        n bytes 를 쓸 수 있을 때까지 대기 (상한 0 이면 바로 반환).
+        cancel 이 set 되면 대기 중에도 바로 CopyCancelled (예약한 만큼 반납)
+        """
+        with self._lock:
+            if self.rate <= 0:
+                return
+            now = time.monotonic()
+            capacity = self.rate * self.burst_seconds
+            self._tokens = min(capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # 먼저 예약하고 (음수 허용) 모자란 만큼 밖에서 sleep → 순서 공정
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait <= 0:
+            return
+        if cancel is None:
+            time.sleep(wait)
+        elif cancel.wait(wait):
+            with self._lock:
+                self._tokens += n
+            raise CopyCancelled()
+
+
+# ------------------------------------------------------------
+# Job
+# ------------------------------------------------------------
+class CopyJob:
+    """submit() 이 돌려주는 handle"""
+
+    def __init__(self, scheduler, jobs, priority, name, max_workers, hashes, seq, total_bytes=None):
+        self.scheduler = scheduler
+        self.priority = priority
+        self.name = name
+        self.max_workers = max(1, max_workers) if max_workers else None
+        self.hashes = tuple(hashes)
+        self.seq = seq
+
+        if total_bytes is None:
+            total_bytes = total_size(jobs)
+        self.stats = CopyStats(len(jobs), total_bytes)
+        self.pending = deque(jobs)
+        self.inflight = 0
+        self.cancel_event = threading.Event()
+        self.done = threading.Event()
+        if not jobs:
+            self._finish()
+
+    def _finish(self):
+        self.stats.finished = time.time()
+        self.done.set()
+
+    @property
+    def state(self) -> str:
+        if self.done.is_set():
+            return "cancelled" if self.stats.cancelled else "done"
+        return "running" if self.inflight else "queued"
+
+    def cancel(self):
+        self.scheduler.cancel(self)
+
+    def wait(self, progress=None, is_cancelled=None) -> CopyStats:
+        """
+        끝날 때까지 호출한 thread 에서 대기 (ProgressTask 갱신용).
+        progress(stats) 주기적 호출, is_cancelled() 가 True 면 job 취소
+        """
+        while not self.done.wait(_PROGRESS_INTERVAL):
+            if is_cancelled and is_cancelled() and not self.cancel_event.is_set():
+                self.cancel()
+            if progress:
+                progress(self.stats)
+        if progress:
+            progress(self.stats)
+        return self.stats
+
+
+# ------------------------------------------------------------
+# Scheduler
+# ------------------------------------------------------------
+class CopyScheduler:
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        bytes_per_sec: float = DEFAULT_BPS,
+        per_volume: int = DEFAULT_PER_VOLUME,
+        buffer_size: int = DEFAULT_BUFFER,
+    ):
+        self.workers = max(1, workers)
+        self.per_volume = max(1, per_volume)
+        self.buffer_size = buffer_size
+        self.limiter = RateLimiter(bytes_per_sec)
+
+        self._cond = threading.Condition()
+        self._jobs: list[CopyJob] = []
+        self._volumes: dict[str, int] = {}
+        self._threads: list[threading.Thread] = []
+        self._seq = 0
+        self._samples = deque()
+        self._samples_lock = threading.Lock()
+
+    # --------------------------------------------------------
+    # submit / cancel
+    # --------------------------------------------------------
+    def submit(
+        self,
+        jobs,
+        priority: int = PRIORITY_NORMAL,
+        name: str = "copy",
+        max_workers: int | None = None,
+        hashes=DEFAULT_HASHES,
+    ) -> CopyJob:
+        """
+        jobs: [(src, dst), ...] 또는 [(src, dst, size), ...]  (dst 디렉토리는 미리 만들어져 있어야 함)
+        size 를 주면 파일마다 다시 stat 하지 않음 (collect plan 의 listing 결과)
+        같은 dst 는 한 번만, 시퀀스(폴더) 간 interleave 해서 read 를 겹침
+        """
+        jobs = interleave(list({job[1]: job for job in jobs}.values()))
+        total = total_size(jobs)
+        # volume 은 여기서 (lock 밖) 미리 계산 — NAS stat 이 worker 배정을 막지 않게
+        jobs = [(job[0], job[1], frozenset((volume_of(job[0]), volume_of(job[1])))) for job in jobs]
+        with self._cond:
+            self._seq += 1
+            job = CopyJob(self, jobs, priority, name, max_workers, hashes, self._seq, total_bytes=total)
+            if not job.done.is_set():
+                self._jobs.append(job)
+                self._jobs.sort(key=lambda j: (-j.priority, j.seq))
+            self._start_workers()
+            self._cond.notify_all()
+        return job
+
+    def cancel(self, job: CopyJob):
+        with self._cond:
+            job.cancel_event.set()
+            job.stats.cancelled = True
+            job.pending.clear()
+            if job.inflight == 0 and not job.done.is_set():
+                self._retire(job)
+            self._cond.notify_all()
+
+    def set_rate(self, bytes_per_sec: float):
+        self.limiter.set_rate(bytes_per_sec)
+
+    # --------------------------------------------------------
+    # worker
+    # --------------------------------------------------------
+    def _start_workers(self):
+        while len(self._threads) < self.workers:
+            t = threading.Thread(
+                target=self._worker,
+                name=f"skyfall-copy-{len(self._threads)}",
+                daemon=True,
+            )
+            self._threads.append(t)
+            t.start()
+
+    def _retire(self, job: CopyJob):
+        if job in self._jobs:
+            self._jobs.remove(job)
+        job._finish()
+
+    def _next_task(self):
+        """priority 순으로 훑어서 volume / job 제한에 안 걸리는 첫 파일 (lock 안에서 호출)"""
+        for job in self._jobs:
+            if not job.pending:
+                continue
+            if job.max_workers and job.inflight >= job.max_workers:
+                continue
+            src, dst, volumes = job.pending[0]
+            if any(self._volumes.get(v, 0) >= self.per_volume for v in volumes):
+                continue
+            job.pending.popleft()
+            job.inflight += 1
+            for v in volumes:
+                self._volumes[v] = self._volumes.get(v, 0) + 1
+            return job, src, dst, volumes
+        return None
+
+    def _throttle(self, n: int, cancel: threading.Event | None = None):
+        self.limiter.acquire(n, cancel)
+        now = time.monotonic()
+        with self._samples_lock:
+            self._samples.append((now, n))
+            while self._samples and now - self._samples[0][0] > _RATE_WINDOW:
+                self._samples.popleft()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None:
+                    self._cond.wait()
+                    task = self._next_task()
+            job, src, dst, volumes = task
+
+            try:
+                copy_file(
+                    src, dst, job.stats, job.cancel_event,
+                    self.buffer_size, job.hashes,
+                    throttle=lambda n: self._throttle(n, job.cancel_event),
+                )
+            except CopyCancelled:
+                pass
+            except Exception as e:
+                job.stats.add_error(src, str(e))
+
+            with self._cond:
+                job.inflight -= 1
+                for v in volumes:
+                    self._volumes[v] -= 1
+                    if self._volumes[v] <= 0:
+                        del self._volumes[v]
+                if not job.pending and job.inflight == 0 and not job.done.is_set():
+                    self._retire(job)
+                self._cond.notify_all()
+
+    # --------------------------------------------------------
+    # 통계
+    # --------------------------------------------------------
+    @property
+    def bytes_per_sec(self) -> float:
+        """최근 몇 초 전체 처리량"""
+        now = time.monotonic()
+        with self._samples_lock:
+            recent = sum(n for t, n in self._samples if now - t <= _RATE_WINDOW)
+        return recent / _RATE_WINDOW
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            jobs = list(self._jobs)
+            volumes = dict(self._volumes)
+        return {
+            "rate_limit": self.limiter.rate,
+            "bytes_per_sec": self.bytes_per_sec,
+            "workers": self.workers,
+            "per_volume": self.per_volume,
+            "volumes": volumes,
+            "jobs": [
+                {
+                    "name": j.name,
+                    "priority": j.priority,
+                    "state": j.state,
+                    "files_done": j.stats.files_done,
+                    "total_files": j.stats.total_files,
+                    "percent": j.stats.percent,
+                    "mb_per_sec": round(j.stats.mb_per_sec, 1),
+                    "errors": len(j.stats.errors),
+                }
+                for j in jobs
+            ],
+        }
+
+    def summary(self) -> str:
+        snap = self.snapshot()
+        limit = snap["rate_limit"]
+        limit_text = f"{limit / (1024 * 1024):.0f} MB/s" if limit else "unlimited"
+        return (
+            f"{len(snap['jobs'])} job(s), {snap['bytes_per_sec'] / (1024 * 1024):.1f} MB/s "
+            f"(limit {limit_text}), volumes {snap['volumes']}"
+        )
+
+
+# ------------------------------------------------------------
+# 공용 인스턴스
+# ------------------------------------------------------------
+_scheduler = None
+_scheduler_lock = threading.Lock()
+_process_share = max(1, DEFAULT_PROCESSES)
+
+
+def set_process_share(processes: int):
+    """
+    이 프로세스가 전체 상한의 1/processes 만 쓰도록 (get_scheduler() 전에 호출).
+    ProcessPoolExecutor(initializer=set_process_share, initargs=(n,)) 로 worker 마다 설정
+    volume 제한은 최소 1 — processes 가 SKYFALL_COPY_PER_VOLUME 보다 많으면 그만큼 넘음
+    """
+    global _process_share
+    with _scheduler_lock:
+        _process_share = max(1, int(processes))
+        if _scheduler is not None:
+            _scheduler.per_volume = max(1, DEFAULT_PER_VOLUME // _process_share)
+            _scheduler.set_rate(DEFAULT_BPS / _process_share)
+
+
+def get_scheduler() -> CopyScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = CopyScheduler(
+                bytes_per_sec=DEFAULT_BPS / _process_share,
+                per_volume=max(1, DEFAULT_PER_VOLUME // _process_share),
+            )
+        return _scheduler
@@ -0,0 +1,208 @@
+"""
+core/io/ffmpeg_run.py
+
+- ffmpeg 실행 + -progress 스트림 파싱 (subprocess.run 대신)
+    진행 이벤트: frame / percent / 인코딩 fps / speed / 읽은·쓴 bytes
+- 끝나면 job 타이밍 (wall / CPU / 처리량) 을 JSON lines 로그에 1줄 추가
+    → dailies 대시보드 / 벤치마크에서 읽음
+- CPU 사용량 (wait4 rusage) 으로 CPU-bound / I/O-bound 대략 판별
+
+로그 위치: $SKYFALL_FFMPEG_LOG 또는 ~/.skyfall/logs/ffmpeg_jobs.jsonl
+
+    def on_progress(ev):
+        print(ev["frame"], ev["percent"], ev["fps"], ev["speed"])
+
+    timing = run_ffmpeg(cmd, on_progress=on_progress, total_frames=263,
+                        frame_bytes=[...], label="EP01_S001_0010_comp_v003")
+"""
+
+import json
+import os
+import socket
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+_STDERR_TAIL = 40
+_log_lock = threading.Lock()
+
+
+def default_log_path() -> Path:
+    env = os.getenv("SKYFALL_FFMPEG_LOG")
+    if env:
+        return Path(env)
+    return Path.home() / ".skyfall" / "logs" / "ffmpeg_jobs.jsonl"
+
+
+def with_progress(cmd: list) -> list:
+    """ffmpeg 바로 뒤에 -progress pipe:1 -nostats (기존 출력 옵션 순서는 그대로)"""
+    return [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+
+
+def _read_bytes(pid: int) -> int | None:
+    """Linux: /proc/<pid>/io 의 rchar (NAS 포함 실제 read 량). 다른 OS 는 None"""
+    try:
+        with open(f"/proc/{pid}/io", "r") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _number(value, cast=float):
+    try:
+        return cast(str(value).rstrip("x").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _event(fields: dict, total_frames, frame_bytes, started, proc_read) -> dict:
+    frame = _number(fields.get("frame"), int) or 0
+    bytes_read = proc_read
+    if bytes_read is None and frame_bytes:
+        # /proc 없으면 source 프레임 크기 누적으로 추정
+        bytes_read = sum(frame_bytes[:frame])
+    return {
+        "frame": frame,
+        "total_frames": total_frames,
+        "percent": min(100, frame * 100 // total_frames) if total_frames else None,
+        "fps": _number(fields.get("fps")),
+        "speed": _number(fields.get("speed")),
+        "out_time_us": _number(fields.get("out_time_us") or fields.get("out_time_ms"), int),
+        "bytes_written": _number(fields.get("total_size"), int),
+        "bytes_read": bytes_read,
+        "elapsed": round(time.time() - started, 3),
+        "done": fields.get("progress") == "end",
+    }
+
+
+def append_log(record: dict, log_path: str | Path | None = None):
+    """JSON lines 1줄 추가 (여러 worker 가 같은 파일에 써도 줄 단위로 안 섞임)"""
+    path = Path(log_path) if log_path else default_log_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+    with _log_lock:
+        fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+
+def read_log(log_path: str | Path | None = None, label: str | None = None) -> list[dict]:
+    path = Path(log_path) if log_path else default_log_path()
+    out = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if label is None or rec.get("label") == label:
+                    out.append(rec)
+    except OSError:
+        pass
+    return out
+
+
+def run_ffmpeg(
+    cmd: list,
+    on_progress=None,
+    total_frames: int | None = None,
+    frame_bytes: list[int] | None = None,
+    label: str | None = None,
+    threads: int | None = None,
+    log_path: str | Path | None = None,
+    log: bool = True,
+) -> dict:
+    """
+    cmd: "ffmpeg" 로 시작하는 명령 (-progress 는 여기서 추가)
+    on_progress(event): progress 블록마다 호출 (ffmpeg 기본 0.5초 간격)
+    frame_bytes: 입력 프레임 크기 목록 (/proc 가 없을 때 읽은 bytes 추정용)
+    threads: ffmpeg -threads 값 (CPU-bound 판별 기준, None = core 수)
+    반환: 타이밍 dict (로그에 기록되는 것과 같음). 실패하면 CalledProcessError (stderr 끝부분 포함)
+    """
+    started = time.time()
+    proc = subprocess.Popen(
+        with_progress(cmd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+
+    stderr_tail = deque(maxlen=_STDERR_TAIL)
+
+    def drain_stderr():
+        for line in proc.stderr:
+            stderr_tail.append(line.rstrip())
+
+    err_thread = threading.Thread(target=drain_stderr, name="ffmpeg-stderr", daemon=True)
+    err_thread.start()
+
+    last = {}
+    fields = {}
+    max_read = None
+    for line in proc.stdout:
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            continue
+        fields[key] = value
+        if key != "progress":
+            continue
+        proc_read = _read_bytes(proc.pid)
+        if proc_read is not None:
+            max_read = proc_read
+        last = _event(fields, total_frames, frame_bytes, started, max_read)
+        if on_progress:
+            on_progress(last)
+        fields = {}
+
+    # rusage 를 받으려고 Popen.wait 대신 wait4 (이 프로세스만의 CPU 시간)
+    cpu_user = cpu_sys = None
+    try:
+        _pid, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        cpu_user, cpu_sys = usage.ru_utime, usage.ru_stime
+    except (AttributeError, ChildProcessError):
+        proc.wait()
+    err_thread.join(timeout=5)
+
+    wall = max(time.time() - started, 1e-6)
+    frames = last.get("frame") or 0
+    bytes_read = last.get("bytes_read")
+    cpu = (cpu_user or 0) + (cpu_sys or 0) if cpu_user is not None else None
+    cores = threads or os.cpu_count() or 1
+    cpu_util = round(cpu / wall, 2) if cpu is not None else None
+
+    timing = {
+        "label": label,
+        "host": socket.gethostname(),
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "returncode": proc.returncode,
+        "wall": round(wall, 3),
+        "cpu_user": round(cpu_user, 3) if cpu_user is not None else None,
+        "cpu_sys": round(cpu_sys, 3) if cpu_sys is not None else None,
+        # 평균 사용 core 수 — -threads / core 수의 절반도 못 쓰면 대부분 입력 대기 (NAS / EXR decode I/O)
+        "cpu_util": cpu_util,
+        "bound": None if cpu_util is None else ("cpu" if cpu_util >= 0.5 * min(cores, os.cpu_count() or 1) else "io"),
+        "frames": frames,
+        "total_frames": total_frames,
+        "avg_fps": round(frames / wall, 2),
+        "speed": last.get("speed"),
+        "bytes_read": bytes_read,
+        "bytes_written": last.get("bytes_written"),
+        "read_mb_s": round(bytes_read / wall / (1024 * 1024), 1) if bytes_read else None,
+        "cmd": " ".join(str(c) for c in cmd),
+    }
+    if log:
+        append_log(timing, log_path)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr="\n".join(stderr_tail))
+    return timing
@@ -0,0 +1,142 @@
+"""
+core/io/frame_pattern.py
+
+- file knob 값 (시퀀스 경로 패턴) 을 한 번만 파싱해서 프레임 경로로 전개
+- 지원 토큰:
+    %04d / %d     (Nuke / ffmpeg printf)
+    ####          (Nuke hash — '#' 1개 = 1자리)
+    $F4 / $F      (Houdini)
+    @@@@          (Shake / RV)
+- collectFiles / preview / delivery 가 같은 객체 사용
+
+    fp = FramePattern("/plates/A_v001/A_v001.%04d.exr")
+    fp.path(1001)                # ".../A_v001.1001.exr"
+    fp.expand(1001, 1100)        # [(1001, ".../A_v001.1001.exr"), ...]
+    fp.printf()                  # ".../A_v001.%04d.exr"  (ffmpeg 입력용)
+"""
+
+import re
+
+from core.io.frame_set import FrameSet
+
+# 파일명(마지막 path 요소) 안의 마지막 프레임 토큰
+# @ 는 확장자 / 프레임 구분자 (. _ -) 바로 앞일 때만 (logo@2x.png 같은 일반 파일명 제외)
+_TOKEN_RE = re.compile(
+    r"%0?(?P<printf>\d*)d|(?P<hash>#+)|\$F(?P<houdini>\d*)|(?P<at>@+)(?=[._\-]|$)"
+)
+
+PRINTF = "printf"
+HASH = "hash"
+HOUDINI = "houdini"
+AT = "at"
+
+
+class FramePattern:
+    __slots__ = ("pattern", "head", "tail", "padding", "style", "_name_re")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.head = pattern
+        self.tail = ""
+        self.padding = 0
+        self.style = None
+        self._name_re = None
+
+        slash = pattern.rfind("/") + 1
+        match = None
+        for match in _TOKEN_RE.finditer(pattern, slash):
+            pass
+        if match is None:
+            return
+
+        self.head = pattern[:match.start()]
+        self.tail = pattern[match.end():]
+        if match.group("hash"):
+            self.style, self.padding = HASH, len(match.group("hash"))
+        elif match.group("at"):
+            self.style, self.padding = AT, len(match.group("at"))
+        elif match.group("houdini") is not None:
+            self.style, self.padding = HOUDINI, int(match.group("houdini") or 1)
+        else:
+            self.style, self.padding = PRINTF, int(match.group("printf") or 1)
+
+    @classmethod
+    def from_sequence(cls, seq: dict) -> "FramePattern":
+        """sequence_scan 시퀀스 dict → FramePattern"""
+        return cls(f"{seq['folder']}/{seq['prefix']}%0{seq['padding']}d{seq['ext']}")
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    @property
+    def is_sequence(self) -> bool:
+        return self.style is not None
+
+    @property
+    def dirname(self) -> str:
+        return self.head[:self.head.rfind("/") + 1].rstrip("/")
+
+    @property
+    def basename(self) -> str:
+        return self.pattern[self.pattern.rfind("/") + 1:]
+
+    def __repr__(self) -> str:
+        return f"FramePattern('{self.pattern}')"
+
+    # --------------------------------------------------------
+    # 전개
+    # --------------------------------------------------------
+    def path(self, frame: int) -> str:
+        if self.style is None:
+            return self.pattern
+        return f"{self.head}{int(frame):0{self.padding}d}{self.tail}"
+
+    def expand(self, first: int, last: int | None = None) -> list[tuple[int, str]]:
+        """
+        프레임 범위 → [(frame, path), ...]
+        first 에 FrameSet / iterable 을 넘기면 그 프레임들만.
+        시퀀스가 아니면 [(first, pattern)] 1개.
+        """
+        if last is not None:
+            frames = FrameSet.from_range(int(first), int(last))
+        else:
+            frames = first if isinstance(first, FrameSet) else FrameSet(first)
+
+        if self.style is None:
+            return [(frames.first, self.pattern)] if frames else []
+
+        head, tail, pad = self.head, self.tail, self.padding
+        return [(f, f"{head}{f:0{pad}d}{tail}") for f in frames]
+
+    def with_dirname(self, folder: str) -> "FramePattern":
+        """같은 파일명 패턴을 다른 폴더로 (collect 대상 경로용)"""
+        return FramePattern(f"{folder.rstrip('/')}/{self.basename}")
+
+    # --------------------------------------------------------
+    # 표기 변환
+    # --------------------------------------------------------
+    def printf(self) -> str:
+        """%0Nd 표기 (Nuke Read / ffmpeg 입력)"""
+        if self.style is None:
+            return self.pattern
+        return f"{self.head}%0{self.padding}d{self.tail}"
+
+    def hashes(self) -> str:
+        if self.style is None:
+            return self.pattern
+        return f"{self.head}{'#' * self.padding}{self.tail}"
+
+    # --------------------------------------------------------
+    # 파일명 매칭 (디렉토리 listing → 프레임 번호)
+    # --------------------------------------------------------
+    def match(self, name: str) -> int | None:
+        """파일명(basename) 이 이 패턴의 프레임이면 프레임 번호, 아니면 None"""
+        if self.style is None:
+            return None
+        if self._name_re is None:
+            head = self.head[self.head.rfind("/") + 1:]
+            self._name_re = re.compile(
+                re.escape(head) + r"(-?\d{%d,})" % self.padding + re.escape(self.tail) + "$"
+            )
+        m = self._name_re.match(name)
+        return int(m.group(1)) if m else None
@@ -0,0 +1,204 @@
+"""
+core/io/frame_set.py
+
+- 프레임 집합 (FrameSet) — run-length range 로 저장
+- 내부 버퍼: 정렬된 array('q') 두 개 (range 시작 / 끝, inclusive)
+  → 연속 시퀀스는 프레임 수와 상관없이 range 1개 (메모리 고정)
+- union / difference / intersection / gaps / "1001-1100,1105-1263" 포맷
+
+NumPy 는 Nuke 번들 Python 에 항상 있지 않으므로 stdlib array 사용.
+"""
+
+from array import array
+from bisect import bisect_right
+
+
+class FrameSet:
+    """
+    불변 프레임 집합.
+
+        fs = FrameSet([1001, 1002, 1003, 1010])
+        str(fs)          # "1001-1003,1010"
+        fs.gaps()        # FrameSet("1004-1009")
+        FrameSet.parse("1001-1100,1105-1263") | other
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, frames=None):
+        self._starts = array("q")
+        self._ends = array("q")
+
+        if frames is None:
+            return
+        if isinstance(frames, str):
+            other = FrameSet.parse(frames)
+            self._starts, self._ends = other._starts, other._ends
+            return
+        if isinstance(frames, FrameSet):
+            self._starts, self._ends = array("q", frames._starts), array("q", frames._ends)
+            return
+
+        if isinstance(frames, range) and frames.step == 1:
+            if frames:
+                self._starts.append(frames.start)
+                self._ends.append(frames.stop - 1)
+            return
+
+        values = array("q", frames)
+        if not values:
+            return
+
+        values = sorted(values)
+        start = prev = values[0]
+        for f in values[1:]:
+            if f <= prev + 1:
+                if f > prev:
+                    prev = f
+                continue
+            self._starts.append(start)
+            self._ends.append(prev)
+            start = prev = f
+        self._starts.append(start)
+        self._ends.append(prev)
+
+    # --------------------------------------------------------
+    # 생성
+    # --------------------------------------------------------
+    @classmethod
+    def from_ranges(cls, ranges) -> "FrameSet":
+        """(first, last) inclusive range 들 → FrameSet (겹침/인접은 병합)"""
+        fs = cls()
+        for first, last in sorted((min(a, b), max(a, b)) for a, b in ranges):
+            if fs._ends and first <= fs._ends[-1] + 1:
+                if last > fs._ends[-1]:
+                    fs._ends[-1] = last
+            else:
+                fs._starts.append(first)
+                fs._ends.append(last)
+        return fs
+
+    @classmethod
+    def from_range(cls, first: int, last: int) -> "FrameSet":
+        return cls.from_ranges([(int(first), int(last))])
+
+    @classmethod
+    def parse(cls, text: str) -> "FrameSet":
+        """'1001-1100,1105,1110-1120' → FrameSet (음수 프레임 '-5--1' 도 허용)"""
+        ranges = []
+        for token in text.replace(" ", "").split(","):
+            if not token:
+                continue
+            sep = token.find("-", 1)
+            if sep > 0:
+                ranges.append((int(token[:sep]), int(token[sep + 1:])))
+            else:
+                ranges.append((int(token), int(token)))
+        return cls.from_ranges(ranges)
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    @property
+    def first(self) -> int | None:
+        return self._starts[0] if self._starts else None
+
+    @property
+    def last(self) -> int | None:
+        return self._ends[-1] if self._ends else None
+
+    def ranges(self) -> list[tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def range_count(self) -> int:
+        return len(self._starts)
+
+    def is_contiguous(self) -> bool:
+        return len(self._starts) <= 1
+
+    def __len__(self) -> int:
+        return sum(e - s + 1 for s, e in zip(self._starts, self._ends))
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __iter__(self):
+        for s, e in zip(self._starts, self._ends):
+            yield from range(s, e + 1)
+
+    def __contains__(self, frame) -> bool:
+        i = bisect_right(self._starts, frame) - 1
+        return i >= 0 and frame <= self._ends[i]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrameSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self):
+        return hash((bytes(self._starts), bytes(self._ends)))
+
+    def __str__(self) -> str:
+        return ",".join(
+            str(s) if s == e else f"{s}-{e}" for s, e in zip(self._starts, self._ends)
+        )
+
+    def __repr__(self) -> str:
+        return f"FrameSet('{self}')"
+
+    # --------------------------------------------------------
+    # 집합 연산 (range 단위 sweep — 프레임 수가 아니라 range 수에 비례)
+    # --------------------------------------------------------
+    def union(self, other: "FrameSet") -> "FrameSet":
+        return FrameSet.from_ranges(self.ranges() + other.ranges())
+
+    def difference(self, other: "FrameSet") -> "FrameSet":
+        out = FrameSet()
+        o_starts, o_ends = other._starts, other._ends
+        j = 0
+        for s, e in zip(self._starts, self._ends):
+            while j < len(o_ends) and o_ends[j] < s:
+                j += 1
+            k = j
+            cur = s
+            while k < len(o_starts) and o_starts[k] <= e:
+                if o_starts[k] > cur:
+                    out._starts.append(cur)
+                    out._ends.append(o_starts[k] - 1)
+                cur = max(cur, o_ends[k] + 1)
+                k += 1
+            if cur <= e:
+                out._starts.append(cur)
+                out._ends.append(e)
+        return out
+
+    def intersection(self, other: "FrameSet") -> "FrameSet":
+        out = FrameSet()
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            s = max(self._starts[i], other._starts[j])
+            e = min(self._ends[i], other._ends[j])
+            if s <= e:
+                out._starts.append(s)
+                out._ends.append(e)
+            if self._ends[i] < other._ends[j]:
+                i += 1
+            else:
+                j += 1
+        return out
+
+    __or__ = union
+    __sub__ = difference
+    __and__ = intersection
+
+    def gaps(self) -> "FrameSet":
+        """first..last 사이에 빠진 프레임"""
+        out = FrameSet()
+        for i in range(1, len(self._starts)):
+            out._starts.append(self._ends[i - 1] + 1)
+            out._ends.append(self._starts[i] - 1)
+        return out
+
+    def missing_from(self, first: int, last: int) -> "FrameSet":
+        """first..last 범위 중 이 집합에 없는 프레임"""
+        return FrameSet.from_range(first, last).difference(self)
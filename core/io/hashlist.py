@@ -0,0 +1,87 @@
+"""
+core/io/hashlist.py
+
+- 복사하면서 같은 버퍼로 checksum 계산 (복사 후 다시 읽지 않음)
+- md5 는 항상 가능, xxh64 는 xxhash 모듈 있을 때만
+- hashlist.md5 (md5sum -c 호환) 를 tmp + rename 으로 기록
+  → Spec 5: exchange/outbound/YYYYMMDD_delivery/hashlist.md5
+
+    hashers = new_hashers(("md5", "xxh64"))
+    update_all(hashers, buf)
+    digests = hexdigests(hashers)        # {"md5": "...", "xxh64": "..."}
+"""
+
+import hashlib
+import os
+
+try:
+    import xxhash
+except ImportError:  # 선택 의존성
+    xxhash = None
+
+ALGORITHMS = ("md5", "xxh64")
+# md5 는 항상 포함 (hashlist.md5 / manifest 검증용), SKYFALL_COPY_HASHES 는 추가분
+DEFAULT_HASHES = ("md5",) + tuple(
+    h for h in os.getenv("SKYFALL_COPY_HASHES", "").replace(" ", "").split(",") if h and h != "md5"
+)
+
+
+def available(name: str) -> bool:
+    if name == "md5":
+        return True
+    if name == "xxh64":
+        return xxhash is not None
+    return False
+
+
+def new_hasher(name: str):
+    if name == "md5":
+        return hashlib.md5()
+    if name == "xxh64":
+        if xxhash is None:
+            raise RuntimeError("xxhash module not available")
+        return xxhash.xxh64()
+    raise ValueError(f"Unknown hash: {name}")
+
+
+def new_hashers(names) -> dict:
+    """사용 가능한 것만 (xxhash 없으면 xxh64 는 조용히 제외)"""
+    return {n: new_hasher(n) for n in names if available(n)}
+
+
+def update_all(hashers: dict, buf):
+    for h in hashers.values():
+        h.update(buf)
+
+
+def hexdigests(hashers: dict) -> dict:
+    return {n: h.hexdigest() for n, h in hashers.items()}
+
+
+def file_digest(path: str, name: str = "md5", buffer_size: int = 8 * 1024 * 1024) -> str:
+    h = new_hasher(name)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(buffer_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ------------------------------------------------------------
+# hashlist 파일
+# ------------------------------------------------------------
+def hashlist_name(name: str = "md5") -> str:
+    return f"hashlist.{name}"
+
+
+def format_hashlist(digests: dict) -> str:
+    """{relpath: hexdigest} → 'digest  relpath' 줄 (md5sum 포맷, 경로 정렬)"""
+    return "".join(f"{digest}  {rel}\n" for rel, digest in sorted(digests.items()))
+
+
+def write_hashlist(path: str, digests: dict) -> str:
+    """원자적 기록 (tmp + rename) — 중간에 죽어도 반쪽짜리 hashlist 가 남지 않음"""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+        f.write(format_hashlist(digests))
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,313 @@
+"""
+core/io/image_headers.py
+
+- OpenEXR / DPX 헤더 리더 (외부 툴 / OpenImageIO 없이 pure python)
+- 프레임 앞부분 몇 KB 만 읽어서 해상도, 채널, 압축, 타임코드, fps 추출
+- 시퀀스 전체 헤더를 병렬로 읽는 read_sequence_headers()
+- colorspace_hint() 로 Read 노드 colorspace 추정
+"""
+
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+EXR_MAGIC = b"\x76\x2f\x31\x01"
+DPX_MAGIC_BE = b"SDPX"
+DPX_MAGIC_LE = b"XPDS"
+
+IMAGE_EXTENSIONS = (".exr", ".dpx")
+
+_EXR_FIRST_READ = 64 * 1024
+_EXR_MAX_HEADER = 4 * 1024 * 1024
+_DPX_HEADER_SIZE = 2048
+
+EXR_COMPRESSION = {
+    0: "none", 1: "rle", 2: "zips", 3: "zip", 4: "piz",
+    5: "pxr24", 6: "b44", 7: "b44a", 8: "dwaa", 9: "dwab",
+}
+EXR_PIXEL_TYPES = {0: "uint", 1: "half", 2: "float"}
+
+DPX_TRANSFER = {
+    0: "user", 1: "printing_density", 2: "linear", 3: "log",
+    4: "video", 5: "smpte_274m", 6: "rec709", 7: "rec601_625",
+    8: "rec601_525", 9: "ntsc", 10: "pal", 11: "z_linear", 12: "z_homogeneous",
+}
+
+# 대표 chromaticities (red primary 로 판별)
+_PRIMARIES = {
+    "ap0": (0.7347, 0.2653),
+    "ap1": (0.713, 0.293),
+    "rec709": (0.64, 0.33),
+}
+
+
+class HeaderError(ValueError):
+    pass
+
+
+# ------------------------------------------------------------
+# 공용
+# ------------------------------------------------------------
+def bcd_timecode(value: int, drop_frame: bool | None = None) -> str | None:
+    """SMPTE BCD (0xHHMMSSFF 형태) → HH:MM:SS:FF"""
+    if value in (0xFFFFFFFF, None):
+        return None
+
+    def bcd(byte, mask):
+        byte &= mask
+        return (byte >> 4) * 10 + (byte & 0x0F)
+
+    hh = bcd(value >> 24, 0x3F)
+    mm = bcd(value >> 16, 0x7F)
+    ss = bcd(value >> 8, 0x7F)
+    ff = bcd(value, 0x3F)
+    if drop_frame is None:
+        drop_frame = bool(value & 0x40)
+
+    return "%02d:%02d:%02d%s%02d" % (hh, mm, ss, ";" if drop_frame else ":", ff)
+
+
+# ------------------------------------------------------------
+# OpenEXR
+# ------------------------------------------------------------
+def _read_cstr(buf: bytes, pos: int) -> tuple[str, int]:
+    end = buf.index(b"\x00", pos)
+    return buf[pos:end].decode("latin-1"), end + 1
+
+
+def _exr_chlist(value: bytes) -> list[dict]:
+    channels = []
+    pos = 0
+    while pos < len(value) and value[pos] != 0:
+        name, pos = _read_cstr(value, pos)
+        ptype, _linear, xs, ys = struct.unpack("<iB3xii", value[pos:pos + 16])
+        pos += 16
+        channels.append({
+            "name": name,
+            "type": EXR_PIXEL_TYPES.get(ptype, str(ptype)),
+            "sampling": (xs, ys),
+        })
+    return channels
+
+
+def _exr_value(atype: str, value: bytes):
+    if atype == "chlist":
+        return _exr_chlist(value)
+    if atype == "compression":
+        return EXR_COMPRESSION.get(value[0], str(value[0]))
+    if atype == "box2i":
+        return struct.unpack("<4i", value)
+    if atype == "box2f":
+        return struct.unpack("<4f", value)
+    if atype in ("v2i",):
+        return struct.unpack("<2i", value)
+    if atype in ("v2f",):
+        return struct.unpack("<2f", value)
+    if atype == "float":
+        return struct.unpack("<f", value)[0]
+    if atype == "double":
+        return struct.unpack("<d", value)[0]
+    if atype == "int":
+        return struct.unpack("<i", value)[0]
+    if atype == "rational":
+        num, den = struct.unpack("<iI", value)
+        return num / den if den else None
+    if atype == "string":
+        return value.decode("utf-8", "replace")
+    if atype == "chromaticities":
+        return struct.unpack("<8f", value)
+    if atype == "timecode":
+        time_flags, _user = struct.unpack("<II", value)
+        return bcd_timecode(time_flags, bool(time_flags & 0x40))
+    if atype == "lineOrder":
+        return value[0]
+    return None
+
+
+def read_exr_header(path: str) -> dict:
+    """첫 번째 part 헤더만 파싱 (multipart / deep 도 첫 part 기준)"""
+    with open(path, "rb") as fh:
+        buf = fh.read(_EXR_FIRST_READ)
+        if buf[:4] != EXR_MAGIC:
+            raise HeaderError(f"not an OpenEXR file: {path}")
+
+        version = struct.unpack("<I", buf[4:8])[0]
+        attrs = {}
+        pos = 8
+
+        while True:
+            try:
+                if buf[pos] == 0:
+                    break
+                name, pos = _read_cstr(buf, pos)
+                atype, pos = _read_cstr(buf, pos)
+                size = struct.unpack("<i", buf[pos:pos + 4])[0]
+                pos += 4
+                if pos + size > len(buf):
+                    raise IndexError
+            except (IndexError, ValueError, struct.error):
+                # 헤더가 첫 read 보다 큼 (긴 metadata) → 더 읽고 다시 파싱
+                if len(buf) >= _EXR_MAX_HEADER:
+                    raise HeaderError(f"EXR header too large: {path}")
+                more = fh.read(len(buf))
+                if not more:
+                    raise HeaderError(f"truncated EXR header: {path}")
+                buf += more
+                attrs.clear()
+                pos = 8
+                continue
+
+            try:
+                attrs[name] = _exr_value(atype, buf[pos:pos + size])
+            except (struct.error, IndexError):
+                attrs[name] = None
+            pos += size
+
+    data_window = attrs.get("dataWindow")
+    display_window = attrs.get("displayWindow") or data_window
+    width = height = None
+    if display_window:
+        width = display_window[2] - display_window[0] + 1
+        height = display_window[3] - display_window[1] + 1
+
+    return {
+        "format": "exr",
+        "width": width,
+        "height": height,
+        "data_window": data_window,
+        "display_window": display_window,
+        "channels": [c["name"] for c in attrs.get("channels") or []],
+        "pixel_type": (attrs.get("channels") or [{}])[0].get("type"),
+        "compression": attrs.get("compression"),
+        "pixel_aspect": attrs.get("pixelAspectRatio"),
+        "timecode": attrs.get("timeCode"),
+        "fps": round(attrs["framesPerSecond"], 3) if attrs.get("framesPerSecond") else None,
+        "chromaticities": attrs.get("chromaticities"),
+        "tiled": bool(version & 0x200),
+        "multipart": bool(version & 0x1000),
+        "deep": bool(version & 0x800),
+    }
+
+
+# ------------------------------------------------------------
+# DPX (SMPTE 268M)
+# ------------------------------------------------------------
+def _dpx_float(value: float) -> float | None:
+    if value != value or value <= 0:   # NaN(0xFFFFFFFF) = undefined
+        return None
+    return round(value, 3)
+
+
+def read_dpx_header(path: str) -> dict:
+    with open(path, "rb") as fh:
+        buf = fh.read(_DPX_HEADER_SIZE)
+
+    magic = buf[:4]
+    if magic == DPX_MAGIC_BE:
+        e = ">"
+    elif magic == DPX_MAGIC_LE:
+        e = "<"
+    else:
+        raise HeaderError(f"not a DPX file: {path}")
+    if len(buf) < _DPX_HEADER_SIZE:
+        raise HeaderError(f"truncated DPX header: {path}")
+
+    width, height = struct.unpack(e + "II", buf[772:780])
+    descriptor, transfer, colorimetric, bit_depth = struct.unpack("4B", buf[800:804])
+    packing, encoding = struct.unpack(e + "HH", buf[804:808])
+
+    film_fps = _dpx_float(struct.unpack(e + "f", buf[1724:1728])[0])
+    tv_fps = _dpx_float(struct.unpack(e + "f", buf[1940:1944])[0])
+    timecode = struct.unpack(e + "I", buf[1920:1924])[0]
+
+    return {
+        "format": "dpx",
+        "width": width,
+        "height": height,
+        "bit_depth": bit_depth,
+        "descriptor": descriptor,
+        "transfer": DPX_TRANSFER.get(transfer, str(transfer)),
+        "colorimetric": DPX_TRANSFER.get(colorimetric, str(colorimetric)),
+        "packing": packing,
+        "compression": "rle" if encoding == 1 else "none",
+        "timecode": bcd_timecode(timecode, False),
+        "fps": film_fps or tv_fps,
+        "version": buf[8:16].split(b"\x00")[0].decode("latin-1"),
+    }
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def read_image_header(path: str) -> dict:
+    """확장자 → magic 순서로 판별"""
+    lower = path.lower()
+    if lower.endswith(".exr"):
+        return read_exr_header(path)
+    if lower.endswith(".dpx"):
+        return read_dpx_header(path)
+
+    with open(path, "rb") as fh:
+        magic = fh.read(4)
+    if magic == EXR_MAGIC:
+        return read_exr_header(path)
+    if magic in (DPX_MAGIC_BE, DPX_MAGIC_LE):
+        return read_dpx_header(path)
+    raise HeaderError(f"unsupported image format: {path}")
+
+
+def _safe_read(path: str) -> dict:
+    try:
+        header = read_image_header(path)
+    except (OSError, HeaderError) as e:
+        return {"path": path, "error": str(e)}
+    header["path"] = path
+    return header
+
+
+def read_sequence_headers(paths, workers: int = 8) -> list[dict]:
+    """
+    시퀀스 전체 헤더 병렬 읽기 (NAS 에서는 I/O 대기가 대부분이라 thread 로 충분).
+    입력 순서대로 반환. 실패한 프레임은 {"path", "error"}.
+    """
+    paths = list(paths)
+    if len(paths) <= 1 or workers <= 1:
+        return [_safe_read(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(_safe_read, paths))
+
+
+def colorspace_hint(header: dict | None, fallback: str = "default") -> str:
+    """헤더 정보 → Nuke Read colorspace 이름"""
+    if not header or header.get("error"):
+        return fallback
+
+    if header.get("format") == "dpx":
+        transfer = header.get("transfer")
+        if transfer in ("log", "printing_density"):
+            return "Cineon"
+        if transfer in ("rec709", "smpte_274m"):
+            return "rec709"
+        if transfer == "linear":
+            return "linear"
+        return "Cineon"
+
+    if header.get("format") == "exr":
+        chroma = header.get("chromaticities")
+        if chroma:
+            red = (round(chroma[0], 4), round(chroma[1], 4))
+            for name, primary in _PRIMARIES.items():
+                if abs(red[0] - primary[0]) < 0.002 and abs(red[1] - primary[1]) < 0.002:
+                    return {
+                        "ap0": "ACES - ACES2065-1",
+                        "ap1": "ACES - ACEScg",
+                        "rec709": "Utility - Linear - sRGB",
+                    }[name]
+        return "ACES - ACEScg"
+
+    return fallback
+
+
+def is_image_file(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
@@ -0,0 +1,283 @@
+"""
+core/io/lut_registry.py
+
+- preview / dailies 인코딩용 LUT 관리
+- 검색 위치 (앞쪽 우선):
+    shows/<SHOW>/config/luts, shows/<SHOW>/config/ocio (+ 하위 luts/)
+    $PIPELINE_ROOT/config/luts
+    $SKYFALL_LUT_PATH (os.pathsep 구분)
+- 처음 쓸 때 1번만 검증 (.cube / .3dl 파싱, 크기 / 데이터 수 / 숫자 확인)
+  → 정리된 .cube 로 변환해서 로컬 캐시에 content hash 이름으로 저장
+    ~/.skyfall/cache/luts/<sha1>.cube  ($SKYFALL_LUT_CACHE)
+  → 같은 LUT 은 다음 job 부터 파싱 / NAS 읽기 없이 캐시 파일 경로만 사용
+- show 기본 LUT: project.yml 의 preview_lut (이름 또는 경로)
+
+    registry = get_registry("BBF")
+    lut = registry.prepare(None)                 # project.yml preview_lut
+    lut = registry.prepare("show_rec709.cube")   # 이름 / 경로
+    vf = lut_filter(lut)                         # "lut3d=file='...'"
+"""
+
+import hashlib
+import math
+import os
+import threading
+from pathlib import Path
+
+from core.env.pipeline_env import SHOWS_DIR
+from core.utils.project import load_project
+
+LUT_EXTENSIONS = (".cube", ".3dl")
+_MIN_SIZE = 2
+_MAX_SIZE = 256
+
+
+class LutError(ValueError):
+    pass
+
+
+def pipeline_lut_dir() -> Path:
+    root = os.getenv("PIPELINE_ROOT")
+    base = Path(root) if root else Path(__file__).resolve().parents[2]
+    return base / "config" / "luts"
+
+
+def default_cache_dir() -> Path:
+    env = os.getenv("SKYFALL_LUT_CACHE")
+    if env:
+        return Path(env)
+    return Path.home() / ".skyfall" / "cache" / "luts"
+
+
+# ------------------------------------------------------------
+# 파싱 / 검증
+# ------------------------------------------------------------
+def _floats(parts, line_no, count=3):
+    if len(parts) != count:
+        raise LutError(f"line {line_no}: expected {count} values, got {len(parts)}")
+    try:
+        values = [float(p) for p in parts]
+    except ValueError:
+        raise LutError(f"line {line_no}: not a number: {' '.join(parts)}") from None
+    if not all(math.isfinite(v) for v in values):
+        raise LutError(f"line {line_no}: non-finite value")
+    return values
+
+
+def parse_cube(text: str) -> dict:
+    """
+    .cube (Resolve / Adobe) → {"kind": "3d"|"1d", "size", "domain_min", "domain_max", "title", "data"}
+    data: [(r, g, b), ...]  (R 가 가장 빠르게 변함 — .cube 순서 그대로)
+    """
+    lut = {"kind": None, "size": None, "title": "", "domain_min": [0.0] * 3, "domain_max": [1.0] * 3, "data": []}
+    for line_no, raw in enumerate(text.splitlines(), 1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        parts = line.split()
+        key = parts[0].upper()
+        if key == "TITLE":
+            lut["title"] = line[5:].strip().strip('"')
+        elif key in ("LUT_3D_SIZE", "LUT_1D_SIZE"):
+            if lut["kind"]:
+                raise LutError(f"line {line_no}: both LUT_1D_SIZE and LUT_3D_SIZE")
+            lut["kind"] = "3d" if key == "LUT_3D_SIZE" else "1d"
+            try:
+                lut["size"] = int(parts[1])
+            except (IndexError, ValueError):
+                raise LutError(f"line {line_no}: bad {key}") from None
+        elif key == "DOMAIN_MIN":
+            lut["domain_min"] = _floats(parts[1:], line_no)
+        elif key == "DOMAIN_MAX":
+            lut["domain_max"] = _floats(parts[1:], line_no)
+        elif key in ("LUT_3D_INPUT_RANGE", "LUT_1D_INPUT_RANGE"):
+            lo, hi = _floats(parts[1:], line_no, 2)
+            lut["domain_min"], lut["domain_max"] = [lo] * 3, [hi] * 3
+        elif key[0].isalpha():
+            # 모르는 키워드 (LUT_IN_VIDEO_RANGE 등) 는 무시
+            continue
+        else:
+            lut["data"].append(tuple(_floats(parts, line_no)))
+    return _validate(lut)
+
+
+def parse_3dl(text: str) -> dict:
+    """
+    .3dl (Lustre / Nuke) → parse_cube 와 같은 dict
+    첫 줄 = input shaper (mesh 점 개수 = size), 이후 정수 RGB (B 가 가장 빠르게 변함)
+    """
+    rows = []
+    for line_no, raw in enumerate(text.splitlines(), 1):
+        line = raw.split("#", 1)[0].strip()
+        if not line or line[0].isalpha():
+            continue
+        try:
+            rows.append([int(p) for p in line.split()])
+        except ValueError:
+            raise LutError(f"line {line_no}: not an integer row") from None
+    if not rows:
+        raise LutError("empty .3dl")
+
+    size = len(rows[0])
+    data = rows[1:]
+    if any(len(r) != 3 for r in data):
+        raise LutError(".3dl data rows must have 3 values")
+    if len(data) != size ** 3:
+        raise LutError(f".3dl has {len(data)} entries, expected {size}^3 = {size ** 3}")
+
+    # 출력 bit depth: 최대값 기준 (1023 / 4095 / 65535 …)
+    peak = max(max(r) for r in data) or 1
+    scale = float((1 << peak.bit_length()) - 1)
+    cube = [None] * len(data)
+    for i, (r, g, b) in enumerate(data):
+        ri, rem = divmod(i, size * size)
+        gi, bi = divmod(rem, size)
+        cube[(bi * size + gi) * size + ri] = (r / scale, g / scale, b / scale)
+
+    lut = {"kind": "3d", "size": size, "title": "", "domain_min": [0.0] * 3, "domain_max": [1.0] * 3, "data": cube}
+    return _validate(lut)
+
+
+def _validate(lut: dict) -> dict:
+    if not lut["kind"]:
+        raise LutError("missing LUT_3D_SIZE / LUT_1D_SIZE")
+    size = lut["size"]
+    limit = _MAX_SIZE if lut["kind"] == "3d" else 65536
+    if not _MIN_SIZE <= size <= limit:
+        raise LutError(f"LUT size {size} out of range")
+    expected = size ** 3 if lut["kind"] == "3d" else size
+    if len(lut["data"]) != expected:
+        raise LutError(f"{len(lut['data'])} entries, expected {expected}")
+    if any(lo >= hi for lo, hi in zip(lut["domain_min"], lut["domain_max"])):
+        raise LutError("DOMAIN_MIN must be below DOMAIN_MAX")
+    return lut
+
+
+def format_cube(lut: dict) -> str:
+    """정리된 .cube (주석 없음, 고정 소수점) — ffmpeg lut3d / lut1d 가 바로 읽음"""
+    lines = []
+    if lut.get("title"):
+        lines.append(f'TITLE "{lut["title"]}"')
+    lines.append(f"LUT_{lut['kind'].upper()}_SIZE {lut['size']}")
+    if lut["domain_min"] != [0.0] * 3 or lut["domain_max"] != [1.0] * 3:
+        lines.append("DOMAIN_MIN " + " ".join(f"{v:.6f}" for v in lut["domain_min"]))
+        lines.append("DOMAIN_MAX " + " ".join(f"{v:.6f}" for v in lut["domain_max"]))
+    lines.extend(f"{r:.6f} {g:.6f} {b:.6f}" for r, g, b in lut["data"])
+    return "\n".join(lines) + "\n"
+
+
+def lut_filter(lut: dict) -> str:
+    """prepare() 결과 → ffmpeg filter (3D: lut3d, 1D: lut1d)"""
+    path = str(lut["path"]).replace("\\", "/").replace("'", "'\\''")
+    return f"lut{lut['kind'][0]}d=file='{path}'"
+
+
+# ------------------------------------------------------------
+# registry
+# ------------------------------------------------------------
+class LutRegistry:
+    def __init__(self, show: str | None = None, cache_dir: str | Path | None = None):
+        self.show = show
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._lock = threading.Lock()
+        # (source path, size, mtime_ns) → prepare() 결과 (같은 프로세스 batch 에서 재사용)
+        self._prepared: dict[tuple, dict] = {}
+
+    def search_dirs(self) -> list[Path]:
+        dirs = []
+        if self.show:
+            show_config = SHOWS_DIR / self.show / "config"
+            dirs += [show_config / "luts", show_config / "ocio" / "luts", show_config / "ocio"]
+        dirs.append(pipeline_lut_dir())
+        dirs += [Path(p) for p in os.getenv("SKYFALL_LUT_PATH", "").split(os.pathsep) if p]
+        return [d for d in dirs if d.is_dir()]
+
+    def available(self) -> dict[str, Path]:
+        """{파일 이름: 경로} — 앞쪽 (show) 이 우선"""
+        found = {}
+        for folder in self.search_dirs():
+            for entry in sorted(folder.iterdir()):
+                if entry.suffix.lower() in LUT_EXTENSIONS and entry.name not in found:
+                    found[entry.name] = entry
+        return found
+
+    def default_name(self) -> str | None:
+        if not self.show:
+            return None
+        return load_project(self.show).get("preview_lut")
+
+    def resolve(self, name: str | Path | None = None) -> Path:
+        """이름 (registry 검색) / 경로 → 원본 LUT 파일. None = project.yml preview_lut"""
+        if name is None or name == "":
+            name = self.default_name()
+            if not name:
+                raise LutError(f"No LUT given and no preview_lut in project.yml ({self.show})")
+        path = Path(name)
+        if path.is_file():
+            return path
+        if not path.is_absolute():
+            for folder in self.search_dirs():
+                candidate = folder / path
+                if candidate.is_file():
+                    return candidate
+        raise LutError(f"LUT not found: {name}")
+
+    def prepare(self, name: str | Path | None = None) -> dict:
+        """
+        검증 + 캐시 변환 (처음 1번만).
+        반환: {"name", "source", "digest", "kind", "size", "path"(캐시 .cube)}
+        """
+        source = self.resolve(name)
+        st = source.stat()
+        key = (str(source.resolve()), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            hit = self._prepared.get(key)
+        if hit and Path(hit["path"]).exists():
+            return hit
+
+        raw = source.read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+        cached = self.cache_dir / f"{digest}.cube"
+        meta = {"name": source.name, "source": str(source), "digest": digest, "path": str(cached)}
+
+        if cached.exists():
+            # 다른 프로세스 / 이전 batch 가 이미 변환 — 헤더만 읽음
+            kind, size = _cached_header(cached)
+        else:
+            text = raw.decode("utf-8", errors="replace")
+            try:
+                lut = parse_3dl(text) if source.suffix.lower() == ".3dl" else parse_cube(text)
+            except LutError as e:
+                raise LutError(f"{source}: {e}") from None
+            kind, size = lut["kind"], lut["size"]
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+            tmp.write_text(format_cube(lut), encoding="utf-8")
+            os.replace(tmp, cached)
+
+        meta.update(kind=kind, size=size)
+        with self._lock:
+            self._prepared[key] = meta
+        return meta
+
+
+def _cached_header(path: Path) -> tuple[str, int]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(("LUT_3D_SIZE", "LUT_1D_SIZE")):
+                return ("3d" if "3D" in line else "1d"), int(line.split()[1])
+    raise LutError(f"corrupt cached LUT: {path}")
+
+
+# ------------------------------------------------------------
+# 공용 인스턴스 (show 별)
+# ------------------------------------------------------------
+_registries: dict[str | None, LutRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(show: str | None = None) -> LutRegistry:
+    with _registries_lock:
+        if show not in _registries:
+            _registries[show] = LutRegistry(show)
+        return _registries[show]
@@ -0,0 +1,475 @@
+"""
+core/io/media_probe.py
+
+- MOV / MP4 메타데이터 probe (fps, frame 수, 해상도, 코덱, 타임코드)
+- 전체 디코드 없이 헤더 우선으로 읽음:
+    1) QuickTime stts atom 직접 파싱   (subprocess 없음)
+    2) ffprobe stream 헤더              (nb_frames / duration)
+    3) ffprobe -count_frames            (헤더를 믿을 수 없을 때만, 전체 디코드)
+- 결과 dict 의 "method" 에 어떤 방법을 썼는지 기록
+- codec 은 항상 ffprobe codec_name (h264 / prores ...), QuickTime fourcc (avc1 / apch ...) 는 codec_tag
+"""
+
+import json
+import os
+import platform
+import struct
+import subprocess
+from pathlib import Path
+
+METHOD_STTS = "stts"
+METHOD_NB_FRAMES = "nb_frames"
+METHOD_DURATION = "duration"
+METHOD_COUNT = "count_frames"
+METHOD_DEFAULT = "default"
+
+DEFAULT_FPS = 24.0
+
+QUICKTIME_EXTENSIONS = (".mov", ".mp4", ".m4v", ".qt")
+
+# moov 가 이보다 크면 파싱하지 않고 ffprobe 로 넘김
+_MAX_MOOV_BYTES = 64 * 1024 * 1024
+
+# stsd fourcc → ffprobe codec_name (모르는 fourcc 는 소문자 fourcc)
+FOURCC_CODEC = {
+    "avc1": "h264", "avc3": "h264",
+    "hvc1": "hevc", "hev1": "hevc",
+    "apco": "prores", "apcs": "prores", "apcn": "prores", "apch": "prores", "ap4h": "prores", "ap4x": "prores",
+    "AVdn": "dnxhd", "AVdh": "dnxhd",
+    "mp4v": "mpeg4", "jpeg": "mjpeg", "mjpa": "mjpeg",
+    "png": "png", "rle": "qtrle", "raw": "rawvideo",
+    "av01": "av1", "vp09": "vp9",
+}
+
+
+def codec_from_fourcc(fourcc: str) -> str:
+    return FOURCC_CODEC.get(fourcc, fourcc.lower())
+
+
+# ------------------------------------------------------------
+# ffprobe 경로 자동 선택 (SKYFALL 번들 → PATH)
+# ------------------------------------------------------------
+def get_ffprobe_path() -> str:
+    """
+    SKYFALL ffprobe 번들 자동 선택
+    core/io/media_probe.py => ../../tools/ffprobe
+    번들이 없는 플랫폼이면 PATH 의 ffprobe 사용
+    """
+    base = Path(__file__).resolve().parents[2] / "tools" / "ffprobe"
+    sysname = platform.system().lower()
+
+    if "darwin" in sysname:
+        bundled = base / "mac" / "ffprobe"
+    elif "linux" in sysname:
+        bundled = base / "linux" / "ffprobe"
+    elif "windows" in sysname:
+        bundled = base / "win" / "ffprobe.exe"
+    else:
+        return "ffprobe"
+
+    return str(bundled) if bundled.exists() else "ffprobe"
+
+
+def parse_rate(rate: str | None) -> float | None:
+    """'24000/1001' / '25' → float. 0 또는 파싱 불가면 None."""
+    if not rate or rate in ("0/0", "N/A"):
+        return None
+    try:
+        if "/" in rate:
+            num, den = rate.split("/", 1)
+            value = float(num) / float(den)
+        else:
+            value = float(rate)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return value if value > 0 else None
+
+
+def frames_to_timecode(frame: int, fps: int, drop_frame: bool = False) -> str:
+    """프레임 번호 → HH:MM:SS:FF (drop frame 이면 마지막 구분자 ';')"""
+    if fps <= 0:
+        return ""
+
+    if drop_frame:
+        # 29.97 → 2 프레임, 59.94 → 4 프레임 드롭
+        drop = round(fps * 0.066666)
+        per_10min = fps * 600 - drop * 9
+        per_min = fps * 60 - drop
+        tens, rem = divmod(frame, per_10min)
+        frame += drop * 9 * tens
+        if rem > drop:
+            frame += drop * ((rem - drop) // per_min)
+
+    ff = frame % fps
+    total_sec = frame // fps
+    sep = ";" if drop_frame else ":"
+    return "%02d:%02d:%02d%s%02d" % (
+        (total_sec // 3600) % 24, (total_sec // 60) % 60, total_sec % 60, sep, ff
+    )
+
+
+# ------------------------------------------------------------
+# QuickTime atom 파서 (moov 만 읽음)
+# ------------------------------------------------------------
+def _iter_atoms(data: bytes, start: int = 0, end: int | None = None):
+    end = len(data) if end is None else end
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack(">Q", data[pos + 8:pos + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            return
+        yield kind, pos + header, pos + size
+        pos += size
+
+
+def _find_child(data: bytes, start: int, end: int, kind: bytes):
+    for k, body, stop in _iter_atoms(data, start, end):
+        if k == kind:
+            return body, stop
+    return None
+
+
+def _read_moov(fh) -> bytes | None:
+    """top-level atom 을 seek 으로 건너뛰며 moov 만 읽음 (mdat 는 읽지 않음)"""
+    fh.seek(0, os.SEEK_END)
+    file_size = fh.tell()
+    pos = 0
+
+    while pos + 8 <= file_size:
+        fh.seek(pos)
+        head = fh.read(16)
+        if len(head) < 8:
+            return None
+        size, kind = struct.unpack(">I4s", head[:8])
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", head[8:16])[0]
+            header = 16
+        elif size == 0:
+            size = file_size - pos
+        if size < header:
+            return None
+
+        if kind == b"moov":
+            if size > _MAX_MOOV_BYTES:
+                return None
+            fh.seek(pos)
+            return fh.read(size)
+        pos += size
+
+    return None
+
+
+def _parse_track(data: bytes, body: int, stop: int) -> dict | None:
+    mdia = _find_child(data, body, stop, b"mdia")
+    if not mdia:
+        return None
+
+    hdlr = _find_child(data, *mdia, b"hdlr")
+    mdhd = _find_child(data, *mdia, b"mdhd")
+    minf = _find_child(data, *mdia, b"minf")
+    if not (hdlr and mdhd and minf):
+        return None
+
+    handler = data[hdlr[0] + 8:hdlr[0] + 12]
+
+    version = data[mdhd[0]]
+    if version == 1:
+        timescale, duration = struct.unpack(">IQ", data[mdhd[0] + 20:mdhd[0] + 32])
+    else:
+        timescale, duration = struct.unpack(">II", data[mdhd[0] + 12:mdhd[0] + 20])
+
+    stbl = _find_child(data, *minf, b"stbl")
+    if not stbl:
+        return None
+
+    track = {
+        "handler": handler,
+        "timescale": timescale,
+        "duration": duration,
+        "stbl": stbl,
+    }
+
+    stsd = _find_child(data, *stbl, b"stsd")
+    if stsd and struct.unpack(">I", data[stsd[0] + 4:stsd[0] + 8])[0] > 0:
+        entry = stsd[0] + 8
+        track["format"] = data[entry + 4:entry + 8]
+        track["entry"] = entry
+
+    return track
+
+
+def _video_info(data: bytes, track: dict) -> dict | None:
+    stts = _find_child(data, *track["stbl"], b"stts")
+    if not stts or not track["timescale"]:
+        return None
+
+    count = struct.unpack(">I", data[stts[0] + 4:stts[0] + 8])[0]
+    frames = 0
+    total = 0
+    deltas = set()
+    for i in range(count):
+        off = stts[0] + 8 + i * 8
+        n, delta = struct.unpack(">II", data[off:off + 8])
+        frames += n
+        total += n * delta
+        deltas.add(delta)
+
+    if frames <= 0 or total <= 0:
+        return None
+
+    if len(deltas) == 1:
+        fps = track["timescale"] / deltas.pop()
+    else:
+        fps = frames * track["timescale"] / total
+
+    info = {"fps": round(fps, 3), "frames": frames}
+
+    entry = track.get("entry")
+    if entry is not None:
+        fourcc = track["format"].decode("latin-1").strip()
+        info["codec"] = codec_from_fourcc(fourcc)
+        info["codec_tag"] = fourcc
+        info["width"], info["height"] = struct.unpack(">HH", data[entry + 32:entry + 36])
+
+    return info
+
+
+def _timecode_from_track(fh, data: bytes, track: dict) -> str | None:
+    entry = track.get("entry")
+    if entry is None or track.get("format") != b"tmcd":
+        return None
+
+    flags, _timescale, _frame_dur, nb_frames = struct.unpack(">IIIB", data[entry + 20:entry + 33])
+    if not nb_frames:
+        return None
+
+    stco = _find_child(data, *track["stbl"], b"stco")
+    co64 = _find_child(data, *track["stbl"], b"co64")
+    if stco:
+        offset = struct.unpack(">I", data[stco[0] + 8:stco[0] + 12])[0]
+    elif co64:
+        offset = struct.unpack(">Q", data[co64[0] + 8:co64[0] + 16])[0]
+    else:
+        return None
+
+    fh.seek(offset)
+    raw = fh.read(4)
+    if len(raw) < 4:
+        return None
+
+    return frames_to_timecode(struct.unpack(">I", raw)[0], nb_frames, bool(flags & 0x0001))
+
+
+def read_quicktime_info(filepath: str) -> dict | None:
+    """
+    moov/trak/mdia/minf/stbl/stts 를 직접 읽어서 fps / frame 수 계산.
+    헤더가 불완전(fragmented mp4, stts 비어있음 등)하면 None.
+    """
+    try:
+        with open(filepath, "rb") as fh:
+            moov = _read_moov(fh)
+            if not moov:
+                return None
+
+            info = None
+            timecode = None
+            header = 16 if struct.unpack(">I", moov[:4])[0] == 1 else 8
+            for kind, body, stop in _iter_atoms(moov, header):
+                if kind != b"trak":
+                    continue
+                track = _parse_track(moov, body, stop)
+                if not track:
+                    continue
+                if track["handler"] == b"vide" and info is None:
+                    info = _video_info(moov, track)
+                elif track["handler"] == b"tmcd" and timecode is None:
+                    timecode = _timecode_from_track(fh, moov, track)
+    except (OSError, struct.error):
+        return None
+
+    if not info:
+        return None
+
+    info["timecode"] = timecode
+    return info
+
+
+# ------------------------------------------------------------
+# ffprobe (헤더 / 카운트)
+# ------------------------------------------------------------
+def _run_ffprobe(args: list[str], filepath: str) -> dict:
+    cmd = [get_ffprobe_path(), "-v", "error", *args, "-of", "json", filepath]
+    out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
+    return json.loads(out.decode("utf-8"))
+
+
+def probe_ffprobe_header(filepath: str) -> dict | None:
+    """
+    디코드 없이 container/stream 헤더만 읽음.
+    nb_frames 가 있으면 그대로, 없으면 CFR 일 때만 duration * fps.
+    """
+    data = _run_ffprobe([
+        "-select_streams", "v:0",
+        "-show_entries",
+        "stream=codec_name,codec_tag_string,profile,pix_fmt,width,height,r_frame_rate,avg_frame_rate,nb_frames,duration"
+        ":stream_tags=timecode:format=duration:format_tags=timecode",
+    ], filepath)
+
+    streams = data.get("streams") or []
+    if not streams:
+        return None
+
+    stream = streams[0]
+    fmt = data.get("format") or {}
+
+    r_rate = parse_rate(stream.get("r_frame_rate"))
+    avg_rate = parse_rate(stream.get("avg_frame_rate"))
+    fps = avg_rate or r_rate
+
+    info = {
+        "fps": round(fps, 3) if fps else None,
+        "frames": None,
+        "width": stream.get("width"),
+        "height": stream.get("height"),
+        "codec": stream.get("codec_name"),
+        # QuickTime fourcc (apcn / apch ...) — ProRes profile 구분용
+        "codec_tag": stream.get("codec_tag_string") if str(stream.get("codec_tag_string", "")).isalnum() else None,
+        "pix_fmt": stream.get("pix_fmt"),
+        "profile": stream.get("profile"),
+        "timecode": (stream.get("tags") or {}).get("timecode")
+        or (fmt.get("tags") or {}).get("timecode"),
+    }
+
+    nb_frames = stream.get("nb_frames")
+    if nb_frames and str(nb_frames).isdigit() and int(nb_frames) > 0:
+        info["frames"] = int(nb_frames)
+        info["method"] = METHOD_NB_FRAMES
+        return info
+
+    # VFR 이면 duration 기반 계산은 믿을 수 없음
+    cfr = r_rate and avg_rate and abs(r_rate - avg_rate) < 0.001
+    duration = stream.get("duration") or fmt.get("duration")
+    try:
+        duration = float(duration)
+    except (TypeError, ValueError):
+        duration = 0.0
+
+    if cfr and duration > 0:
+        info["frames"] = int(round(duration * fps))
+        info["method"] = METHOD_DURATION
+        return info
+
+    return info
+
+
+def probe_stream_format(filepath: str) -> dict:
+    """
+    pix_fmt / profile 만 (stts 경로는 subprocess 없이 끝나서 이 두 값이 없음).
+    dailies reel 처럼 stream copy 가능 여부를 따질 때만 사용.
+    """
+    data = _run_ffprobe([
+        "-select_streams", "v:0",
+        "-show_entries", "stream=pix_fmt,profile",
+    ], filepath)
+
+    streams = data.get("streams") or [{}]
+    return {"pix_fmt": streams[0].get("pix_fmt"), "profile": streams[0].get("profile")}
+
+
+def probe_ffprobe_count(filepath: str) -> dict | None:
+    """전체 프레임 디코드 (느림). 헤더를 믿을 수 없을 때만 사용."""
+    data = _run_ffprobe([
+        "-select_streams", "v:0",
+        "-count_frames",
+        "-show_entries", "stream=nb_read_frames,r_frame_rate",
+    ], filepath)
+
+    streams = data.get("streams") or []
+    if not streams:
+        return None
+
+    stream = streams[0]
+    try:
+        frames = int(stream["nb_read_frames"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    fps = parse_rate(stream.get("r_frame_rate"))
+    return {
+        "fps": round(fps, 3) if fps else None,
+        "frames": frames,
+        "method": METHOD_COUNT,
+    }
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def probe_mov(filepath: str) -> dict:
+    """
+    MOV/MP4 probe. 항상 dict 를 반환:
+      fps, frames, width, height, codec, codec_tag, timecode, method, error
+      (ffprobe 헤더를 읽었으면 pix_fmt / profile 도)
+    모든 방법이 실패하면 method="default" (24fps, 1 frame) + error 메시지.
+    """
+    result = {
+        "fps": None,
+        "frames": None,
+        "width": None,
+        "height": None,
+        "codec": None,
+        "codec_tag": None,
+        "timecode": None,
+        "method": None,
+        "error": None,
+    }
+
+    # 1) stts 직접 파싱
+    if filepath.lower().endswith(QUICKTIME_EXTENSIONS):
+        info = read_quicktime_info(filepath)
+        if info and info.get("frames") and info.get("fps"):
+            result.update(info)
+            result["method"] = METHOD_STTS
+            return result
+
+    # 2) ffprobe 헤더
+    try:
+        info = probe_ffprobe_header(filepath)
+    except Exception as e:
+        result["error"] = str(e)
+        info = None
+
+    if info:
+        result.update({k: v for k, v in info.items() if v is not None})
+        if info.get("frames") and info.get("fps"):
+            return result
+
+    # 3) 헤더가 불완전할 때만 카운트
+    try:
+        counted = probe_ffprobe_count(filepath)
+    except Exception as e:
+        result["error"] = str(e)
+        counted = None
+
+    if counted and counted.get("frames"):
+        result["frames"] = counted["frames"]
+        result["fps"] = result["fps"] or counted["fps"]
+        result["method"] = METHOD_COUNT
+        result["error"] = None
+
+    if not result["frames"] or not result["fps"]:
+        result["fps"] = result["fps"] or DEFAULT_FPS
+        result["frames"] = result["frames"] or 1
+        result["method"] = METHOD_DEFAULT
+        result["error"] = result["error"] or "no usable frame count in header or stream"
+
+    return result
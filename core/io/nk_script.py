@@ -0,0 +1,182 @@
+"""
+core/io/nk_script.py
+
+- Nuke 없이 .nk 텍스트를 직접 파싱 (headless collect / 배치 툴용)
+- 노드 블록 (Class { ... }) 과 1줄짜리 knob 값만 읽음
+  → file / first / last 등 경로·범위 knob 은 항상 1줄
+- Group / end_group, 여러 줄짜리 knob ({...} / "...") 은 brace depth 로 건너뜀
+- file knob 값만 바꿔서 다시 쓰기 (나머지 줄은 원본 그대로)
+
+노드 dict:
+    {
+        "class": "Read",
+        "name":  "Read1",
+        "knobs": {"file": "/plates/A.%04d.exr", "first": "1001", ...},
+        "lines": {"file": 812, ...},        # knob 이 있는 줄 번호 (0-base)
+    }
+"""
+
+import re
+
+# Write 계열은 출력 경로라서 collect 대상 아님 (Nuke 세션에서는 'Render' knob 으로 구분)
+WRITE_CLASS_PREFIXES = ("Write", "DeepWrite")
+
+_NODE_START_RE = re.compile(r"^\s*([A-Za-z_][\w.]*)\s*\{\s*$")
+_KNOB_RE = re.compile(r"^\s*([A-Za-z_][\w.]*)\s+(.*?)\s*$")
+_BARE_SAFE_RE = re.compile(r"^[^\s{}\[\]\"$\\;]+$")
+
+
+# ------------------------------------------------------------
+# TCL 값
+# ------------------------------------------------------------
+def _brace_delta(line: str) -> int:
+    """줄 안의 { } 증감 (\\ escape, "..." 안은 무시)"""
+    delta = 0
+    in_quote = False
+    i = 0
+    while i < len(line):
+        ch = line[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == '"' and delta <= 0:
+            in_quote = not in_quote
+        elif not in_quote:
+            if ch == "{":
+                delta += 1
+            elif ch == "}":
+                delta -= 1
+        i += 1
+    return delta
+
+
+def parse_value(text: str) -> str | None:
+    """knob 값 토큰 1개 → 문자열. 줄 안에서 끝나지 않으면 None"""
+    if not text:
+        return ""
+
+    if text[0] == "{":
+        depth = 0
+        for i, ch in enumerate(text):
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[1:i]
+        return None
+
+    if text[0] == '"':
+        out = []
+        i = 1
+        while i < len(text):
+            ch = text[i]
+            if ch == "\\" and i + 1 < len(text):
+                out.append(text[i + 1])
+                i += 2
+                continue
+            if ch == '"':
+                return "".join(out)
+            out.append(ch)
+            i += 1
+        return None
+
+    return text.split()[0]
+
+
+def quote_value(value: str) -> str:
+    """문자열 → .nk 에 쓸 TCL 토큰 ({...} 안은 치환 없음 → [file dirname ...] 표현식 유지)"""
+    if _BARE_SAFE_RE.match(value):
+        return value
+    if "\\" not in value and _brace_delta(value) == 0 and "{" not in value:
+        return "{" + value + "}"
+    escaped = re.sub(r'([\\"\[\]$])', r"\\\1", value)
+    return f'"{escaped}"'
+
+
+# ------------------------------------------------------------
+# 파싱
+# ------------------------------------------------------------
+def parse_nodes(lines: list[str]) -> list[dict]:
+    nodes = []
+    node = None
+    depth = 0
+
+    for idx, line in enumerate(lines):
+        if node is None:
+            m = _NODE_START_RE.match(line)
+            if m and depth == 0:
+                node = {"class": m.group(1), "name": None, "knobs": {}, "lines": {}}
+                depth = 1
+            continue
+
+        # node 블록 안 — depth 1 에서 시작하는 줄만 knob
+        if depth == 1:
+            m = _KNOB_RE.match(line)
+            if m and m.group(1) != "}":
+                value = parse_value(m.group(2))
+                if value is not None:
+                    node["knobs"][m.group(1)] = value
+                    node["lines"][m.group(1)] = idx
+
+        depth += _brace_delta(line)
+        if depth <= 0:
+            node["name"] = node["knobs"].get("name")
+            nodes.append(node)
+            node = None
+            depth = 0
+
+    return nodes
+
+
+def read_script(path: str) -> tuple[list[str], list[dict]]:
+    with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+        lines = f.read().splitlines(keepends=True)
+    return lines, parse_nodes(lines)
+
+
+def is_write(node: dict) -> bool:
+    return node["class"].startswith(WRITE_CLASS_PREFIXES)
+
+
+def _int_knob(node: dict, knob: str):
+    """first / last — 표현식 ({{parent.first}}) 이면 None"""
+    try:
+        return int(float(node["knobs"][knob]))
+    except (KeyError, ValueError):
+        return None
+
+
+def media_nodes(nodes: list[dict]) -> list[dict]:
+    """
+    collect 대상: file knob 이 있고 Write 가 아닌 모든 노드 (Read / ReadGeo / DeepRead / Camera ...).
+    반환 dict: node, file, first, last, line
+    """
+    out = []
+    for node in nodes:
+        path = node["knobs"].get("file", "")
+        if not path or is_write(node):
+            continue
+        out.append({
+            "node": node,
+            "file": path,
+            "first": _int_knob(node, "first"),
+            "last": _int_knob(node, "last"),
+            "line": node["lines"]["file"],
+        })
+    return out
+
+
+# ------------------------------------------------------------
+# 다시 쓰기
+# ------------------------------------------------------------
+def replace_knob_values(lines: list[str], replacements: dict) -> str:
+    """{줄 번호: 새 값} → 해당 줄의 knob 값만 교체한 스크립트 텍스트"""
+    out = list(lines)
+    for idx, value in replacements.items():
+        line = out[idx]
+        m = _KNOB_RE.match(line)
+        indent = line[: len(line) - len(line.lstrip())]
+        ending = line[len(line.rstrip("\r\n")):]
+        out[idx] = f"{indent}{m.group(1)} {quote_value(value)}{ending}"
+    return "".join(out)
@@ -0,0 +1,233 @@
+"""
+core/io/probe_cache.py
+
+- media probe 결과 캐시 (SQLite)
+- key: (path, size, mtime) → fps, frames, width, height, codec, timecode
+- MOV 는 media_probe, EXR / DPX 프레임은 image_headers 로 probe
+- 파일이 바뀌면 (size / mtime 불일치) 자동으로 다시 probe
+- ingest warm-up (tools/ingest/probe_warmup.py) 이 채우고
+  Nuke Load Plate / dailies reel 이 읽음, preview 는 결과 MOV 를 등록
+
+기본 위치: $SKYFALL_PROBE_CACHE 또는 공용 $SKYFALL_ROOT/cache/media_probe.sqlite3
+  → ingest 장비가 채운 캐시를 아티스트 Nuke 세션에서도 씀
+  공용 위치에 쓸 수 없으면 ~/.skyfall/cache/media_probe.sqlite3 (이 사용자만)
+NAS 위 SQLite 는 WAL (공유 메모리) 이 안 되므로 로컬 파일만 WAL, 나머지는 rollback journal
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.env.pipeline_env import SHOWS_DIR
+from core.io.image_headers import HeaderError, colorspace_hint, is_image_file, read_image_header
+from core.io.media_probe import DEFAULT_FPS, METHOD_DEFAULT, METHOD_STTS, codec_from_fourcc, probe_mov
+
+VIDEO_EXTENSIONS = (".mov", ".mp4", ".m4v", ".qt", ".mxf", ".avi")
+
+_COLUMNS = ("fps", "frames", "width", "height", "codec", "timecode", "method")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_probe (
+    path      TEXT PRIMARY KEY,
+    size      INTEGER NOT NULL,
+    mtime_ns  INTEGER NOT NULL,
+    fps       REAL,
+    frames    INTEGER,
+    width     INTEGER,
+    height    INTEGER,
+    codec     TEXT,
+    timecode  TEXT,
+    method    TEXT,
+    extra     TEXT,
+    probed_at REAL
+)
+"""
+
+
+def shared_cache_path() -> Path:
+    """스튜디오 공용 위치 ($SKYFALL_ROOT/cache, shows/ 옆)"""
+    return SHOWS_DIR.parent / "cache" / "media_probe.sqlite3"
+
+
+def local_cache_path() -> Path:
+    return Path.home() / ".skyfall" / "cache" / "media_probe.sqlite3"
+
+
+def default_cache_path() -> Path:
+    env = os.getenv("SKYFALL_PROBE_CACHE")
+    if env:
+        return Path(env)
+    folder = shared_cache_path().parent
+    writable = folder if folder.exists() else folder.parent
+    if os.access(writable, os.W_OK):
+        return shared_cache_path()
+    return local_cache_path()
+
+
+def _normalize(path: str | Path) -> str:
+    return os.path.abspath(str(path)).replace(os.sep, "/")
+
+
+class ProbeCache:
+    """
+    스레드 안전한 SQLite probe 캐시.
+
+        cache = ProbeCache()
+        info = cache.probe("/Volumes/skyfall/.../plate.mov")
+    """
+
+    def __init__(self, db_path: str | Path | None = None):
+        self.db_path = Path(db_path) if db_path else default_cache_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        # WAL 은 같은 호스트에서만 안전 → 공용 (NAS) 파일은 rollback journal
+        journal = "WAL" if self.is_local else "DELETE"
+        self._conn.execute(f"PRAGMA journal_mode={journal}")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @property
+    def is_local(self) -> bool:
+        """이 사용자 전용 로컬 캐시 (다른 장비 / 계정과 공유되지 않음)"""
+        return self.db_path == local_cache_path()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --------------------------------------------------------
+    # lookup / store
+    # --------------------------------------------------------
+    def get(self, path: str | Path, stat: os.stat_result | None = None) -> dict | None:
+        """캐시 hit 이면 dict, 파일이 없거나 변경됐으면 None"""
+        key = _normalize(path)
+        try:
+            st = stat or os.stat(key)
+        except OSError:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, fps, frames, width, height, codec, timecode, method, extra "
+                "FROM media_probe WHERE path = ?",
+                (key,),
+            ).fetchone()
+
+        if not row or row[0] != st.st_size or row[1] != st.st_mtime_ns:
+            return None
+
+        info = dict(zip(_COLUMNS, row[2:9]))
+        if row[9]:
+            info.update(json.loads(row[9]))
+        if info["method"] == METHOD_STTS and not info.get("codec_tag") and info["codec"]:
+            # 예전 stts 결과는 codec 에 fourcc 를 저장했음 → codec_name / codec_tag 로
+            info["codec_tag"] = info["codec"]
+            info["codec"] = codec_from_fourcc(info["codec"])
+        info["error"] = None
+        info["cached"] = True
+        return info
+
+    def put(self, path: str | Path, info: dict, stat: os.stat_result | None = None):
+        key = _normalize(path)
+        st = stat or os.stat(key)
+
+        extra = {
+            k: v for k, v in info.items()
+            if k not in _COLUMNS and k not in ("error", "cached") and v is not None
+        }
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO media_probe "
+                "(path, size, mtime_ns, fps, frames, width, height, codec, timecode, method, extra, probed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, st.st_size, st.st_mtime_ns,
+                    *(info.get(c) for c in _COLUMNS),
+                    json.dumps(extra) if extra else None,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def probe(self, path: str | Path, refresh: bool = False) -> dict:
+        """캐시 우선 probe. 실패 결과(method=default)는 저장하지 않음."""
+        key = _normalize(path)
+        try:
+            st = os.stat(key)
+        except OSError as e:
+            info = {c: None for c in _COLUMNS}
+            info.update(fps=DEFAULT_FPS, frames=1, method=METHOD_DEFAULT, error=str(e), cached=False)
+            return info
+
+        if not refresh:
+            hit = self.get(key, st)
+            if hit:
+                return hit
+
+        info = _probe_uncached(key)
+        info["cached"] = False
+
+        if info.get("method") != METHOD_DEFAULT:
+            self.put(key, info, st)
+        return info
+
+    def probe_many(self, paths, workers: int = 8, refresh: bool = False) -> list[dict]:
+        """여러 파일 (시퀀스 전체 등) 을 병렬 probe. 입력 순서대로 반환."""
+        paths = list(paths)
+        if len(paths) <= 1 or workers <= 1:
+            return [self.probe(p, refresh) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            return list(pool.map(lambda p: self.probe(p, refresh), paths))
+
+
+def _probe_image(path: str) -> dict:
+    try:
+        header = read_image_header(path)
+    except (OSError, HeaderError) as e:
+        info = {c: None for c in _COLUMNS}
+        info.update(method=METHOD_DEFAULT, error=str(e))
+        return info
+
+    info = dict(header)
+    info.update(
+        codec=header.get("compression"),
+        frames=1,
+        method=f"{header['format']}_header",
+        colorspace=colorspace_hint(header),
+        error=None,
+    )
+    return info
+
+
+def _probe_uncached(path: str) -> dict:
+    if is_image_file(path):
+        return _probe_image(path)
+    return probe_mov(path)
+
+
+# ------------------------------------------------------------
+# 모듈 공용 캐시
+# ------------------------------------------------------------
+_shared: ProbeCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_cache() -> ProbeCache:
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ProbeCache()
+        return _shared
+
+
+def probe_media(path: str | Path, refresh: bool = False) -> dict:
+    """공용 캐시를 통해 probe (plate_loader / preview / dailies reel 에서 사용)"""
+    return get_cache().probe(path, refresh=refresh)
@@ -0,0 +1,286 @@
+"""
+core/io/relink_index.py
+
+- 누락된 media 재연결용 파일명 인덱스 (SQLite)
+- 쇼 트리 + 설정된 검색 루트를 미리 스캔해서 "파일명 → 폴더" 로 저장
+    이미지 시퀀스는 프레임마다가 아니라 시퀀스 1줄 (prefix#ext + 프레임 범위)
+- 스크립트 안의 누락 경로 전부를 한 번의 batch 조회로 찾고,
+  원래 경로와 폴더 구성이 비슷한 순서로 후보 정렬
+- 파일시스템 전체 os.walk 대신 사용 (import 시점에는 아무것도 하지 않음)
+
+기본 위치: $SKYFALL_RELINK_INDEX 또는 ~/.skyfall/cache/relink_index.sqlite3
+추가 검색 루트: $SKYFALL_RELINK_ROOTS (os.pathsep 구분)
+
+    index = get_index()
+    index.ensure(search_roots(show_root))
+    found = index.lookup(missing_paths)     # {path: [{"path", "score", ...}, ...]}
+"""
+
+import difflib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.io.frame_pattern import FramePattern
+from core.io.frame_set import FrameSet
+from core.io.sequence_scan import split_frame_file
+
+# 이 시간보다 오래된 루트 인덱스는 ensure() 에서 다시 스캔
+DEFAULT_MAX_AGE = float(os.getenv("SKYFALL_RELINK_MAX_AGE", str(12 * 3600)))
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    key      TEXT NOT NULL,
+    dir      TEXT NOT NULL,
+    name     TEXT NOT NULL,
+    padding  INTEGER,
+    frames   TEXT,
+    root     TEXT NOT NULL,
+    PRIMARY KEY (dir, key)
+);
+CREATE INDEX IF NOT EXISTS files_key ON files (key);
+CREATE TABLE IF NOT EXISTS roots (
+    root       TEXT PRIMARY KEY,
+    scanned_at REAL,
+    entries    INTEGER
+);
+"""
+
+
+def default_index_path() -> Path:
+    env = os.getenv("SKYFALL_RELINK_INDEX")
+    if env:
+        return Path(env)
+    return Path.home() / ".skyfall" / "cache" / "relink_index.sqlite3"
+
+
+def search_roots(show_root: str | None = None) -> list[str]:
+    """쇼 루트 + $SKYFALL_RELINK_ROOTS (존재하는 폴더만)"""
+    roots = [show_root] if show_root else []
+    roots.extend(os.getenv("SKYFALL_RELINK_ROOTS", "").split(os.pathsep))
+    out = []
+    for r in roots:
+        if r and os.path.isdir(r):
+            r = _normalize(r)
+            if r not in out:
+                out.append(r)
+    return out
+
+
+def _normalize(path: str) -> str:
+    return os.path.abspath(path).replace(os.sep, "/").rstrip("/") or "/"
+
+
+def _seq_key(prefix: str, ext: str) -> str:
+    return f"{prefix}#{ext}".lower()
+
+
+def lookup_keys(path: str) -> list[tuple[str, int | None]]:
+    """누락 경로 → [(인덱스 key, 필요한 프레임 or None)]"""
+    pattern = FramePattern(path)
+    name = pattern.basename
+    if pattern.is_sequence:
+        head = pattern.head[pattern.head.rfind("/") + 1:]
+        return [(_seq_key(head, pattern.tail), None)]
+
+    keys = [(name.lower(), None)]
+    parts = split_frame_file(name)
+    if parts:
+        # 단일 프레임 Read → 다른 곳에 있는 시퀀스의 한 프레임일 수 있음
+        keys.append((_seq_key(parts[0], parts[2]), int(parts[1])))
+    return keys
+
+
+def similarity(missing: str, candidate_dir: str) -> float:
+    """
+    원래 경로와 후보 폴더의 유사도 (0~1).
+    공유하는 폴더 이름 (SHOW / EP / SEQ / SHOT / plate_v001 …) 비율 + 문자열 유사도
+    """
+    missing_dir = os.path.dirname(missing.replace("\\", "/"))
+    a = {p for p in missing_dir.split("/") if p}
+    b = {p for p in candidate_dir.split("/") if p}
+    shared = len(a & b) / max(len(a), 1)
+    ratio = difflib.SequenceMatcher(None, missing_dir, candidate_dir).ratio()
+    return round(0.6 * shared + 0.4 * ratio, 3)
+
+
+# ------------------------------------------------------------
+# 스캔
+# ------------------------------------------------------------
+def _scan_tree(top: str, is_cancelled=None, recurse: bool = True) -> list[tuple]:
+    """top 아래 전체 (recurse=False 면 top 폴더만) → [(key, dir, name, padding, frames)]"""
+    rows = []
+    stack = [top]
+    while stack:
+        if is_cancelled and is_cancelled():
+            break
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        dir_norm = folder.replace(os.sep, "/")
+        groups: dict[tuple[str, str], tuple[list[int], list[str]]] = {}
+        for e in entries:
+            if e.name.startswith("."):
+                continue
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    if recurse:
+                        stack.append(e.path)
+                    continue
+            except OSError:
+                continue
+            parts = split_frame_file(e.name)
+            if parts:
+                frames, names = groups.setdefault((parts[0], parts[2]), ([], []))
+                frames.append(int(parts[1]))
+                names.append(e.name)
+            else:
+                rows.append((e.name.lower(), dir_norm, e.name, None, None))
+
+        for (prefix, ext), (frames, names) in groups.items():
+            if len(names) == 1:
+                # 프레임 1개짜리 (clip_001.mov 등) 는 파일명으로도 찾을 수 있게
+                rows.append((names[0].lower(), dir_norm, names[0], None, None))
+            pad = min(len(n) - len(prefix) - len(ext) for n in names)
+            rows.append((_seq_key(prefix, ext), dir_norm, f"{prefix}{'#' * pad}{ext}", pad, str(FrameSet(frames))))
+    return rows
+
+
+class RelinkIndex:
+    def __init__(self, db_path: str | Path | None = None):
+        self.db_path = Path(db_path) if db_path else default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --------------------------------------------------------
+    # 인덱스 구축
+    # --------------------------------------------------------
+    def scanned_at(self, root: str) -> float | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT scanned_at FROM roots WHERE root = ?", (_normalize(root),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def index_root(self, root: str, workers: int = 8, is_cancelled=None) -> int:
+        """root 전체 다시 스캔 (최상위 폴더 단위 병렬). 취소되면 기존 인덱스 유지"""
+        root = _normalize(root)
+        try:
+            with os.scandir(root) as it:
+                tops = [e.path for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")]
+        except OSError:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            chunks = list(pool.map(lambda t: _scan_tree(t, is_cancelled), tops))
+        # root 바로 아래 파일 (하위 폴더는 위에서 처리)
+        rows = _scan_tree(root, recurse=False)
+        for chunk in chunks:
+            rows.extend(chunk)
+
+        if is_cancelled and is_cancelled():
+            return 0
+
+        rows = [(k, d, n, p, f, root) for k, d, n, p, f in rows]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM files WHERE root = ?", (root,))
+                self._conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO roots VALUES (?, ?, ?)", (root, time.time(), len(rows))
+                )
+        return len(rows)
+
+    def ensure(self, roots, max_age: float = DEFAULT_MAX_AGE, refresh: bool = False,
+               is_cancelled=None, progress=None) -> None:
+        """인덱스가 없거나 max_age 보다 오래된 루트만 다시 스캔"""
+        for i, root in enumerate(roots):
+            if is_cancelled and is_cancelled():
+                return
+            scanned = self.scanned_at(root)
+            if refresh or scanned is None or time.time() - scanned > max_age:
+                if progress:
+                    progress(i, len(roots), root)
+                self.index_root(root, is_cancelled=is_cancelled)
+
+    # --------------------------------------------------------
+    # 조회 (batch)
+    # --------------------------------------------------------
+    def lookup(self, paths, roots=None, limit: int = 5) -> dict:
+        """
+        누락 경로 여러 개 → {path: [후보 dict, ...]} (유사도 내림차순)
+        후보: {"path", "dir", "name", "frames", "score"}
+        """
+        wanted = {p: lookup_keys(p) for p in paths}
+        keys = sorted({k for ks in wanted.values() for k, _f in ks})
+        roots = [_normalize(r) for r in roots] if roots else None
+
+        rows_by_key: dict[str, list[tuple]] = {}
+        for i in range(0, len(keys), _QUERY_CHUNK):
+            chunk = keys[i:i + _QUERY_CHUNK]
+            sql = f"SELECT key, dir, name, padding, frames, root FROM files WHERE key IN ({','.join('?' * len(chunk))})"
+            with self._lock:
+                rows = self._conn.execute(sql, chunk).fetchall()
+            for row in rows:
+                if roots is None or row[5] in roots:
+                    rows_by_key.setdefault(row[0], []).append(row)
+
+        result = {}
+        for path, path_keys in wanted.items():
+            pattern = FramePattern(path)
+            candidates = {}
+            for key, frame in path_keys:
+                for _key, folder, name, padding, frames in (r[:5] for r in rows_by_key.get(key, ())):
+                    if frame is not None:
+                        if frames is None or frame not in FrameSet.parse(frames):
+                            continue
+                        cand = f"{folder}/{name.replace('#' * padding, f'{frame:0{padding}d}')}"
+                    elif pattern.is_sequence and padding and padding != pattern.padding:
+                        # padding 이 다르면 찾은 쪽 표기로 (%0Nd)
+                        cand = FramePattern(f"{folder}/{name}").printf()
+                    elif pattern.is_sequence:
+                        cand = pattern.with_dirname(folder).pattern
+                    else:
+                        cand = f"{folder}/{name}"
+                    candidates[cand] = {
+                        "path": cand,
+                        "dir": folder,
+                        "name": name,
+                        "frames": frames,
+                        "score": similarity(path, folder),
+                    }
+            ranked = sorted(candidates.values(), key=lambda c: (-c["score"], c["path"]))
+            result[path] = ranked[:limit]
+        return result
+
+
+# ------------------------------------------------------------
+# 공용 인스턴스
+# ------------------------------------------------------------
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> RelinkIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = RelinkIndex()
+        return _index
@@ -0,0 +1,152 @@
+"""
+core/io/render_manifest.py
+
+- 렌더 버전별 source 프레임 manifest (preview 폴더의 .<preview 이름>.frames.json)
+- 프레임별 size / mtime (+ 선택적으로 fast hash) 와 인코딩 설정을 기록
+- 다시 preview 를 만들 때:
+    프레임 / 설정 / 출력 파일이 그대로면 → 인코딩 skip
+    다르면 → 바뀐 / 추가 / 삭제된 프레임을 FrameSet 으로 보고
+- fast hash: 파일 앞 / 뒤 1MB + size (xxh64, 없으면 md5) — EXR 을 전부 읽지 않고
+  "같은 size / mtime 으로 다시 렌더된" 경우만 잡음
+
+$SKYFALL_PREVIEW_HASH=1 이면 기본으로 fast hash 사용
+
+    current = scan_frames(frame_pattern, frames, with_hash=False)
+    manifest = RenderManifest(preview_dir, "EP01_S001_0010_comp_v003")
+    diff = manifest.diff(current, settings)
+    if diff["unchanged"]: skip
+    ...
+    manifest.save(current, settings)
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.io.frame_pattern import FramePattern
+from core.io.frame_set import FrameSet
+from core.io.hashlist import available, new_hasher
+from core.io.sequence_scan import list_pattern
+
+MANIFEST_VERSION = 1
+DEFAULT_FAST_HASH = os.getenv("SKYFALL_PREVIEW_HASH", "0") not in ("", "0", "false", "no")
+
+_SAMPLE_BYTES = 1024 * 1024
+# SMB / NFS 는 mtime 정밀도가 낮을 수 있음 (collect_manifest 와 동일)
+_MTIME_TOLERANCE_NS = 2 * 1000 * 1000 * 1000
+
+
+def fast_hash(path: str, size: int) -> str:
+    """앞 / 뒤 _SAMPLE_BYTES + size → digest (큰 EXR 도 최대 2MB 만 읽음)"""
+    h = new_hasher("xxh64") if available("xxh64") else hashlib.md5()
+    h.update(str(size).encode())
+    with open(path, "rb") as f:
+        h.update(f.read(_SAMPLE_BYTES))
+        if size > 2 * _SAMPLE_BYTES:
+            f.seek(size - _SAMPLE_BYTES)
+            h.update(f.read(_SAMPLE_BYTES))
+        elif size > _SAMPLE_BYTES:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def scan_frames(pattern: FramePattern, frames: FrameSet | None = None, with_hash: bool = DEFAULT_FAST_HASH,
+                workers: int = 8) -> dict:
+    """
+    폴더 1번 listing → {"1001": {"size", "mtime_ns"(, "hash")}, ...}
+    frames: 이 프레임만 (None = 폴더에 있는 전부)
+    """
+    entries = list_pattern(pattern)
+    wanted = [f for f in sorted(entries) if frames is None or f in frames]
+
+    current = {}
+    for frame in wanted:
+        st = entries[frame].stat()
+        current[str(frame)] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    if with_hash and wanted:
+        def digest(frame):
+            return frame, fast_hash(entries[frame].path, current[str(frame)]["size"])
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for frame, value in pool.map(digest, wanted):
+                current[str(frame)]["hash"] = value
+    return current
+
+
+def _same(old: dict, new: dict) -> bool:
+    if old.get("size") != new.get("size"):
+        return False
+    if old.get("hash") and new.get("hash"):
+        return old["hash"] == new["hash"]
+    return abs(old.get("mtime_ns", 0) - new.get("mtime_ns", 0)) <= _MTIME_TOLERANCE_NS
+
+
+class RenderManifest:
+    def __init__(self, preview_dir: str, name: str):
+        """name: preview 기본 이름 (EP01_S001_0010_comp_v003)"""
+        self.path = os.path.join(str(preview_dir), f".{name}.frames.json")
+        self.frames: dict[str, dict] = {}
+        self.settings: dict = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.frames = data.get("frames", {})
+            self.settings = data.get("settings", {})
+
+    def save(self, frames: dict, settings: dict):
+        """인코딩이 끝난 뒤에만 호출 (tmp 에 쓰고 rename)"""
+        self.frames, self.settings = frames, settings
+        tmp = self.path + ".tmp"
+        data = {
+            "version": MANIFEST_VERSION,
+            "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "settings": settings,
+            "frames": frames,
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def diff(self, current: dict, settings: dict) -> dict:
+        """
+        반환: {"unchanged": bool, "first_run": bool, "settings_changed": bool,
+               "added": FrameSet, "removed": FrameSet, "changed": FrameSet}
+        """
+        old_keys, new_keys = set(self.frames), set(current)
+        added = FrameSet(int(f) for f in new_keys - old_keys)
+        removed = FrameSet(int(f) for f in old_keys - new_keys)
+        changed = FrameSet(
+            int(f) for f in new_keys & old_keys if not _same(self.frames[f], current[f])
+        )
+        # 예전 manifest 에 hash 가 있고 지금 hash 를 안 쓰는 경우 등은 mtime 비교로 충분
+        settings_changed = bool(self.frames) and self.settings != settings
+        first_run = not self.frames
+        return {
+            "unchanged": not first_run and not settings_changed and not (added or removed or changed),
+            "first_run": first_run,
+            "settings_changed": settings_changed,
+            "added": added,
+            "removed": removed,
+            "changed": changed,
+        }
+
+    @staticmethod
+    def describe(diff: dict) -> str:
+        if diff["first_run"]:
+            return "no previous manifest"
+        parts = []
+        if diff["settings_changed"]:
+            parts.append("encode settings changed")
+        for key in ("changed", "added", "removed"):
+            if diff[key]:
+                parts.append(f"{key} {diff[key]} ({len(diff[key])}f)")
+        return ", ".join(parts) or "unchanged"
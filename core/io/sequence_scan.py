@@ -0,0 +1,108 @@
+"""
+core/io/sequence_scan.py
+
+- 디렉토리 목록 1번으로 이미지 시퀀스 그룹핑
+- 결과 프레임은 FrameSet (core/io/frame_set.py) 으로 보관
+- plate_loader / collectFiles / preview 가 같은 스캐너 사용
+- list_pattern: FramePattern 폴더를 1번 listing → 프레임별 DirEntry
+  (프레임마다 exists() 호출 X — NAS metadata round trip 절약)
+
+시퀀스 dict:
+    {
+        "folder":  "/Volumes/.../plate/EP01_S001_0010_plate_v001",
+        "prefix":  "EP01_S001_0010_plate_v001.",   # 구분자 포함
+        "ext":     ".exr",
+        "padding": 4,
+        "frames":  FrameSet("1001-1263"),
+    }
+"""
+
+import os
+import re
+
+from core.io.frame_pattern import FramePattern
+from core.io.frame_set import FrameSet
+
+# prefix + 프레임 번호 + 확장자  (name.1001.exr / name_1001.exr / 1001.dpx)
+_FRAME_FILE_RE = re.compile(r"^(?P<prefix>.*?)(?P<frame>\d+)(?P<ext>\.[A-Za-z0-9]+)$")
+
+
+def split_frame_file(name: str):
+    """'A_v001.1001.exr' → ('A_v001.', '1001', '.exr') / 프레임 번호 없으면 None"""
+    m = _FRAME_FILE_RE.match(name)
+    if not m:
+        return None
+    return m.group("prefix"), m.group("frame"), m.group("ext")
+
+
+def scan_files(folder: str, files, prefix_filter: str | None = None) -> list[dict]:
+    """
+    이미 읽은 파일 목록 → 시퀀스 목록 (listdir 재호출 없음).
+    prefix_filter 가 있으면 그 문자열로 시작하는 시퀀스만.
+    """
+    groups: dict[tuple[str, str], tuple[list[int], list[int]]] = {}
+
+    for name in files:
+        if name.startswith("."):
+            continue
+        if prefix_filter and not name.startswith(prefix_filter):
+            continue
+        parts = split_frame_file(name)
+        if not parts:
+            continue
+        prefix, digits, ext = parts
+        frames, widths = groups.setdefault((prefix, ext), ([], []))
+        frames.append(int(digits))
+        widths.append(len(digits))
+
+    sequences = []
+    for (prefix, ext), (frames, widths) in groups.items():
+        sequences.append({
+            "folder": folder,
+            "prefix": prefix,
+            "ext": ext,
+            # 자리수가 섞여 있으면 (999, 1000) 가장 짧은 쪽이 padding
+            "padding": min(widths),
+            "frames": FrameSet(frames),
+        })
+
+    sequences.sort(key=lambda s: (s["prefix"], s["ext"]))
+    return sequences
+
+
+def scan_directory(folder: str, prefix_filter: str | None = None) -> list[dict]:
+    """디렉토리 1회 listing → 시퀀스 목록. 폴더가 없으면 []"""
+    try:
+        with os.scandir(folder) as it:
+            names = [e.name for e in it if e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return scan_files(folder, names, prefix_filter)
+
+
+def sequence_pattern(seq: dict, style: str = "printf") -> str:
+    """시퀀스 dict → 전체 경로 패턴 (printf: %04d / hash: ####)"""
+    pad = seq["padding"]
+    token = f"%0{pad}d" if style == "printf" else "#" * pad
+    return f"{seq['folder']}/{seq['prefix']}{token}{seq['ext']}"
+
+
+def frame_path(seq: dict, frame: int) -> str:
+    return f"{seq['folder']}/{seq['prefix']}{frame:0{seq['padding']}d}{seq['ext']}"
+
+
+def list_pattern(pattern: FramePattern) -> dict:
+    """
+    패턴의 폴더를 1번 listing → {frame: os.DirEntry}. 폴더가 없으면 {}.
+    DirEntry.stat() 은 캐시되므로 size/mtime 비교에 그대로 재사용.
+    """
+    found = {}
+    try:
+        with os.scandir(pattern.dirname or ".") as it:
+            for entry in it:
+                frame = pattern.match(entry.name)
+                if frame is not None and entry.is_file():
+                    found[frame] = entry
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return found
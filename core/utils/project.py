@@ -2,10 +2,158 @@
 core/utils/project.py
 
 프로젝트 메타 정보 관련 유틸.
-지금은 fps 고정이지만, 나중에 project.yml 파싱으로 교체 예정.
+- /Volumes/skyfall/shows/<show>/project.yml (tools/init_show.py 가 생성)
+- PyYAML 이 없으면 (Nuke 내장 python 등) 간단한 "key: value" / 들여쓰기 mapping 만 파싱
+- preview_format: preview 출력 목록 (review MOV / proxy / poster / thumbnail strip)
+    문자열 (mov_h264 등) → 내장 preset, mapping → preset 위에 덮어씀
+
+project.yml 예:
+    fps: 23.976
+    preview_lut: show_rec709.cube      # core/io/lut_registry.py 에서 검색
+    preview_format:
+      review:
+        crf: 17
+      proxy:
+        scale: 0.5
+        crf: 23
+      strip:
+        count: 12
 """
 
+import copy
+from pathlib import Path
+
+from core.env.pipeline_env import SHOWS_DIR
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - Nuke 내장 python 에는 없음
+    yaml = None
+
+DEFAULT_FPS = 24
+
+# ------------------------------------------------------------
+# preview 출력 preset
+#   kind: movie (인코딩) / poster (1프레임 JPEG) / strip (contact sheet JPEG)
+#   suffix: 파일명 뒤에 붙는 이름 (review 는 없음 → <shot>_comp_v###.mov)
+# ------------------------------------------------------------
+_REVIEW_H264 = {
+    "kind": "movie", "suffix": "", "ext": ".mov", "burnin": True,
+    "codec": "libx264", "crf": 17, "preset": "medium", "pix_fmt": "yuv420p",
+}
+_PROXY_H264 = {
+    "kind": "movie", "suffix": "_proxy", "ext": ".mov", "burnin": True, "scale": 0.5,
+    "codec": "libx264", "crf": 23, "preset": "fast", "pix_fmt": "yuv420p",
+}
+_POSTER = {"kind": "poster", "suffix": "_poster", "ext": ".jpg", "frame": "middle", "quality": 2}
+_STRIP = {"kind": "strip", "suffix": "_strip", "ext": ".jpg", "count": 10, "width": 320, "quality": 4}
+
+PREVIEW_PRESETS = {
+    "mov_h264": {"review": _REVIEW_H264, "proxy": _PROXY_H264, "poster": _POSTER, "strip": _STRIP},
+    "mov_prores": {
+        "review": {**_REVIEW_H264, "codec": "prores_ks", "profile": 2, "pix_fmt": "yuv422p10le", "crf": None, "preset": None},
+        "proxy": _PROXY_H264,
+        "poster": _POSTER,
+        "strip": _STRIP,
+    },
+}
+DEFAULT_PREVIEW_FORMAT = "mov_h264"
+
+
+def project_yml_path(show: str) -> Path:
+    return SHOWS_DIR / show / "project.yml"
+
+
+# ------------------------------------------------------------
+# YAML (fallback 파서)
+# ------------------------------------------------------------
+def _scalar(text: str):
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    low = text.lower()
+    if low in ("true", "yes", "on"):
+        return True
+    if low in ("false", "no", "off"):
+        return False
+    if low in ("null", "~", ""):
+        return None
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_simple_yaml(text: str) -> dict:
+    """들여쓰기 mapping + scalar 만 (list / flow style 은 무시)"""
+    root: dict = {}
+    stack = [(-1, root)]
+    for raw in text.splitlines():
+        line = raw.split(" #", 1)[0].rstrip()
+        if not line.strip() or line.lstrip().startswith(("#", "- ")):
+            continue
+        indent = len(line) - len(line.lstrip())
+        key, sep, value = line.strip().partition(":")
+        if not sep:
+            continue
+        while indent <= stack[-1][0]:
+            stack.pop()
+        parent = stack[-1][1]
+        if value.strip():
+            parent[key.strip()] = _scalar(value)
+        else:
+            parent[key.strip()] = child = {}
+            stack.append((indent, child))
+    return root
+
+
+def load_project(show: str | None = None, path: str | Path | None = None) -> dict:
+    """project.yml → dict (없거나 읽을 수 없으면 빈 dict)"""
+    path = Path(path) if path else project_yml_path(show)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    if yaml is not None:
+        data = yaml.safe_load(text)
+    else:
+        data = parse_simple_yaml(text)
+    return data if isinstance(data, dict) else {}
+
+
+# ------------------------------------------------------------
+# 조회
+# ------------------------------------------------------------
+def get_fps(show: str | None = None, project: dict | None = None) -> float:
+    if project is None:
+        project = load_project(show) if show else {}
+    try:
+        return float(project.get("fps") or DEFAULT_FPS)
+    except (TypeError, ValueError):
+        return DEFAULT_FPS
+
+
+def get_preview_format(show: str | None = None, project: dict | None = None) -> dict:
+    """
+    preview 출력 {이름: 설정} (출력 순서 유지).
+    preview_format 이 mapping 이면 "base" 키 (없으면 mov_h264) 위에 출력별로 덮어씀,
+    값이 false / null 인 출력은 제외.
+    """
+    if project is None:
+        project = load_project(show) if show else {}
+    spec = project.get("preview_format") or DEFAULT_PREVIEW_FORMAT
+
+    if isinstance(spec, str):
+        return copy.deepcopy(PREVIEW_PRESETS.get(spec, PREVIEW_PRESETS[DEFAULT_PREVIEW_FORMAT]))
 
-def get_fps() -> int:
-    # TODO: /Volumes/skyfall/shows/<show>/project.yml 에서 읽어오도록 확장
-    return 24
+    spec = dict(spec)
+    base = PREVIEW_PRESETS.get(spec.pop("base", DEFAULT_PREVIEW_FORMAT), PREVIEW_PRESETS[DEFAULT_PREVIEW_FORMAT])
+    outputs = copy.deepcopy(base)
+    for name, settings in spec.items():
+        if settings in (False, None):
+            outputs.pop(name, None)
+        elif isinstance(settings, dict):
+            outputs[name] = {**outputs.get(name, {"kind": "movie", "suffix": f"_{name}", "ext": ".mov"}), **settings}
+    return outputs
@@ -0,0 +1,195 @@
+"""
+core/utils/startup_profile.py
+
+- Nuke 시작 시 SKYFALL bootstrap 비용 측정 (opt-in)
+    $SKYFALL_PROFILE_STARTUP=1 일 때만 동작 — 꺼져 있으면 이 모듈도 import 되지 않음
+- 측정 항목
+    section : apps/nuke/__init__.py path 설정, menu.py import, build_menu, gizmo 로드 등
+    imports : profiling 중 처음 import 된 모듈별 시간 (하위 import 포함 누적)
+    total   : SKYFALL 코드가 쓴 시간 (section 합)
+- 끝나면 호스트별 JSON lines 로그에 1줄 추가 → 배포 직후 회귀 확인
+    GUI 는 build_menu 끝에서, nuke -t (farm) 처럼 menu.py 가 안 도는 경우는 atexit 에서
+    $SKYFALL_PROFILE_DIR 또는 ~/.skyfall/logs/startup/<host>.jsonl
+
+pipeline 모듈을 import 하지 않음 (표준 라이브러리만) — 측정 대상에 섞이지 않게.
+
+    startup_profile.begin(t0)
+    with startup_profile.section("build_menu"):
+        ...
+    startup_profile.finish(gui=True)
+"""
+
+import atexit
+import builtins
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# 보고서에서 SKYFALL 모듈로 묶는 prefix
+PIPELINE_PREFIXES = ("apps.", "core.", "services.", "tools.", "lib.")
+_TOP_IMPORTS = 30
+
+_lock = threading.Lock()
+_state = None
+
+
+def enabled() -> bool:
+    """apps/nuke/__init__.py / menu.py 도 같은 조건 (import 전에 inline 으로 확인)"""
+    return os.getenv("SKYFALL_PROFILE_STARTUP", "0").lower() not in ("", "0", "false", "no")
+
+
+def default_log_path() -> Path:
+    env = os.getenv("SKYFALL_PROFILE_DIR")
+    folder = Path(env) if env else Path.home() / ".skyfall" / "logs" / "startup"
+    return folder / f"{socket.gethostname()}.jsonl"
+
+
+# ------------------------------------------------------------
+# import 시간 (builtins.__import__ 감싸기)
+# ------------------------------------------------------------
+def _install_import_hook(state):
+    original = builtins.__import__
+    depth = [0]
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        # 상대 import / 이미 로드된 모듈은 그대로 (측정 비용 최소화)
+        # from pkg import sub 는 sub 가 아직 없을 때만 측정
+        loaded = name in sys.modules and not any(
+            f != "*" and f"{name}.{f}" not in sys.modules and not hasattr(sys.modules[name], f)
+            for f in fromlist or ()
+        )
+        if level or loaded:
+            return original(name, globals, locals, fromlist, level)
+        t0 = time.perf_counter()
+        depth[0] += 1
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            depth[0] -= 1
+            ms = (time.perf_counter() - t0) * 1000
+            label = name if not fromlist else f"{name}:{','.join(fromlist)}"
+            state["imports"].append({"module": label, "ms": round(ms, 3), "depth": depth[0]})
+
+    builtins.__import__ = timed_import
+    state["restore_import"] = original
+
+
+# ------------------------------------------------------------
+# API
+# ------------------------------------------------------------
+def begin(t0: float | None = None):
+    """profiling 시작 (여러 번 불러도 처음 1번만). t0: 호출 전에 잰 perf_counter (path 설정 포함용)"""
+    global _state
+    with _lock:
+        if _state is not None:
+            return
+        _state = {
+            "t0": t0 if t0 is not None else time.perf_counter(),
+            "started": time.time(),
+            "sections": [],
+            "imports": [],
+        }
+        _install_import_hook(_state)
+        # menu.py 가 안 불리는 시작 (nuke -t / farm) 도 기록 + import hook 해제
+        atexit.register(_finish_at_exit)
+
+
+def _finish_at_exit():
+    nuke = sys.modules.get("nuke")
+    finish(gui=bool(getattr(nuke, "GUI", False)) if nuke else None)
+
+
+def active() -> bool:
+    return _state is not None and "finished" not in _state
+
+
+def add_section(name: str, ms: float):
+    if active():
+        _state["sections"].append({"name": name, "ms": round(ms, 3)})
+
+
+def mark(name: str, since: float):
+    """since (perf_counter) 부터 지금까지를 section 으로 기록"""
+    add_section(name, (time.perf_counter() - since) * 1000)
+
+
+@contextmanager
+def section(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        mark(name, t0)
+
+
+def _deploy_id(root: str | None) -> str | None:
+    """$SKYFALL_DEPLOY_ID 또는 PIPELINE_ROOT 의 git HEAD (배포별 비교용)"""
+    env = os.getenv("SKYFALL_DEPLOY_ID")
+    if env or not root:
+        return env
+    git = Path(root) / ".git"
+    try:
+        head = (git / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = git / head[5:]
+            return ref.read_text().strip()[:12] if ref.exists() else head[5:]
+        return head[:12]
+    except OSError:
+        return None
+
+
+def report(gui: bool | None = None) -> dict:
+    state = _state or {}
+    imports = state.get("imports", [])
+    pipeline = [i for i in imports if i["module"].startswith(PIPELINE_PREFIXES)]
+    sections = state.get("sections", [])
+    root = os.getenv("PIPELINE_ROOT")
+    nuke_version = None
+    if "nuke" in sys.modules:
+        nuke_version = getattr(sys.modules["nuke"], "NUKE_VERSION_STRING", None)
+
+    return {
+        "host": socket.gethostname(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(state.get("started", time.time()))),
+        "gui": gui,
+        "nuke": nuke_version,
+        "python": sys.version.split()[0],
+        "pipeline_root": root,
+        "deploy": _deploy_id(root),
+        "total_ms": round(sum(s["ms"] for s in sections), 3),
+        "wall_ms": round((time.perf_counter() - state["t0"]) * 1000, 3) if state else None,
+        "sections": sections,
+        # 최상위 import (depth 0) 만 합산 — 하위 import 는 상위에 이미 포함
+        "pipeline_import_ms": round(sum(i["ms"] for i in pipeline if i["depth"] == 0), 3),
+        "imports": sorted(imports, key=lambda i: -i["ms"])[:_TOP_IMPORTS],
+    }
+
+
+def finish(gui: bool | None = None, log_path: str | Path | None = None) -> dict | None:
+    """import hook 해제 + 로그 1줄 기록. 반환: 보고서 (profiling 중이 아니면 None)"""
+    with _lock:
+        if not active():
+            return None
+        builtins.__import__ = _state.pop("restore_import")
+        _state["finished"] = True
+
+    data = report(gui)
+    path = Path(log_path) if log_path else default_log_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(data, sort_keys=True) + "\n")
+    except OSError:
+        # 로그 실패로 Nuke 시작을 막지 않음
+        pass
+    return data
+
+
+def summary(data: dict) -> str:
+    parts = ", ".join(f"{s['name']} {s['ms']:.1f}" for s in data["sections"])
+    return f"[SKYFALL] startup {data['total_ms']:.1f} ms ({parts}) — imports {data['pipeline_import_ms']:.1f} ms"
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+services/dailies_daemon.py
+
+- comp preview (tools/preview/preview_v008_final.py) 큐 + 병렬 렌더 서비스
+- job 큐는 SQLite — daemon 이 재시작돼도 남은 job 유지
+  공용 위치에 있으므로 아티스트 계정 / 다른 호스트에서 submit 해도 daemon 이 받음
+- worker 수는 core 수 기준 (job 1개당 ffmpeg -threads 로 core 분배)
+- priority: 슈퍼바이저 리뷰 등 급한 job 을 먼저
+- 같은 shot 버전이 대기 / 진행 중이면 새 job 을 만들지 않고 기존 job 반환 (priority 는 높은 쪽)
+
+기본 위치: $SKYFALL_DAILIES_QUEUE 또는 공용 $SKYFALL_ROOT/cache/dailies_queue.sqlite3
+  (NAS 위 파일이므로 WAL 대신 rollback journal — submit / claim 은 짧은 transaction)
+worker 수: $SKYFALL_DAILIES_WORKERS (기본 core 수 / SKYFALL_DAILIES_THREADS)
+
+  python3 dailies_daemon.py serve
+  python3 dailies_daemon.py submit BBF EP01 S001 0010 --lut show_rec709.cube --priority 100
+  python3 dailies_daemon.py status --state queued
+  python3 dailies_daemon.py cancel 42
+"""
+
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+PIPELINE_ROOT = Path(os.getenv("PIPELINE_ROOT", "/opt/pipeline")).resolve()
+if str(PIPELINE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PIPELINE_ROOT))
+
+from core.env.pipeline_env import SHOWS_DIR
+from core.io.lut_registry import LutError, get_registry
+from core.utils.project import get_fps
+from tools.preview.preview_v008_final import detect_render_sequence, generate_preview
+
+PRIORITY_SUPERVISOR = 100
+PRIORITY_NORMAL = 50
+PRIORITY_BACKGROUND = 10
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+# ffmpeg (libx264) 1개가 쓰는 thread 수 → worker 수 = core / 이 값
+DEFAULT_THREADS = int(os.getenv("SKYFALL_DAILIES_THREADS", "4"))
+DEFAULT_WORKERS = int(
+    os.getenv("SKYFALL_DAILIES_WORKERS", str(max(1, (os.cpu_count() or 1) // max(1, DEFAULT_THREADS))))
+)
+_POLL_INTERVAL = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    key          TEXT NOT NULL,
+    show         TEXT NOT NULL,
+    ep           TEXT NOT NULL,
+    seq          TEXT NOT NULL,
+    shot         TEXT NOT NULL,
+    version      INTEGER NOT NULL,
+    lut          TEXT NOT NULL,
+    fps          REAL NOT NULL,
+    priority     INTEGER NOT NULL,
+    state        TEXT NOT NULL,
+    output       TEXT,
+    error        TEXT,
+    worker       TEXT,
+    progress     INTEGER,
+    encode_fps   REAL,
+    submitted_at REAL,
+    started_at   REAL,
+    finished_at  REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, priority, id);
+CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key, state);
+"""
+
+_COLUMNS = (
+    "id", "key", "show", "ep", "seq", "shot", "version", "lut", "fps", "priority",
+    "state", "output", "error", "worker", "progress", "encode_fps", "submitted_at", "started_at", "finished_at",
+)
+# ffmpeg 진행률을 DB 에 쓰는 최소 간격 (초)
+_PROGRESS_WRITE_INTERVAL = 2.0
+
+
+def default_queue_path() -> Path:
+    """모든 계정 / 호스트가 같은 큐를 보도록 공용 위치 ($SKYFALL_ROOT/cache, shows/ 옆)"""
+    env = os.getenv("SKYFALL_DAILIES_QUEUE")
+    if env:
+        return Path(env)
+    return SHOWS_DIR.parent / "cache" / "dailies_queue.sqlite3"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True   # 다른 계정 프로세스 — 살아 있음
+    return True
+
+
+def job_key(show, ep, seq, shot, version: int) -> str:
+    return f"{show}/{ep}_{seq}_{shot}/v{version:03d}"
+
+
+# ------------------------------------------------------------
+# 큐
+# ------------------------------------------------------------
+class DailiesQueue:
+    def __init__(self, db_path: str | Path | None = None):
+        self.db_path = Path(db_path) if db_path else default_queue_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        # 공용 (NAS) 파일 — WAL 은 호스트 간 공유가 안 됨
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row(row) -> dict | None:
+        return dict(zip(_COLUMNS, row)) if row else None
+
+    # --------------------------------------------------------
+    # submit / cancel
+    # --------------------------------------------------------
+    def submit(self, show, ep, seq, shot, lut: str | None = None, version: int | None = None,
+               fps: float | None = None, priority: int = PRIORITY_NORMAL) -> dict:
+        """
+        version: None = 지금 렌더 폴더의 최신 버전으로 고정 (나중에 v+1 이 생겨도 이 job 은 그대로)
+        fps: None = project.yml fps
+        lut: LUT 이름 / 경로, None = project.yml preview_lut — submit 시점에 검증 + 캐시 변환
+        같은 key 가 대기 / 진행 중이면 기존 job 반환
+        """
+        if version is None:
+            label = detect_render_sequence(show, ep, seq, shot)[0]
+            if not label:
+                raise ValueError(f"No render EXR sequence for {ep}_{seq}_{shot}")
+            version = int(label[1:])
+        fps = fps or get_fps(show)
+        try:
+            get_registry(show).prepare(lut)
+        except LutError as e:
+            raise ValueError(str(e)) from None
+
+        key = job_key(show, ep, seq, shot, version)
+        with self._lock:
+            with self._conn:
+                # 다른 host 가 같은 key 를 동시에 넣지 않도록 확인 ~ INSERT 를 write lock 안에서
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE key = ? AND state IN (?, ?)",
+                    (key, *ACTIVE_STATES),
+                ).fetchone()
+                if row:
+                    job = self._row(row)
+                    if priority > job["priority"]:
+                        self._conn.execute("UPDATE jobs SET priority = ? WHERE id = ?", (priority, job["id"]))
+                        job["priority"] = priority
+                    job["duplicate"] = True
+                    return job
+
+                cur = self._conn.execute(
+                    "INSERT INTO jobs (key, show, ep, seq, shot, version, lut, fps, priority, state, submitted_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, show, ep, seq, shot, version, lut or "", fps, priority, QUEUED, time.time()),
+                )
+                job_id = cur.lastrowid
+        job = self.get(job_id)
+        job["duplicate"] = False
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """대기 중인 job 만 취소 (진행 중 ffmpeg 는 끝까지 감)"""
+        with self._lock:
+            with self._conn:
+                cur = self._conn.execute(
+                    "UPDATE jobs SET state = ?, finished_at = ? WHERE id = ? AND state = ?",
+                    (CANCELLED, time.time(), job_id, QUEUED),
+                )
+        return cur.rowcount > 0
+
+    # --------------------------------------------------------
+    # worker 쪽
+    # --------------------------------------------------------
+    def claim(self, worker: str) -> dict | None:
+        """priority 높은 순 (같으면 먼저 들어온 순) 으로 1개 가져와서 running 표시"""
+        with self._lock:
+            with self._conn:
+                # 다른 daemon 프로세스와 경쟁하지 않도록 write lock 먼저
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE state = ? "
+                    "ORDER BY priority DESC, id LIMIT 1",
+                    (QUEUED,),
+                ).fetchone()
+                if not row:
+                    return None
+                job = self._row(row)
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, worker = ?, started_at = ? WHERE id = ?",
+                    (RUNNING, worker, time.time(), job["id"]),
+                )
+        job.update(state=RUNNING, worker=worker)
+        return job
+
+    def finish(self, job_id: int, output: str | None = None, error: str | None = None):
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, output = ?, error = ?, finished_at = ? WHERE id = ?",
+                    (FAILED if error else DONE, output, error, time.time(), job_id),
+                )
+
+    def update_progress(self, job_id: int, percent: int | None, encode_fps: float | None):
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE jobs SET progress = ?, encode_fps = ? WHERE id = ?", (percent, encode_fps, job_id)
+                )
+
+    def requeue_stale(self, host: str) -> int:
+        """
+        이 호스트에서 running 으로 남은 job 중 daemon 이 죽은 것만 → 다시 대기.
+        worker = "<host>:<pid>:<index>" — 같은 호스트의 다른 daemon (pid 살아 있음) job 은 그대로
+        """
+        with self._lock:
+            with self._conn:
+                rows = self._conn.execute(
+                    "SELECT id, worker FROM jobs WHERE state = ? AND worker LIKE ?",
+                    (RUNNING, f"{host}:%"),
+                ).fetchall()
+                dead = []
+                for job_id, worker in rows:
+                    pid = worker[len(host) + 1:].split(":", 1)[0]
+                    if not pid.isdigit() or not _pid_alive(int(pid)):
+                        dead.append(job_id)
+                for job_id in dead:
+                    self._conn.execute(
+                        "UPDATE jobs SET state = ?, worker = NULL, started_at = NULL WHERE id = ? AND state = ?",
+                        (QUEUED, job_id, RUNNING),
+                    )
+        return len(dead)
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    def get(self, job_id: int) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row(row)
+
+    def jobs(self, state: str | None = None, limit: int = 100) -> list[dict]:
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM jobs"
+        args = ()
+        if state:
+            sql += " WHERE state = ?"
+            args = (state,)
+        sql += " ORDER BY id DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, (*args, limit)).fetchall()
+        return [self._row(r) for r in rows]
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return dict(rows)
+
+
+# ------------------------------------------------------------
+# daemon
+# ------------------------------------------------------------
+def run_job(job: dict, threads: int = DEFAULT_THREADS, queue: DailiesQueue | None = None) -> str:
+    last_write = [0.0]
+
+    def on_progress(event):
+        # ffmpeg -progress 이벤트 → status 조회용 (타이밍 전체는 ffmpeg_run 로그)
+        now = time.time()
+        if queue is not None and (event["done"] or now - last_write[0] >= _PROGRESS_WRITE_INTERVAL):
+            last_write[0] = now
+            queue.update_progress(job["id"], event["percent"], event["fps"])
+
+    output = generate_preview(
+        job["show"], job["ep"], job["seq"], job["shot"], job["lut"] or None,
+        fps=job["fps"], version=job["version"], threads=threads, on_progress=on_progress,
+    )
+    if not output:
+        # 렌더 없음 / 프레임 누락 — 자세한 내용은 daemon 로그
+        raise RuntimeError("preview not generated (missing render or frame gaps)")
+    return str(output)
+
+
+def serve(workers: int = DEFAULT_WORKERS, threads: int = DEFAULT_THREADS, queue: DailiesQueue | None = None,
+          stop: threading.Event | None = None):
+    queue = queue or DailiesQueue()
+    stop = stop or threading.Event()
+    host = socket.gethostname()
+
+    stale = queue.requeue_stale(host)
+    print(f"🎞  dailies_daemon: {workers} workers x {threads} threads, queue {queue.db_path}"
+          + (f"  ({stale} stale job(s) requeued)" if stale else ""), flush=True)
+
+    def worker(index):
+        name = f"{host}:{os.getpid()}:{index}"
+        while not stop.is_set():
+            job = queue.claim(name)
+            if job is None:
+                stop.wait(_POLL_INTERVAL)
+                continue
+
+            t0 = time.time()
+            print(f"▶️  [{job['id']}] {job['key']}  (priority {job['priority']})", flush=True)
+            try:
+                output = run_job(job, threads, queue)
+            except Exception as e:
+                queue.finish(job["id"], error=f"{e}\n{traceback.format_exc(limit=3)}")
+                print(f"❌ [{job['id']}] {job['key']}: {e}", flush=True)
+            else:
+                queue.finish(job["id"], output=output)
+                print(f"✅ [{job['id']}] {job['key']} in {time.time() - t0:.1f}s → {output}", flush=True)
+
+    threads_ = [
+        threading.Thread(target=worker, args=(i,), name=f"dailies-{i}", daemon=True)
+        for i in range(max(1, workers))
+    ]
+    for t in threads_:
+        t.start()
+    try:
+        while any(t.is_alive() for t in threads_):
+            for t in threads_:
+                t.join(timeout=1.0)
+    except KeyboardInterrupt:
+        print("⏹  stopping — running jobs finish first", flush=True)
+        stop.set()
+        for t in threads_:
+            t.join()
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def _print_jobs(jobs):
+    for j in jobs:
+        took = ""
+        if j["started_at"] and j["finished_at"]:
+            took = f"  {j['finished_at'] - j['started_at']:.1f}s"
+        elif j["state"] == RUNNING and j["progress"] is not None:
+            took = f"  {j['progress']}% @ {j['encode_fps'] or 0:.1f} fps"
+        print(f"{j['id']:>5}  {j['state']:<9}  p{j['priority']:<3}  {j['key']}{took}  {j['output'] or ''}")
+        if j["state"] == FAILED and j["error"]:
+            print(f"       {j['error'].splitlines()[0]}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SKYFALL dailies daemon (queued preview rendering)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="Run the worker pool")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="ffmpeg threads per job")
+
+    p = sub.add_parser("submit", help="Queue a preview")
+    for name in ("show", "ep", "seq", "shot"):
+        p.add_argument(name)
+    p.add_argument("--lut", help="LUT name or path (default: project.yml preview_lut)")
+    p.add_argument("--version", type=int, help="Render version (default: latest at submit time)")
+    p.add_argument("--fps", type=float, help="Default: project.yml fps")
+    p.add_argument("--priority", type=int, default=PRIORITY_NORMAL,
+                   help=f"{PRIORITY_SUPERVISOR}=supervisor review, {PRIORITY_NORMAL}=normal, "
+                        f"{PRIORITY_BACKGROUND}=background")
+
+    p = sub.add_parser("status", help="Show jobs")
+    p.add_argument("--state", choices=(QUEUED, RUNNING, DONE, FAILED, CANCELLED))
+    p.add_argument("--limit", type=int, default=50)
+
+    p = sub.add_parser("cancel", help="Cancel a queued job")
+    p.add_argument("job_id", type=int)
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.workers, args.threads)
+
+    elif args.command == "submit":
+        try:
+            job = DailiesQueue().submit(
+                args.show, args.ep, args.seq, args.shot, args.lut,
+                version=args.version, fps=args.fps, priority=args.priority,
+            )
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        mark = "↺ already queued" if job["duplicate"] else "➕ queued"
+        print(f"{mark}: [{job['id']}] {job['key']}  ({job['state']}, priority {job['priority']})")
+
+    elif args.command == "status":
+        queue = DailiesQueue()
+        print("  ".join(f"{k}: {v}" for k, v in sorted(queue.counts().items())))
+        _print_jobs(queue.jobs(args.state, args.limit))
+
+    elif args.command == "cancel":
+        ok = DailiesQueue().cancel(args.job_id)
+        print("✅ cancelled" if ok else "❌ not cancellable (not queued)")
+        sys.exit(0 if ok else 1)
@@ -115,3 +115,50 @@ def create_shot_with_tasks(
         _post("/task-items", task_payload)
 
     return shot
+
+
+# ---------------------------------------------------------------------------
+# STATUS 조회 (dailies playlist 등)
+# ---------------------------------------------------------------------------
+
+def get_task_status_id(short_name: str) -> str:
+    for s in _get("/task-status"):
+        if s["short_name"].lower() == short_name.lower() or s["name"].lower() == short_name.lower():
+            return s["id"]
+    raise ValueError(f"TaskStatus '{short_name}' not found")
+
+
+def shots_with_status(
+    project_id: str,
+    task_type: str,
+    status: str,
+    episode: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """
+    task_type (예: Compositing) 의 status (예: wfa) 인 shot 목록
+    → [{"episode": "EP01", "sequence": "S001", "shot": "0010"}, ...] (ep / seq / shot 순 정렬)
+    요청 4번 (tasks / shots / sequences / episodes) 으로 끝냄 — shot 마다 조회하지 않음
+    """
+    if task_type not in TASK_TYPES:
+        raise ValueError(f"TaskType '{task_type}' not found")
+
+    tasks = _get(
+        f"/tasks?project_id={project_id}&task_type_id={TASK_TYPES[task_type]}"
+        f"&task_status_id={get_task_status_id(status)}"
+    )
+    shots = {s["id"]: s for s in _get(f"/projects/{project_id}/shots")}
+    sequences = {s["id"]: s for s in _get(f"/projects/{project_id}/sequences")}
+    episodes = {e["id"]: e for e in _get(f"/projects/{project_id}/episodes")}
+
+    out = []
+    for task in tasks:
+        shot = shots.get(task["entity_id"])
+        if not shot:
+            continue
+        seq = sequences.get(shot.get("parent_id")) or {}
+        ep = episodes.get(seq.get("parent_id")) or {}
+        if episode and ep.get("name") != episode:
+            continue
+        out.append({"episode": ep.get("name", ""), "sequence": seq.get("name", ""), "shot": shot["name"]})
+
+    return sorted(out, key=lambda s: (s["episode"], s["sequence"], s["shot"]))
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# pipeline 루트 (core / tools / apps) 를 import 경로에
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,63 @@
+"""headless collect — 복사 실패가 있으면 스크립트 단위 실패로 처리되는지"""
+
+import os
+
+from core.io import copy_scheduler
+from tools.collect.headless_collect import collect_script
+
+
+def _make_script(tmp_path, frames):
+    src = tmp_path / "plates" / "A"
+    src.mkdir(parents=True)
+    for f in frames:
+        (src / f"A.{f}.exr").write_bytes(b"exr %d" % f)
+    script = tmp_path / "shot_v001.nk"
+    script.write_text(
+        "Root {\n name shot_v001.nk\n}\n"
+        "Read {\n"
+        f" file {src}/A.%04d.exr\n"
+        f" first {frames[0]}\n"
+        f" last {frames[-1]}\n"
+        " name Read1\n"
+        "}\n",
+        encoding="utf-8",
+    )
+    return script
+
+
+def test_copy_error_fails_script(tmp_path, monkeypatch):
+    script = _make_script(tmp_path, [1001, 1002, 1003])
+    real_copy = copy_scheduler.copy_file
+
+    def flaky_copy(src, dst, *args, **kwargs):
+        if src.endswith("A.1002.exr"):
+            raise OSError(5, "Input/output error")
+        return real_copy(src, dst, *args, **kwargs)
+
+    monkeypatch.setattr(copy_scheduler, "copy_file", flaky_copy)
+
+    out = tmp_path / "out"
+    result = collect_script(str(script), str(out))
+
+    assert result["errors"] == 1
+    assert result["copied"] == 2
+    assert result["output"] is None
+    assert "failed" in result["error"]
+
+    target = out / "shot_v001"
+    # relink 스크립트 / hashlist 는 남기지 않음
+    assert not (target / "shot_v001.nk").exists()
+    assert not (target / "hashlist.md5").exists()
+    assert not os.path.exists(target / "footage" / "A" / "A.1002.exr")
+
+
+def test_clean_collect_succeeds(tmp_path):
+    script = _make_script(tmp_path, [1001, 1002])
+    out = tmp_path / "out"
+    result = collect_script(str(script), str(out))
+
+    assert result["errors"] == 0
+    assert result["output"] == str(out / "shot_v001")
+    hashlist = (out / "shot_v001" / "hashlist.md5").read_text()
+    assert "footage/A/A.1001.exr" in hashlist
+    assert "footage/A/A.1002.exr" in hashlist
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SKYFALL Pipeline — headless_collect
+
+Nuke 를 띄우지 않고 .nk 파일을 직접 파싱해서 collect.
+복사 / relink / manifest / hashlist 규칙은 Nuke 의 Collect Files 와 동일
+(core/io/collect.py 공용).
+
+  - file knob 이 있는 모든 노드 (Write 제외), first/last 는 있으면 사용
+  - 스크립트마다 <out>/<script 이름>/ 에 collect (또는 아카이브 1개)
+  - 스크립트 단위로 process pool 병렬 처리
+
+  python3 headless_collect.py --out /Volumes/archive/BBF_EP01 a.nk b.nk
+  python3 headless_collect.py --out /Volumes/archive/BBF --show-dir /Volumes/skyfall/shows/BBF --latest
+  python3 headless_collect.py --out /Volumes/outbound --archive tar.gz --processes 4 shot.nk
+"""
+
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+PIPELINE_ROOT = Path(os.getenv("PIPELINE_ROOT", "/opt/pipeline")).resolve()
+if str(PIPELINE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PIPELINE_ROOT))
+
+from core.io.collect import ARCHIVE_FORMATS, Collector
+from core.io.copy_scheduler import PRIORITY_BACKGROUND, set_process_share
+from core.io.nk_script import media_nodes, read_script, replace_knob_values
+
+# show 트리 스캔 시 건너뛸 폴더
+SKIP_DIRS = {"bk", "backup", ".autosave", "__pycache__"}
+_VERSION_RE = re.compile(r"_v(\d+)")
+
+
+# ------------------------------------------------------------
+# 대상 스크립트
+# ------------------------------------------------------------
+def find_scripts(show_dir: str, latest: bool = False) -> list[str]:
+    """show 디렉토리 아래 모든 .nk (autosave / bk 제외). latest=True 면 폴더·이름별 최신 버전만"""
+    found = []
+    for dirpath, dirs, files in os.walk(show_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+        for f in files:
+            if f.endswith(".nk") and not f.startswith("."):
+                found.append(os.path.join(dirpath, f))
+
+    if not latest:
+        return sorted(found)
+
+    best: dict[tuple[str, str], tuple[int, str]] = {}
+    for path in found:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        m = _VERSION_RE.search(stem)
+        version = int(m.group(1)) if m else 0
+        key = (os.path.dirname(path), _VERSION_RE.sub("", stem))
+        if key not in best or version > best[key][0]:
+            best[key] = (version, path)
+    return sorted(p for _v, p in best.values())
+
+
+# ------------------------------------------------------------
+# 스크립트 1개 (worker process)
+# ------------------------------------------------------------
+def collect_script(script: str, out_root: str, archive: str | None = None, copy_workers: int = 4) -> dict:
+    t0 = time.time()
+    script_name = os.path.basename(script)
+    stem = os.path.splitext(script_name)[0]
+    # 폴더: <out>/<stem>/...  아카이브: <out>/<stem>.tar.gz
+    target_dir = out_root if archive else os.path.join(out_root, stem)
+    os.makedirs(target_dir, exist_ok=True)
+
+    def log(message):
+        print(f"[{stem}] {message}", flush=True)
+
+    lines, nodes = read_script(script)
+    collector = Collector(
+        target_dir,
+        archive=archive,
+        archive_name=stem,
+        workers=copy_workers,
+        priority=PRIORITY_BACKGROUND,
+        log=log,
+    )
+
+    replacements = {}
+    for media in media_nodes(nodes):
+        replacements[media["line"]] = collector.add_media(
+            media["file"], media["first"], media["last"], node=media["node"]["name"]
+        )
+
+    stats = collector.copy()
+    result = {
+        "script": script,
+        "media": len(replacements),
+        "copied": stats.files_done,
+        "bytes": stats.bytes_done,
+        "errors": len(stats.errors),
+        "missing": collector.manifest.counts["missing"],
+        "output": None,
+    }
+    # 복사 실패가 1개라도 있으면 실패 — output 없음 (relink 스크립트 / hashlist 도 만들지 않음)
+    if stats.cancelled or stats.errors or not collector.ok:
+        result["error"] = "cancelled" if stats.cancelled else f"{len(stats.errors)} file(s) failed to copy"
+        result["seconds"] = round(time.time() - t0, 2)
+        return result
+
+    # relink 된 스크립트 — 원본 .nk 는 건드리지 않음
+    text = replace_knob_values(lines, replacements)
+    if archive:
+        fd, tmp_script = tempfile.mkstemp(suffix=".nk")
+        os.close(fd)
+        try:
+            with open(tmp_script, "w", encoding="utf-8", errors="surrogateescape") as f:
+                f.write(text)
+            os.chmod(tmp_script, 0o644)
+            result["output"] = collector.finish(tmp_script, script_name)
+        finally:
+            os.remove(tmp_script)
+    else:
+        new_script = os.path.join(target_dir, script_name)
+        with open(new_script + ".tmp", "w", encoding="utf-8", errors="surrogateescape") as f:
+            f.write(text)
+        os.replace(new_script + ".tmp", new_script)
+        result["output"] = collector.finish(new_script, script_name)
+
+    result["seconds"] = round(time.time() - t0, 2)
+    return result
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def collect_all(
+    scripts: list[str],
+    out_root: str,
+    archive: str | None = None,
+    processes: int = 4,
+    copy_workers: int = 4,
+) -> list[dict]:
+    print(f"📦 {len(scripts)} script(s) → {out_root}  ({processes} processes x {copy_workers} copy threads)")
+    t0 = time.time()
+    results = []
+
+    # SKYFALL_COPY_BPS / volume 제한은 프로세스 합계 기준 → worker 마다 1/n 씩
+    processes = max(1, processes)
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=set_process_share,
+        initargs=(processes,),
+    ) as pool:
+        futures = {
+            pool.submit(collect_script, s, out_root, archive, copy_workers): s for s in scripts
+        }
+        for fut in as_completed(futures):
+            script = futures[fut]
+            try:
+                r = fut.result()
+            except Exception as e:
+                print(f"❌ {script}: {e}")
+                results.append({"script": script, "output": None, "error": str(e)})
+                continue
+            results.append(r)
+            mark = "✅" if r["output"] else "❌"
+            print(
+                f"{mark} {script}  {r['media']} media, {r['copied']} copied "
+                f"({r['bytes'] / (1024 * 1024):.1f} MB), {r['missing']} missing, "
+                f"{r['errors']} errors in {r['seconds']}s → {r['output'] or r.get('error')}"
+            )
+
+    failed = sum(1 for r in results if not r.get("output"))
+    print(f"\n🎉 collect done: {len(results) - failed} ok, {failed} failed in {time.time() - t0:.1f}s")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SKYFALL headless collect (no Nuke)")
+    parser.add_argument("scripts", nargs="*", help=".nk scripts to collect")
+    parser.add_argument("--out", required=True, help="Output root — one folder/archive per script")
+    parser.add_argument("--show-dir", help="Collect every .nk under this directory")
+    parser.add_argument("--latest", action="store_true", help="With --show-dir: only the latest _vNNN per script")
+    parser.add_argument("--archive", choices=ARCHIVE_FORMATS, help="Write an archive instead of a folder")
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1), help="Scripts in parallel")
+    parser.add_argument("--copy-workers", type=int, default=4, help="Copy threads per script")
+    args = parser.parse_args()
+
+    scripts = list(args.scripts)
+    if args.show_dir:
+        scripts.extend(find_scripts(args.show_dir, args.latest))
+    if not scripts:
+        parser.error("give .nk scripts or --show-dir")
+
+    results = collect_all(
+        scripts,
+        args.out,
+        archive=args.archive,
+        processes=args.processes,
+        copy_workers=args.copy_workers,
+    )
+    sys.exit(0 if all(r.get("output") for r in results) else 1)
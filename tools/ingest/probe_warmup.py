@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SKYFALL Pipeline — probe_warmup
+
+ingest 후 plates 트리 전체를 병렬로 미리 probe 해서
+공용 probe 캐시(core/io/probe_cache.py, $SKYFALL_ROOT/cache)를 채움.
+이후 Nuke Load Plate / dailies reel 은 같은 캐시에서 hit (바뀐 파일만 다시 probe).
+공용 위치에 쓸 수 없으면 (로컬 캐시로 떨어지면) --local 없이는 실행하지 않음.
+
+  - MOV/MP4/MXF: fps, frame 수, 해상도, 코덱, 타임코드
+  - EXR/DPX 시퀀스: 디렉토리당 첫 프레임 헤더
+    (--all-frames 면 전체 프레임 헤더 — 잘린 전송 파일 검사용)
+
+  python3 probe_warmup.py --show BBF
+  python3 probe_warmup.py --show BBF --ep EP01 --workers 16
+  python3 probe_warmup.py /Volumes/skyfall/shows/BBF/plates/EP01
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+PIPELINE_ROOT = Path(os.getenv("PIPELINE_ROOT", "/opt/pipeline")).resolve()
+if str(PIPELINE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PIPELINE_ROOT))
+
+from core.env.pipeline_env import SHOWS_DIR
+from core.io.image_headers import IMAGE_EXTENSIONS
+from core.io.probe_cache import VIDEO_EXTENSIONS, get_cache
+
+
+# ------------------------------------------------------------
+# 대상 수집
+# ------------------------------------------------------------
+def show_plate_roots(show: str, ep: str | None = None) -> list[Path]:
+    """
+    /shows/<SHOW>/plates/<EP?>       (ingest 원본)
+    /shows/<SHOW>/<EP>/<SEQ>/<SHOT>/plate  (샷 plate)
+    """
+    show_root = SHOWS_DIR / show
+    roots = [show_root / "plates" / ep if ep else show_root / "plates"]
+
+    pattern = f"{ep}/*/*/plate" if ep else "*/*/*/plate"
+    roots.extend(p for p in show_root.glob(pattern) if p.is_dir())
+    return [r for r in roots if r.is_dir()]
+
+
+def iter_media(roots: list[Path], all_frames: bool = False):
+    for root in roots:
+        for dirpath, _dirs, files in os.walk(root):
+            seen_ext = set()
+            for f in sorted(files):
+                if f.startswith("."):
+                    continue
+                lower = f.lower()
+                if lower.endswith(VIDEO_EXTENSIONS):
+                    yield os.path.join(dirpath, f)
+                elif lower.endswith(IMAGE_EXTENSIONS):
+                    ext = os.path.splitext(lower)[1]
+                    if all_frames or ext not in seen_ext:
+                        seen_ext.add(ext)
+                        yield os.path.join(dirpath, f)
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def warmup(
+    roots: list[Path],
+    workers: int = 8,
+    refresh: bool = False,
+    all_frames: bool = False,
+) -> dict:
+    cache = get_cache()
+    files = sorted(set(iter_media(roots, all_frames)))
+
+    print(f"🔎 {len(files)} media files under {len(roots)} root(s)")
+    stats = {"total": len(files), "cached": 0, "probed": 0, "failed": 0}
+    t0 = time.time()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(cache.probe, f, refresh): f for f in files}
+        for fut in as_completed(futures):
+            path = futures[fut]
+            try:
+                info = fut.result()
+            except Exception as e:
+                stats["failed"] += 1
+                print(f"❌ {path}: {e}")
+                continue
+
+            if info.get("cached"):
+                stats["cached"] += 1
+            elif info.get("error") and not info.get("frames"):
+                stats["failed"] += 1
+                print(f"❌ {path}: {info['error']}")
+            else:
+                stats["probed"] += 1
+                print(
+                    f"✅ {path}  {info.get('width')}x{info.get('height')} "
+                    f"{info.get('frames')}f @ {info.get('fps')} ({info.get('method')})"
+                )
+
+    stats["seconds"] = round(time.time() - t0, 2)
+    print(
+        f"\n🎉 probe cache warm: {stats['probed']} probed, {stats['cached']} already cached, "
+        f"{stats['failed']} failed in {stats['seconds']}s → {cache.db_path}"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SKYFALL probe cache warm-up")
+    parser.add_argument("paths", nargs="*", help="Explicit plate directories")
+    parser.add_argument("--show", help="Show code (e.g. BBF) — scans plates/ and shot plate/ dirs")
+    parser.add_argument("--ep", help="Limit --show scan to one episode")
+    parser.add_argument("--workers", type=int, default=8, help="Parallel probes (default 8)")
+    parser.add_argument("--refresh", action="store_true", help="Re-probe even if cached")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Allow warming this user's local cache (other machines will not see it)",
+    )
+    parser.add_argument(
+        "--all-frames",
+        action="store_true",
+        help="Read every EXR/DPX frame header, not just the first per directory",
+    )
+    args = parser.parse_args()
+
+    roots = [Path(p) for p in args.paths]
+    if args.show:
+        roots.extend(show_plate_roots(args.show, args.ep))
+
+    if not roots:
+        parser.error("give --show or at least one path")
+
+    if get_cache().is_local and not args.local:
+        parser.error(
+            f"probe cache resolves to the local file {get_cache().db_path} — "
+            "artists would not see it. Fix write access to the shared cache, "
+            "set SKYFALL_PROBE_CACHE, or pass --local"
+        )
+
+    warmup(roots, workers=args.workers, refresh=args.refresh, all_frames=args.all_frames)
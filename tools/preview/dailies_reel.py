@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SKYFALL Pipeline — dailies_reel
+
+shot preview MOV (comp/preview) 들을 이어 붙여서 dailies 릴 1개로.
+  shows/<SHOW>/dailies/<EP>/<YYYY-MM-DD>_<name>.mov
+
+  - playlist: 텍스트 파일 (EP01_S001_0010 [v003] / MOV 경로, # 주석) 또는 Kitsu status
+  - 클립마다 probe (probe_cache) → codec / 해상도 / fps / pix_fmt / profile (ProRes HQ / LT ...) 비교
+  - 기준 포맷 = project.yml preview_format 의 review 인코딩 (codec / pix_fmt / profile) + 가장 많은 해상도 / fps
+    같은 클립은 그대로, 다른 클립만 review 설정 그대로 재인코딩
+  - ffmpeg concat demuxer + -c copy → 재인코딩 없이 이어 붙임 (200 shot 도 수 초)
+
+  python3 dailies_reel.py BBF EP01 --playlist teamreview.txt --name teamreview
+  python3 dailies_reel.py BBF EP01 --kitsu-status wfa --task-type Compositing --name teamreview
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from lib.pipeline_env import SKYFALL_ROOT
+from core.io.media_probe import METHOD_DEFAULT, probe_stream_format
+from core.io.probe_cache import get_cache
+from core.utils.project import get_preview_format
+from tools.preview.preview_v008_final import movie_encode_args
+
+# encoder → ffprobe codec_name (media_probe 는 stts / ffprobe 둘 다 codec_name 으로 기록)
+_ENCODER_CODEC = {"libx264": "h264", "libx265": "hevc"}
+# ffprobe 가 보고하는 profile 이름 (소문자), prores_ks -profile:v 0..4 순서
+_PRORES_PROFILE = ("proxy", "lt", "standard", "hq", "4444")
+_X264_PROFILE = {
+    "baseline": "constrained baseline", "main": "main", "high": "high",
+    "high10": "high 10", "high422": "high 4:2:2", "high444": "high 4:4:4 predictive",
+}
+# -profile:v 를 안 줬을 때 encoder 가 pix_fmt 보고 고르는 profile
+_DEFAULT_PROFILE = {
+    "libx264": {
+        "yuv420p": "high", "yuv420p10le": "high 10",
+        "yuv422p": "high 4:2:2", "yuv422p10le": "high 4:2:2",
+        "yuv444p": "high 4:4:4 predictive", "yuv444p10le": "high 4:4:4 predictive",
+    },
+    "libx265": {"yuv420p": "main", "yuv420p10le": "main 10"},
+}
+_SHOT_RE = re.compile(r"^(?P<ep>[^_\s]+)_(?P<seq>[^_\s]+)_(?P<shot>[^_\s]+)$")
+
+
+def show_root(show) -> Path:
+    return Path(SKYFALL_ROOT) / "shows" / show
+
+
+def reel_path(show, ep, name, date=None) -> Path:
+    return show_root(show) / "dailies" / ep / f"{date or time.strftime('%Y-%m-%d')}_{name}.mov"
+
+
+# ------------------------------------------------------------
+# playlist → preview MOV 목록
+# ------------------------------------------------------------
+def find_preview(show, ep, seq, shot, version=None) -> Path | None:
+    """comp/preview 의 review MOV (proxy 제외). version None = 최신"""
+    preview_dir = show_root(show) / ep / seq / shot / "comp" / "preview"
+    pattern = re.compile(rf"^{re.escape(f'{ep}_{seq}_{shot}')}_comp_v(\d+)\.mov$")
+    found = {}
+    try:
+        with os.scandir(preview_dir) as it:
+            for e in it:
+                m = pattern.match(e.name)
+                if m:
+                    found[int(m.group(1))] = Path(e.path)
+    except OSError:
+        return None
+    if not found:
+        return None
+    return found.get(version) if version is not None else found[max(found)]
+
+
+def read_playlist(path) -> list[tuple]:
+    """
+    한 줄에 1개: "EP01_S001_0010", "EP01_S001_0010 v003" 또는 MOV 경로
+    반환: [(label, ep, seq, shot, version | None, path | None)]
+    """
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if line.lower().endswith((".mov", ".mp4")):
+                entries.append((line, None, None, None, None, Path(line)))
+                continue
+            code, _, version = line.partition(" ")
+            m = _SHOT_RE.match(code)
+            if not m:
+                print(f"⚠️ playlist: cannot parse '{line}'")
+                continue
+            version = version.strip().lower().lstrip("v")
+            entries.append((code, m["ep"], m["seq"], m["shot"], int(version) if version else None, None))
+    return entries
+
+
+def kitsu_playlist(show, ep, task_type, status) -> list[tuple]:
+    """Kitsu status 기준 (services/kitsu_api.py — import 시 서버 접속하므로 여기서만 import)"""
+    from services.kitsu_api import find_project, shots_with_status
+
+    project = find_project(show)
+    if not project:
+        raise ValueError(f"Kitsu project '{show}' not found")
+    return [
+        (f"{s['episode']}_{s['sequence']}_{s['shot']}", s["episode"], s["sequence"], s["shot"], None, None)
+        for s in shots_with_status(project["id"], task_type, status, episode=ep)
+    ]
+
+
+def resolve_clips(show, entries) -> list[dict]:
+    clips = []
+    for label, ep, seq, shot, version, path in entries:
+        if path is None:
+            path = find_preview(show, ep, seq, shot, version)
+        if path is None or not path.exists():
+            print(f"⚠️ {label}: no preview MOV" + (f" v{version:03d}" if version else ""))
+            continue
+        clips.append({"label": label, "path": path})
+    return clips
+
+
+# ------------------------------------------------------------
+# 포맷 비교 / 재인코딩
+# ------------------------------------------------------------
+def _lower(value) -> str | None:
+    return str(value).strip().lower() if value else None
+
+
+def clip_format(info: dict) -> tuple:
+    """(codec, width, height, fps, pix_fmt, profile) — 하나라도 다르면 stream copy 불가"""
+    fps = round(float(info["fps"]), 3) if info.get("fps") else None
+    return (
+        _lower(info.get("codec")) or "", info.get("width"), info.get("height"), fps,
+        _lower(info.get("pix_fmt")), _lower(info.get("profile")),
+    )
+
+
+def matches_reference(fmt: tuple, ref: tuple) -> bool:
+    """ref 의 None (review 설정으로는 알 수 없는 값) 은 비교하지 않음"""
+    return all(r is None or f == r for f, r in zip(fmt, ref))
+
+
+def probe_clips(clips, workers=8):
+    cache = get_cache()
+    paths = [str(c["path"]) for c in clips]
+    infos = cache.probe_many(paths, workers=workers)
+
+    # stts 로 probe 된 MOV 는 pix_fmt / profile 이 없음 → ffprobe 로 채워서 캐시에도 다시 저장
+    def fill(item):
+        path, info = item
+        try:
+            info.update(probe_stream_format(path))
+        except Exception as e:
+            print(f"⚠️ {path}: pix_fmt / profile probe failed ({e})")
+            return
+        if info.get("method") != METHOD_DEFAULT:
+            cache.put(path, info)
+
+    missing = [(p, i) for p, i in zip(paths, infos) if "pix_fmt" not in i]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(missing)))) as pool:
+            list(pool.map(fill, missing))
+
+    for clip, info in zip(clips, infos):
+        clip["info"] = info
+        clip["format"] = clip_format(info)
+
+
+def review_spec(show) -> dict:
+    """project.yml preview_format 의 review 출력 (없으면 첫 movie 출력)"""
+    formats = get_preview_format(show)
+    if "review" in formats:
+        return formats["review"]
+    movies = [o for o in formats.values() if o.get("kind", "movie") == "movie"]
+    if not movies:
+        raise ValueError(f"{show}: preview_format has no movie output to conform to")
+    return movies[0]
+
+
+def encoded_format(spec: dict) -> tuple:
+    """review 설정으로 인코딩했을 때 clip_format() 이 보게 될 (codec, pix_fmt, profile), 모르는 값은 None"""
+    codec = spec.get("codec", "libx264")
+    pix_fmt = _lower(spec.get("pix_fmt"))
+    profile = spec.get("profile")
+    if codec.startswith("prores"):
+        level = int(3 if profile is None else profile)
+        # prores_ks 기본 pix_fmt: 4444 만 yuv444p10le
+        pix_fmt = pix_fmt or ("yuv444p10le" if level >= 4 else "yuv422p10le")
+        return "prores", pix_fmt, _PRORES_PROFILE[level]
+    if profile is None:
+        profile = _DEFAULT_PROFILE.get(codec, {}).get(pix_fmt)
+    elif codec == "libx264":
+        profile = _X264_PROFILE.get(_lower(profile), _lower(profile))
+    else:
+        profile = _lower(profile)
+    return _ENCODER_CODEC.get(codec, codec), pix_fmt, profile
+
+
+def reference_format(clips, spec: dict) -> tuple:
+    """codec / pix_fmt / profile = review 인코딩, 해상도 / fps = 가장 많은 클립 (같으면 먼저 나온 쪽)"""
+    width, height, fps = Counter(c["format"][1:4] for c in clips).most_common(1)[0][0]
+    codec, pix_fmt, profile = encoded_format(spec)
+    return (codec, width, height, fps, pix_fmt, profile)
+
+
+def conform_clip(src, dst, fmt, spec: dict, threads=None):
+    """fmt 의 해상도 / fps 로, review 출력과 같은 인코딩 설정 (spec) 으로 재인코딩"""
+    _codec, width, height, fps, _pix_fmt, _profile = fmt
+    cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(src), "-an"]
+    filters = []
+    if width and height:
+        # 비율 유지 + letterbox
+        filters.append(
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+        )
+    if filters:
+        cmd += ["-vf", ",".join(filters)]
+    if fps:
+        cmd += ["-r", str(fps)]
+    cmd += [str(a) for a in spec.get("args", [])]
+    cmd += movie_encode_args(spec, threads)
+    cmd.append(str(dst))
+    subprocess.run(cmd, check=True)
+
+
+def _concat_line(path) -> str:
+    # concat demuxer: 작은따옴표는 '\'' 로
+    return "file '" + str(path).replace("'", "'\\''") + "'\n"
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+def build_reel(show, ep, entries, name="dailies", output=None, workers=4) -> Path | None:
+    t0 = time.time()
+    clips = resolve_clips(show, entries)
+    if not clips:
+        print("❌ No preview clips")
+        return None
+
+    probe_clips(clips)
+    spec = review_spec(show)
+    ref = reference_format(clips, spec)
+    mismatched = [c for c in clips if not matches_reference(c["format"], ref)]
+    target = " ".join(str(v) for v in (ref[0], f"{ref[1]}x{ref[2]}", f"@ {ref[3]}", ref[4], ref[5]) if v)
+    print(f"🎞  {len(clips)} clips, reference {target}  ({len(mismatched)} to conform)")
+
+    output = Path(output) if output else reel_path(show, ep, name)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix=".reel_", dir=str(output.parent)) as tmp:
+        # 다른 포맷만 재인코딩 (병렬)
+        def conform(item):
+            i, clip = item
+            dst = Path(tmp) / f"{i:04d}_{clip['path'].name}"
+            print(f"   ↻ {clip['label']}: {clip['format']} → conform")
+            conform_clip(clip["path"], dst, ref, spec, threads=max(1, (os.cpu_count() or 1) // max(1, workers)))
+            clip["source"] = dst
+
+        for clip in clips:
+            clip["source"] = clip["path"]
+        if mismatched:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                list(pool.map(conform, [(i, c) for i, c in enumerate(clips) if not matches_reference(c["format"], ref)]))
+
+        list_file = Path(tmp) / "concat.txt"
+        list_file.write_text("".join(_concat_line(c["source"]) for c in clips), encoding="utf-8")
+
+        part = output.with_name(output.stem + ".part" + output.suffix)
+        cmd = [
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_file),
+            "-c", "copy", "-movflags", "+faststart",
+            str(part),
+        ]
+        print(" ".join(cmd))
+        subprocess.run(cmd, check=True)
+        os.replace(part, output)
+
+    print(f"🎉 Reel → {output}  ({len(clips)} clips, {len(mismatched)} conformed, {time.time() - t0:.1f}s)")
+    return output
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SKYFALL dailies reel (concat shot previews)")
+    parser.add_argument("show")
+    parser.add_argument("ep")
+    parser.add_argument("--playlist", help="Text file: one shot code (optionally with vNNN) or MOV path per line")
+    parser.add_argument("--kitsu-status", help="Use shots whose task has this Kitsu status (e.g. wfa)")
+    parser.add_argument("--task-type", default="Compositing", help="Kitsu task type for --kitsu-status")
+    parser.add_argument("--name", default="dailies", help="Reel name → <date>_<name>.mov")
+    parser.add_argument("--output", help="Explicit output path")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel re-encodes for mismatched clips")
+    args = parser.parse_args()
+
+    if args.playlist:
+        entries = read_playlist(args.playlist)
+    elif args.kitsu_status:
+        entries = kitsu_playlist(args.show, args.ep, args.task_type, args.kitsu_status)
+    else:
+        parser.error("give --playlist or --kitsu-status")
+
+    result = build_reel(args.show, args.ep, entries, name=args.name, output=args.output, workers=args.workers)
+    sys.exit(0 if result else 1)
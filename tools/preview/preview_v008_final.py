@@ -2,76 +2,315 @@
 # -*- coding: utf-8 -*-
 
 import re
-import subprocess
 from pathlib import Path
 import sys
 
 from lib.pipeline_env import SKYFALL_ROOT
+from core.io.ffmpeg_run import run_ffmpeg
+from core.io.frame_pattern import FramePattern
+from core.io.frame_set import FrameSet
+from core.io.lut_registry import LutError, get_registry, lut_filter
+from core.io.probe_cache import probe_media
+from core.io.render_manifest import DEFAULT_FAST_HASH, RenderManifest, scan_frames
+from core.io.sequence_scan import scan_directory
+from core.utils.project import get_fps, get_preview_format, load_project
 
 
-def detect_render_sequence(show, ep, seq, shot):
-    render_dir = Path(SKYFALL_ROOT) / "shows" / show / ep / seq / shot / "comp" / "render"
-    pattern = re.compile(rf"{ep}_{seq}_{shot}_comp_beauty_v(\d+)_\d{{4}}\.exr")
+def render_dir_for(show, ep, seq, shot) -> Path:
+    return Path(SKYFALL_ROOT) / "shows" / show / ep / seq / shot / "comp" / "render"
 
-    versions = set()
-    for f in render_dir.glob("*.exr"):
-        m = pattern.match(f.name)
-        if m:
-            versions.add(int(m.group(1)))
 
+def scan_render_versions(show, ep, seq, shot):
+    """
+    comp/render 를 1번만 listing → {버전 번호: 시퀀스 dict (frames = 실제 FrameSet)}
+    """
+    render_dir = render_dir_for(show, ep, seq, shot)
+    pattern = re.compile(rf"{ep}_{seq}_{shot}_comp_beauty_v(\d+)_$")
+
+    versions = {}
+    for s in scan_directory(str(render_dir), f"{ep}_{seq}_{shot}_comp_beauty_v"):
+        m = pattern.match(s["prefix"])
+        if m and s["ext"].lower() == ".exr":
+            versions[int(m.group(1))] = s
+    return render_dir, versions
+
+
+def detect_render_sequence(show, ep, seq, shot, version=None):
+    """
+    반환: (version 문자열, render_dir, FramePattern, FrameSet) / 없으면 전부 None
+    version: None = 최신, 정수 = 해당 버전
+    """
+    render_dir, versions = scan_render_versions(show, ep, seq, shot)
     if not versions:
-        return None, None
+        return None, None, None, None
+
+    number = max(versions) if version is None else version
+    if number not in versions:
+        return None, None, None, None
+    s = versions[number]
+    # 실제 padding 그대로 (%04d 하드코딩 X)
+    return f"v{number:03d}", render_dir, FramePattern.from_sequence(s), s["frames"]
+
+
+def report_gaps(version, frames) -> bool:
+    """
+    ffmpeg image2 는 첫 번째 빠진 프레임에서 멈춤 → 인코딩 전에 확인.
+    반환: 빠진 프레임 없으면 True
+    """
+    gaps = frames.gaps()
+    if not gaps:
+        return True
+    print(f"⚠️ {version}: {len(gaps)} missing frame(s) in {frames.first}-{frames.last}  → {gaps}")
+    print(f"   rendered: {frames}")
+    return False
+
+
+# ------------------------------------------------------------
+# ffmpeg filter graph — EXR decode + LUT 1번, 출력 여러 개
+# ------------------------------------------------------------
+def output_paths(preview_dir: Path, base_name: str, outputs: dict) -> dict:
+    """{출력 이름: 경로}  review → <base>.mov, proxy → <base>_proxy.mov ..."""
+    return {
+        name: preview_dir / f"{base_name}{spec.get('suffix', '_' + name)}{spec.get('ext', '.mov')}"
+        for name, spec in outputs.items()
+    }
+
+
+def _burnin_filter(left, right, first_frame):
+    box = "fontcolor=white: box=1: boxcolor=0x00000080"
+    return (
+        f"drawtext=text='{left}': x=40: y=40: fontsize=34: {box},"
+        f"drawtext=text='{right}': x=w-tw-40: y=40: fontsize=34: {box},"
+        f"drawtext=text='Frame:%{{eif\\:n+{first_frame}\\:d}}': x=(w-text_w)/2: y=h-80: fontsize=36: {box}"
+    )
 
-    latest_version = f"v{max(versions):03d}"
-    first_frame = 1001  # change if needed
-    return latest_version, render_dir
 
+def _split(label, targets):
+    return f"{label}split={len(targets)}" + "".join(f"[{t}]" for t in targets)
 
-def generate_preview(show, ep, seq, shot, lut_path, fps=24):
-    version, render_dir = detect_render_sequence(show, ep, seq, shot)
+
+def movie_encode_args(spec: dict, threads=None) -> list:
+    """movie 출력 설정 → ffmpeg 인코딩 옵션 (dailies_reel 의 conform 도 같은 값 사용)"""
+    args = ["-c:v", spec.get("codec", "libx264")]
+    for key, flag in (("crf", "-crf"), ("preset", "-preset"), ("profile", "-profile:v"), ("pix_fmt", "-pix_fmt")):
+        if spec.get(key) is not None:
+            args += [flag, str(spec[key])]
+    if threads:
+        args += ["-threads", str(threads)]
+    return args
+
+
+def build_ffmpeg_cmd(seq_path, first_frame, frame_count, fps, lut_vf, outputs, paths, burnin, threads=None):
+    """
+    lut_vf: lut_registry.lut_filter() 결과 (lut3d=file=... / lut1d=file=...)
+    [0:v] LUT → split ─┬ (burn-in → split) → review / proxy (movie)
+                         ├ poster (select 1 frame)
+                         └ strip  (select N frames → tile)
+    """
+    burned = [n for n, o in outputs.items() if o.get("kind", "movie") == "movie" and o.get("burnin")]
+    clean = [n for n in outputs if n not in burned]
+    sources = {n: f"c_{n}" for n in clean}
+    roots = list(sources.values()) + (["burn"] if burned else [])
+
+    graph = [_split(f"[0:v]{lut_vf},", roots)]
+    if burned:
+        sources.update({n: f"b_{n}" for n in burned})
+        graph.append(_split(f"[burn]{burnin},", [sources[n] for n in burned]))
+
+    maps = []
+    for name, spec in outputs.items():
+        kind = spec.get("kind", "movie")
+        chain = []
+        args = []
+        if kind == "movie":
+            if spec.get("scale") and spec["scale"] != 1:
+                chain.append(f"scale=trunc(iw*{spec['scale']}/2)*2:-2")
+            args += ["-frames:v", str(frame_count), *movie_encode_args(spec, threads)]
+        elif kind == "poster":
+            frame = spec.get("frame", "middle")
+            index = {"middle": frame_count // 2, "first": 0, "last": frame_count - 1}.get(frame)
+            if index is None:
+                index = min(max(int(frame) - first_frame, 0), frame_count - 1)
+            chain.append(f"select='eq(n\\,{index})'")
+            args += ["-frames:v", "1", "-q:v", str(spec.get("quality", 2)), "-update", "1"]
+        elif kind == "strip":
+            count = max(1, min(int(spec.get("count", 10)), frame_count))
+            step = max(1, frame_count // count)
+            chain += [
+                f"select='not(mod(n\\,{step}))'",
+                f"scale={int(spec.get('width', 320))}:-2",
+                f"tile={count}x1",
+            ]
+            args += ["-frames:v", "1", "-q:v", str(spec.get("quality", 4)), "-update", "1"]
+        else:
+            raise ValueError(f"Unknown preview output kind: {kind} ({name})")
+
+        graph.append(f"[{sources[name]}]{','.join(chain) or 'null'}[o_{name}]")
+        maps += ["-map", f"[o_{name}]", *[str(a) for a in spec.get("args", [])], *args, str(paths[name])]
+
+    return [
+        "ffmpeg", "-y",
+        "-r", str(fps),
+        "-start_number", str(first_frame),
+        "-i", str(seq_path),
+        "-filter_complex", ";".join(graph),
+        *maps,
+    ]
+
+
+def print_progress(event):
+    mb_read = (event["bytes_read"] or 0) / (1024 * 1024)
+    print(
+        f"\r   {event['frame']}/{event['total_frames']}f ({event['percent'] or 0}%)"
+        f"  {event['fps'] or 0:.1f} fps  {event['speed'] or 0:.2f}x  read {mb_read:.0f} MB",
+        end="", flush=True,
+    )
+
+
+def generate_preview(show, ep, seq, shot, lut_path=None, fps=None, version=None, allow_gaps=False, threads=None,
+                     outputs=None, force=False, fast_hash=DEFAULT_FAST_HASH, on_progress=None):
+    """
+    EXR 시퀀스를 1번 decode 해서 project.yml preview_format 의 출력 전부 기록.
+    lut_path: LUT 이름 / 경로 (core/io/lut_registry.py), None = project.yml preview_lut
+    fps: None = project.yml fps
+    threads: ffmpeg -threads (dailies_daemon 이 여러 개 동시에 돌릴 때 core 분배용)
+    outputs: 출력 이름 목록 (None = 전부, 예: ["review"])
+    force: source 프레임 / 설정이 그대로여도 다시 인코딩
+    fast_hash: manifest 비교에 프레임 앞뒤 sample hash 추가 (size / mtime 만으로 부족할 때)
+    on_progress(event): ffmpeg 진행 이벤트 (core/io/ffmpeg_run.py), None = 터미널에 한 줄로 표시
+    반환: review MOV 경로 (없으면 첫 movie 출력) — 변경 없어서 skip 해도 같은 경로
+    """
+    # LUT 은 렌더 스캔 전에 확인 (ffmpeg 실행 후에야 실패하지 않게) — 변환은 캐시에 1번만
+    try:
+        lut = get_registry(show).prepare(lut_path)
+    except LutError as e:
+        print(f"❌ LUT: {e}")
+        return
+
+    version, render_dir, frame_pattern, frames = detect_render_sequence(show, ep, seq, shot, version)
     if not version:
         print("❌ No render EXR sequence found")
         return
 
-    exr_pattern = f"{ep}_{seq}_{shot}_comp_beauty_{version}_%04d.exr"
-    seq_path = render_dir / exr_pattern
+    if not report_gaps(version, frames) and not allow_gaps:
+        print("❌ Render has gaps — re-render or pass --allow-gaps (encodes up to the first gap)")
+        return
+
+    first_frame, last_frame = frames.first, frames.last
+    if not frames.is_contiguous():
+        # 첫 구간만 인코딩 (ffmpeg 가 어차피 여기서 멈춤) — 번인에 실제 범위 표시
+        last_frame = frames.ranges()[0][1]
+    seq_path = frame_pattern.printf()
+
+    project = load_project(show)
+    fps = float(fps or get_fps(project=project))
+    fps = int(fps) if fps.is_integer() else fps   # 24.0 → 24 (번인 "24fps", manifest 설정)
+    formats = get_preview_format(project=project)
+    if outputs:
+        formats = {n: o for n, o in formats.items() if n in outputs}
+    if not formats:
+        print("❌ No preview outputs configured")
+        return
 
     preview_dir = Path(SKYFALL_ROOT) / "shows" / show / ep / seq / shot / "comp" / "preview"
     preview_dir.mkdir(parents=True, exist_ok=True)
-    output_path = preview_dir / f"{ep}_{seq}_{shot}_comp_{version}.mov"
+    paths = output_paths(preview_dir, f"{ep}_{seq}_{shot}_comp_{version}", formats)
 
     burn_show = show
     burn_code = f"{ep}_{seq}_{shot}"
     burn_info_left = f"{burn_show}  {burn_code}  {version}"
-    frame_range = "1001-1263"  # optional, auto-detect next version
-    burn_info_right = f"{fps}fps   F:{frame_range}"
+    frame_range = f"{first_frame}-{last_frame}"
+    burn_info_right = f"{fps:g}fps   F:{frame_range}"
 
-    ffmpeg_cmd = [
-        "ffmpeg", "-y",
-        "-r", str(fps),
-        "-start_number", "1001",
-        "-i", str(seq_path),
-        "-vf",
-        f"lut3d='{lut_path}',"
-        f"drawtext=text='{burn_info_left}': fontcolor=white: x=40: y=40: fontsize=34: box=1: boxcolor=0x00000080,"
-        f"drawtext=text='{burn_info_right}': fontcolor=white: x=w-tw-40: y=40: fontsize=34: box=1: boxcolor=0x00000080,"
-        f"drawtext=text='Frame:%{{eif\\:t+1001\\:d}}': fontcolor=white: x=(w-text_w)/2: y=h-80: fontsize=36: box=1: boxcolor=0x00000080",
-        "-c:v", "libx264", "-crf", "17", "-pix_fmt", "yuv420p",
-        str(output_path)
-    ]
+    # source 프레임 manifest — 렌더 / 설정 / 출력이 그대로면 인코딩 skip
+    manifest = RenderManifest(preview_dir, f"{ep}_{seq}_{shot}_comp_{version}")
+    current = scan_frames(frame_pattern, FrameSet.from_range(first_frame, last_frame), with_hash=fast_hash)
+    settings = {
+        "lut": lut["digest"],
+        "fps": fps,
+        "frames": frame_range,
+        "outputs": formats,
+        "burnin": [burn_info_left, burn_info_right],
+    }
+    diff = manifest.diff(current, settings)
+    primary = "review" if "review" in formats else next(
+        (n for n, o in formats.items() if o.get("kind", "movie") == "movie"), next(iter(formats))
+    )
+    if diff["unchanged"] and not force and all(p.exists() for p in paths.values()):
+        print(f"⏭  {version} up to date ({len(current)} frames unchanged) → {paths[primary]}")
+        return paths[primary]
+    if diff["unchanged"]:
+        reason = "forced" if force else "preview output missing"
+    else:
+        reason = RenderManifest.describe(diff)
+    print(f"🔁 {version}: {reason}")
 
-    print("🎬 Rendering Preview...")
+    ffmpeg_cmd = build_ffmpeg_cmd(
+        seq_path, first_frame, last_frame - first_frame + 1, fps, lut_filter(lut), formats, paths,
+        burnin=_burnin_filter(burn_info_left, burn_info_right, first_frame),
+        threads=threads,
+    )
+
+    print(f"🎬 Rendering Preview ({', '.join(formats)})...")
     print(" ".join(ffmpeg_cmd))
-    subprocess.run(ffmpeg_cmd, check=True)
-    print(f"🎉 Preview Done → {output_path}")
+    timing = run_ffmpeg(
+        ffmpeg_cmd,
+        on_progress=on_progress or print_progress,
+        total_frames=last_frame - first_frame + 1,
+        frame_bytes=[current[k]["size"] for k in sorted(current, key=int)],
+        label=f"{ep}_{seq}_{shot}_comp_{version}",
+        threads=threads,
+    )
+    if on_progress is None:
+        print()
+    print(
+        f"⏱  {timing['wall']:.1f}s  {timing['avg_fps']} fps  cpu {timing['cpu_util']} cores"
+        f"  ({timing['bound'] or '?'}-bound)"
+    )
+    manifest.save(current, settings)
+
+    # 결과 MOV 를 probe 캐시에 등록 (dailies / delivery 에서 재사용)
+    movies = [n for n, o in formats.items() if o.get("kind", "movie") == "movie"]
+    for name in movies:
+        info = probe_media(paths[name], refresh=True)
+        print(f"🎉 {name} → {paths[name]}  ({info.get('frames')}f @ {info.get('fps')})")
+    for name in formats:
+        if name not in movies:
+            print(f"🖼  {name} → {paths[name]}")
 
-    return output_path
+    return paths[primary]
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 5:
-        print("Usage: preview_v008_final.py SHOW EP SEQ SHOT LUT_PATH")
-        sys.exit(1)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SKYFALL comp preview (render EXR → MOV)")
+    parser.add_argument("show")
+    parser.add_argument("ep")
+    parser.add_argument("seq")
+    parser.add_argument("shot")
+    parser.add_argument("lut", nargs="?", help="LUT name or path (default: project.yml preview_lut)")
+    parser.add_argument("--fps", type=float, help="Default: project.yml fps")
+    parser.add_argument("--version", type=int, help="Render version number (default: latest)")
+    parser.add_argument("--allow-gaps", action="store_true", help="Encode up to the first missing frame")
+    parser.add_argument("--outputs", help="Comma separated preview outputs (default: all in preview_format)")
+    parser.add_argument("--force", action="store_true", help="Re-encode even if the render did not change")
+    parser.add_argument("--fast-hash", action="store_true", default=DEFAULT_FAST_HASH,
+                        help="Also compare a sampled hash of each frame (not just size/mtime)")
+    parser.add_argument("--list", action="store_true", help="Only list render versions and frame ranges")
+    args = parser.parse_args()
+
+    if args.list:
+        _render_dir, versions = scan_render_versions(args.show, args.ep, args.seq, args.shot)
+        for number, s in sorted(versions.items()):
+            gaps = s["frames"].gaps()
+            print(f"v{number:03d}  {s['frames']}" + (f"   (missing {gaps})" if gaps else ""))
+        sys.exit(0)
 
-    show, ep, seq, shot, lut = sys.argv[1:6]
-    generate_preview(show, ep, seq, shot, lut)
+    ok = generate_preview(
+        args.show, args.ep, args.seq, args.shot, args.lut,
+        fps=args.fps, version=args.version, allow_gaps=args.allow_gaps,
+        outputs=args.outputs.split(",") if args.outputs else None,
+        force=args.force, fast_hash=args.fast_hash,
+    )
+    sys.exit(0 if ok else 1)